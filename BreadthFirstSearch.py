@@ -5,9 +5,8 @@
 #제목: 그림으로 개념을 이해하는 알고리즘, 
    #  다디트야 바르가바(저), 김도형(역), 한빛미디어 출판사
 
-from collections import deque
-from time import sleep
-checkList = deque()
+from graphStore import GraphStore
+from frontierBFS import FrontierEngine
 
 friend = {} #딕셔너리 선언
 friend['me'] = ['Kim Byung-ji', 'ParkJisung','Lee Eul-yong']
@@ -20,8 +19,6 @@ friend['Gomass'] = []
 friend['Backcom'] = []
 friend['Hong Myung-bo'] = []
 
-checkedList = []
- 
 # 6.망고판매상이 아닌 사람을 따로 분류한다 
 # 7.망고판매상인지 확인하기 전에 망고판매상이 아닌 분류에 있는지 확인한다
 #   7.1밍고판매상이 아닌 분류에 없으면 계속 진행한다
@@ -34,33 +31,27 @@ def checkMangoMen(name):
      return False
 
 
-#무한반복한다.
-# 1. 차트에 친구를 추가한다.
-# 2. 차트(큐)에서 첫번째 사람의 이름을 빼낸다
-# 3. 망고 판매상인지 확인다. 
-# 4. 만약 망고 판매상이라면, 망고판매상임을 알려주고 프로그램을 종료한다.
-#   4.1 망고판매상을 찾았다고 알려주고 그 친구 이름을 출력한다. 
-#   4.2 braek 명령으로 무한반복에서 탈출한다. 
-# 5. 아니면, 1번으로 돌아간다.  
+# 한 단계(level)씩 반복한다. (frontierBFS.FrontierEngine)
+# 1. 지금 단계 사람들의 친구를 한번에 모은다.
+# 2. 이미 확인한 사람은 빼고 (방문 여부는 배열로 O(1) 확인), 새로 만난 사람만 다음 단계로 둔다.
+# 3. 다음 단계 사람들이 망고 판매상인지 한꺼번에 확인한다.
+# 4. 망고 판매상이 있으면, 그 중 첫번째 사람을 알려주고 끝낸다.
+# 5. 아니면, 1번으로 돌아간다.
+# 한 명마다 기다리던 sleep 대신 걸린 시간과 초당 확인한 사람 수를 출력한다.
 
-person = 'me'
-while True:
+store = GraphStore.fromFriendDict(friend)
+with FrontierEngine(store) as engine:
+  found, stats = engine.search('me', store.nameMatches(checkMangoMen))
 
-  checkList += friend[person]
-  person = checkList.popleft()
-   
-  try:
-    num = checkedList.index(person)
-    print(person,'은 이미 확인한 사람입니다.', '그리고', num,'번째에 있습니다.')
-  except:
-    print ('지금',person,'검사','중','입니다' )
-    if checkMangoMen(person) == True:
-      print('망고판매상을 찾았습니다. 그사람이름은',person, '입니다.')
-      break
-    else:
-      
-      checkedList.append(person)
-      sleep (0.75)
+if found >= 0:
+  print('망고판매상을 찾았습니다. 그사람이름은', store.names[found], '입니다.')
+print('단계 수 =', stats['levels'], ', 확인한 사람 수 =', stats['visited'])
+print('걸린 시간 = {:.6f}초, {:.0f} nodes/sec'.format(stats['seconds'], stats['nodesPerSec']))
+
+# 찾은 망고판매상까지 이어지는 친구 관계(최단경로)와 거리 출력
+if stats['path'] is not None:
+  path = [store.names[v] for v in stats['path']]
+  print(' -> '.join(path), '(거리', len(path) - 1, ')')
 
 #outdata = a.get()
 #print(outdata)
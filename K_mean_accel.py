@@ -0,0 +1,110 @@
+# 삼각부등식으로 거리 계산을 건너뛰는 k-means (Hamerly 2010 방식) 입니다.
+# 점마다 두 개의 경계값을 기억합니다.
+#   upper[i] : 지금 중심점까지 거리의 상한
+#   lower[i] : 다른 모든 중심점까지 거리의 하한
+# 중심점이 p 만큼 움직이면 upper 는 p 만큼 늘리고 lower 는 줄이기만 하면 되므로,
+# upper < max(lower, 가장 가까운 다른 중심점과의 거리 / 2) 인 점은 클러스터가 바뀔 수 없어서
+# 거리 계산을 하지 않습니다. createClustersNumpy 와 같은 순서(할당 -> 중심점 갱신)로 돌고,
+# labels 가 바뀌지 않거나 중심점 이동이 tol 이하가 되면 멈춥니다.
+
+import numpy as np
+
+from K_mean_numpy import ASSIGN_ELEMS, blockDistances, updateCentroids, centroidShift
+
+# 경계값은 반올림 오차가 쌓일 수 있으므로, 아주 작은 여유를 두고 건너뛴다.
+BOUND_SLACK = 1e-9
+
+
+# 가장 가까운 중심점 번호, 그 거리, 두번째로 가까운 거리
+def nearestTwo(data, centroids):
+    n = data.shape[0]
+    k = centroids.shape[0]
+    labels = np.empty(n, dtype=np.intp)
+    first = np.empty(n)
+    second = np.full(n, np.inf)
+    step = max(1, ASSIGN_ELEMS // k)
+    for start in range(0, n, step):
+        stop = min(start + step, n)
+        dist = blockDistances(data[start:stop], centroids)
+        rows = np.arange(stop - start)
+        labels[start:stop] = np.argmin(dist, axis=1)
+        first[start:stop] = dist[rows, labels[start:stop]]
+        if k > 1:
+            second[start:stop] = np.partition(dist, 1, axis=1)[:, 1]
+    return labels, first, second
+
+
+# 각 중심점에서 가장 가까운 다른 중심점까지 거리의 절반
+def halfNearestCentroid(centroids):
+    k = centroids.shape[0]
+    if k == 1:
+        return np.full(1, np.inf)
+    cc = blockDistances(centroids, centroids)
+    cc[np.arange(k), np.arange(k)] = np.inf
+    return cc.min(axis=1) / 2
+
+
+# createClustersNumpy 와 같은 결과를 거리 계산을 줄여서 구한다.
+# 반환값: (labels, centroids, stats)
+#   stats['passes']              : 실제로 돈 PASS 수
+#   stats['distanceEvaluations'] : k 개 거리를 모두 계산한 점-중심점 거리 수
+#   stats['boundEvaluations']    : upper 를 줄이려고 계산한 (자기 중심점까지) 거리 수
+#   stats['distanceSkipped']     : 건너뛴 거리 수 (passes * n * k - distanceEvaluations, 항상 0 이상)
+#   stats['converged']           : repeats 전에 수렴해서 멈췄는지
+def createClustersHamerly(k, centroids, data, repeats, verbose=False, tol=0.0, renderer=None):
+    data = np.ascontiguousarray(data, dtype=np.float64)
+    if data.ndim == 1:
+        data = data.reshape(-1, 1)
+    n = data.shape[0]
+    centroids = np.array(centroids, dtype=np.float64).reshape(k, data.shape[1])
+    stats = {'passes': 0, 'distanceEvaluations': 0, 'boundEvaluations': 0, 'distanceSkipped': 0,
+             'converged': False}
+
+    labels = upper = lower = None
+    for aPass in range(repeats):
+        if labels is None:
+            labels, upper, lower = nearestTwo(data, centroids)
+            stats['distanceEvaluations'] += n * k
+            changed = n
+        else:
+            oldLabels = labels.copy()
+            bound = np.maximum(halfNearestCentroid(centroids)[labels], lower)
+            check = np.flatnonzero(upper * (1 + BOUND_SLACK) >= bound)
+
+            # 1) upper 를 실제 거리로 줄여본다
+            diff = data[check] - centroids[labels[check]]
+            upper[check] = np.sqrt((diff * diff).sum(axis=1))
+            stats['boundEvaluations'] += len(check)
+
+            # 2) 그래도 경계를 넘는 점만 k 개 거리를 모두 계산한다
+            check = check[upper[check] * (1 + BOUND_SLACK) >= bound[check]]
+            labels[check], upper[check], lower[check] = nearestTwo(data[check], centroids)
+            stats['distanceEvaluations'] += len(check) * k
+            changed = int((labels != oldLabels).sum())
+
+        stats['passes'] += 1
+        if aPass > 0 and changed == 0:
+            stats['converged'] = True  # 할당이 그대로면 중심점도 그대로다
+            break
+
+        newCentroids = updateCentroids(data, labels, k)
+        shift = centroidShift(centroids, newCentroids)
+        centroids = newCentroids
+        if renderer is not None:
+            renderer.submit(aPass + 1, labels, centroids)
+        if verbose:
+            print("****PASS", aPass + 1, "****", "changed =", changed)
+            print("cluster sizes =", np.bincount(labels, minlength=k).tolist())
+        if shift.max() <= tol:
+            stats['converged'] = True
+            break
+
+        # 중심점 이동만큼 경계값을 느슨하게 만든다
+        upper += shift[labels]
+        if k > 1:
+            order = np.argsort(shift)
+            largest, secondLargest = shift[order[-1]], shift[order[-2]]
+            lower -= np.where(labels == order[-1], secondLargest, largest)
+
+    stats['distanceSkipped'] = stats['passes'] * n * k - stats['distanceEvaluations']
+    return labels, centroids, stats
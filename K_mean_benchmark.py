@@ -0,0 +1,100 @@
+# K-means 엔진 속도 비교 (python 반복문 vs numpy 배열 연산 vs 멀티프로세스)
+# 실행: python K_mean_benchmark.py [반복횟수]
+# 1) exam.txt 에서 두 엔진의 클러스터 결과가 같은지 확인하고
+# 2) 10^4, 10^5, 10^6 개의 점에서 걸린 시간과 속도 향상을 출력한다.
+# 3) 작업 프로세스 수를 1, 2, 4, ... 코어 수까지 늘리며 처리량(점/초)을 출력한다.
+# 4) 수렴할 때까지 돌렸을 때 numpy 와 Hamerly 의 시간과 건너뛴 거리 계산 수를 출력한다.
+
+import os
+import sys
+import random
+from time import perf_counter
+
+import numpy as np
+
+from K_mean_cluster import readFile, createCentroids, createClusters
+from K_mean_numpy import createClustersNumpy, labelsToClusters
+from K_mean_parallel import createClustersParallel
+from K_mean_accel import createClustersHamerly
+
+K = 4
+
+
+def checkExam(repeats):
+    examDict = readFile("exam.txt", verbose=False)
+    centroids = createCentroids(K, examDict)
+    pyClusters, pyCentroids = createClusters(K, [list(c) for c in centroids], examDict, repeats,
+                                             verbose=False)
+    npClusters, npCentroids = createClusters(K, centroids, examDict, repeats, engine='numpy',
+                                             verbose=False)
+    print('exam.txt same clusters:', pyClusters == npClusters)
+    return pyClusters == npClusters
+
+
+def benchmark(n, repeats, seed=0):
+    rng = np.random.default_rng(seed)
+    data = rng.integers(0, 101, size=(n, 2))
+    dataDict = {}
+    for key in range(1, n + 1):
+        dataDict[key] = data[key - 1].tolist()
+    random.seed(seed)
+    centroids = createCentroids(K, dataDict)
+
+    start = perf_counter()
+    pyClusters, pyCentroids = createClusters(K, [list(c) for c in centroids], dataDict, repeats,
+                                             verbose=False)
+    pyTime = perf_counter() - start
+
+    start = perf_counter()
+    labels, npCentroids = createClustersNumpy(K, centroids, data, repeats)
+    npTime = perf_counter() - start
+
+    same = labelsToClusters(list(dataDict.keys()), labels, K) == pyClusters
+    print('n={:>8d}  python {:8.3f}s  numpy {:7.3f}s  speedup {:7.1f}x  same={}'.format(
+        n, pyTime, npTime, pyTime / npTime, same))
+
+
+def benchmarkParallel(n, repeats, k=16, seed=0):
+    rng = np.random.default_rng(seed)
+    data = rng.random((n, 2)) * 100
+    centroids = data[rng.choice(n, size=k, replace=False)]
+    serialLabels, serialCentroids = createClustersNumpy(k, centroids, data, repeats)
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = perf_counter()
+        labels, parCentroids = createClustersParallel(k, centroids, data, repeats, workers)
+        elapsed = perf_counter() - start
+        same = (labels == serialLabels).all() and (parCentroids == serialCentroids).all()
+        print('n={:>8d}  workers {:3d}  {:7.3f}s  {:12.0f} points/s  same={}'.format(
+            n, workers, elapsed, n * repeats / elapsed, same))
+        workers = workers * 2
+
+
+def benchmarkConvergence(n, k=16, seed=0, maxPasses=100):
+    rng = np.random.default_rng(seed)
+    centers = rng.random((k, 2)) * 100
+    data = centers[rng.integers(0, k, size=n)] + rng.normal(0, 5, size=(n, 2))
+    centroids = data[rng.choice(n, size=k, replace=False)]
+
+    start = perf_counter()
+    lloydLabels, lloydCentroids = createClustersNumpy(k, centroids, data, maxPasses, tol=0.0)
+    lloydTime = perf_counter() - start
+
+    start = perf_counter()
+    labels, hamerlyCentroids, stats = createClustersHamerly(k, centroids, data, maxPasses)
+    hamerlyTime = perf_counter() - start
+
+    total = stats['distanceEvaluations'] + stats['distanceSkipped']
+    print('n={:>8d}  numpy {:7.3f}s  hamerly {:7.3f}s  passes {}  skipped {:.1%}  bound checks {}  same={}'.format(
+        n, lloydTime, hamerlyTime, stats['passes'], stats['distanceSkipped'] / total, stats['boundEvaluations'],
+        bool((labels == lloydLabels).all())))
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    checkExam(5)
+    for n in (10 ** 4, 10 ** 5, 10 ** 6):
+        benchmark(n, repeats)
+    benchmarkParallel(2 * 10 ** 6, max(repeats, 5))
+    benchmarkConvergence(10 ** 6)
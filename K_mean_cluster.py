@@ -5,41 +5,24 @@
 import random
 import math
 
-import matplotlib.pyplot as plt
-from time import sleep
-
 # plot Scatter (coding: CSY, BDS)
 # dataSet의 타입dict, Clusters타입은 2차원 리스트
+# 점-중심점 선은 K_mean_plot.drawClusters 에서 LineCollection 하나로 한번에 그린다.
+# 계산 중에 파일로 그림을 남기려면 K_mean_plot.FrameRenderer 를 createClusters 에 넘기세요.
 def plotScatter(dataSet, Clusters, centroids):
-    colors = ['red', 'pink', 'green', 'blue']
-    markers = ['o', 'x', 'x', 'x']
+    import matplotlib.pyplot as plt
+    from K_mean_plot import drawClusters
 
+    data = []
+    labels = []
     clusterNum = 0
     for students in Clusters:  # student is list of student number
-        x = []
-        y = []
-        for student in students: #Add exam data to x,y list  
-            x.append(dataSet[student][0])
-            y.append(dataSet[student][1])
-
-        plt.scatter(x, y, color=colors[clusterNum],
-                    marker=markers[clusterNum],
-                    label='exam')
-
-        plt.scatter(centroids[clusterNum][0],centroids[clusterNum][1], color=colors[clusterNum],
-                    marker='v',
-                    label='exam')
-        
-        
-        #draw line from centroid to data point
-        for i in range(len(x)):
-            pointStudent = [x[i], y[i]]
-            pointCentroid = [centroids[clusterNum][0],centroids[clusterNum][1]]
-            plt.plot([pointCentroid[0],pointStudent[0]],
-                      [pointCentroid[1],pointStudent[1]], color=colors[clusterNum], linestyle="--")
+        for student in students: #Add exam data to data, labels list
+            data.append(dataSet[student][:2])
+            labels.append(clusterNum)
         clusterNum = clusterNum + 1
 
-    plt.grid()
+    drawClusters(plt.gca(), data, labels, [c[:2] for c in centroids])
     plt.show()
     
 
@@ -53,7 +36,8 @@ def euclidD(point1, point2):
     return euclidDistance
 
 
-def readFile(filename):
+# 큰 파일은 K_mean_loader.loadScores / loadScoresCached 를 사용하세요 (줄마다 출력하지 않음).
+def readFile(filename, verbose=True):
     with open(filename, "r") as dataFile:
         dataDict = {}
 
@@ -68,7 +52,8 @@ def readFile(filename):
 
             # 학생별 데이터가 2보다 크거나 같은 경우
             scores = aLine.split()
-            print(scores)
+            if verbose:
+                print(scores)
             scores_int = [int(score) for score in scores]
             dataDict[key] = scores_int
 
@@ -77,26 +62,40 @@ def readFile(filename):
     return dataDict
 
 
-def createCentroids(k, dataDict):
-    centroids = []
-    centroidCount = 0
-    centroidKeys = []
+# method='random' 은 임의의 학생 k 명, 'kmeans++' / 'kmeans||' 는 K_mean_seeding 의 방법으로
+# 초기 중심점을 고른다. seed 를 주면 항상 같은 중심점이 나온다.
+def createCentroids(k, dataDict, method='random', seed=None):
+    if method != 'random':
+        import numpy as np
+        from K_mean_numpy import toArray
+        from K_mean_seeding import initCentroids
+
+        keys, data = toArray(dataDict)
+        return initCentroids(data, k, np.random.default_rng(seed), method).tolist()
 
     # 1에서 dataDict 의 수만큼, 즉 1번학생에서 n번 학생중에서
-    # 임의로(무작위) 초기 중심점 centroids 을 만든다.
-    while centroidCount < k:
-        rKey = random.randint(1, len(dataDict))
-        if rKey not in centroidKeys:  # 이미 존재하는 학번이 아니라면 중심중 추가
-            centroids.append(dataDict[rKey])
-            centroidKeys.append(rKey)
-            centroidCount = centroidCount + 1
+    # 임의로(무작위) 초기 중심점 centroids 을 만든다. (같은 학번은 두번 뽑히지 않음)
+    rng = random if seed is None else random.Random(seed)
+    centroidKeys = rng.sample(range(1, len(dataDict) + 1), k)
+    centroids = [dataDict[rKey] for rKey in centroidKeys]
 
     return centroids
 
 
-def createClusters(k, centroids, dataDict, repeats):
+# engine='python' 은 원래의 반복문 방식, engine='numpy' 는 K_mean_numpy 의 배열 연산 방식,
+# engine='parallel' 은 K_mean_parallel 의 여러 프로세스 방식 (결과는 numpy 와 같음),
+# engine='hamerly' 는 K_mean_accel 의 삼각부등식으로 거리 계산을 건너뛰는 방식 (수렴하면 멈춤)
+# verbose=False 면 PASS/CLUSTER 출력을 하지 않는다.
+# renderer 에 K_mean_plot.FrameRenderer 를 주면 PASS 마다 그림을 (다른 프로세스에서) 파일로 저장한다.
+def createClusters(k, centroids, dataDict, repeats, engine='python', verbose=True, renderer=None):
+    if engine in ('numpy', 'parallel', 'hamerly'):
+        return createClustersArray(k, centroids, dataDict, repeats, verbose, engine, renderer)
+    if engine != 'python':
+        raise ValueError("unknown engine: " + str(engine))
+
     for aPass in range(repeats):
-        print("****PASS", aPass + 1, "****")
+        if verbose:
+            print("****PASS", aPass + 1, "****")
         clusters = []  # 텅빈 리스트 정의
         for i in range(k):  # 리스트터안에 텅빈 리스트 만들기
             clusters.append([])  # 리스트에 텅빈 리스트 추가
@@ -142,32 +141,92 @@ def createClusters(k, centroids, dataDict, repeats):
             centroids[clusterIndex] = sums  # 산출된 평균값을 새로운 중심점값으로 바꾼다.
         # ----------------------------------------------------------------------------#
 
+        #그래프 그리기 (renderer 가 없으면 아무것도 하지 않음)
+        if renderer is not None:
+            renderer.submitClusters(aPass + 1, clusters, centroids)
+
         # --------데이터 표시 --------------------------#
-        # clusters 리스트에서 원소하나를 빼서 c에 저장함.
-        for c in clusters:
-            print("CLUSTER")
-            # c 에 존재하는 학생번호를 가져와 프린트 하기
-            for key in c:
-                print(dataDict[key], end=" ")
-            print()
+        if verbose:
+            # clusters 리스트에서 원소하나를 빼서 c에 저장함.
+            for c in clusters:
+                print("CLUSTER")
+                # c 에 존재하는 학생번호를 가져와 프린트 하기
+                for key in c:
+                    print(dataDict[key], end=" ")
+                print()
         # --------------------------------------------#
-        
-        #그래프 그리기 
-        keysList = list(dataDict.keys())
-        anyKey = keysList[0]
-        if len(dataDict[anyKey]) >= 2: #데이터 차원이 2보다 큰지 확인후 2차원 그래프 그리기 
-           plotScatter(dataDict, clusters, centroids)
-           
-        sleep(2) #2초 기다리기
 
     return clusters, centroids
 
 
-def clusterAnalysis(dataFile):
+# numpy 엔진으로 계산하고 결과를 원래 형태(학번 리스트의 리스트, 중심점 리스트)로 돌려준다.
+def createClustersArray(k, centroids, dataDict, repeats, verbose=True, engine='numpy',
+                        renderer=None):
+    from K_mean_numpy import toArray, createClustersNumpy, labelsToClusters
+
+    keys, data = toArray(dataDict)
+    if engine == 'parallel':
+        from K_mean_parallel import createClustersParallel
+        labels, centroidArray = createClustersParallel(k, centroids, data, repeats,
+                                                       verbose=verbose, renderer=renderer)
+    elif engine == 'hamerly':
+        from K_mean_accel import createClustersHamerly
+        labels, centroidArray, stats = createClustersHamerly(k, centroids, data, repeats, verbose,
+                                                             renderer=renderer)
+        if verbose:
+            print('stats =', stats)
+    else:
+        labels, centroidArray = createClustersNumpy(k, centroids, data, repeats, verbose,
+                                                    renderer=renderer)
+    return labelsToClusters(keys, labels, k), centroidArray.tolist()
+
+
+# 메모리에 다 올릴 수 없는 파일용 mini-batch 버전. 파일에서 batchSize 행씩 읽으며
+# 중심점을 갱신한다. centroids 에 기존 examCentroids 를 주면 거기서 이어서 학습한다.
+# 이때 counts 에 각 클러스터의 학생 수 ([len(c) for c in examClusters]) 를 같이 줘야 한다.
+# 반환값: 학습된 K_mean_minibatch.MiniBatchKMeans (getCentroids(), partialFit(), iterLabels())
+def createClustersStream(k, centroids, dataFile, passes=1, batchSize=65536, counts=None):
+    from K_mean_minibatch import MiniBatchKMeans
+
+    model = MiniBatchKMeans(k, centroids, counts)
+    return model.fitFile(dataFile, passes, batchSize)
+
+
+# 큰 파일용: readFile 대신 K_mean_loader 로 읽어서 배열 그대로 numpy 엔진에 넘긴다.
+# 반환값: (labels, centroids) 배열
+# restarts > 1 이면 K_mean_seeding.bestOfRestarts 로 여러 번 (여러 프로세스에서) 돌려서
+# inertia 가 가장 작은 결과를 고른다. seed 를 주면 결과가 재현된다.
+def clusterAnalysisArray(dataFile, k=4, repeats=5, restarts=1, seed=None):
+    import numpy as np
+    from K_mean_loader import loadScoresCached
+    from K_mean_numpy import createClustersNumpy
+    from K_mean_seeding import kmeansPlusPlus, bestOfRestarts
+
+    examData = loadScoresCached(dataFile)
+    if restarts > 1:
+        labels, centroids, bestInertia = bestOfRestarts(k, examData, restarts, repeats, seed)
+        print('inertia =', bestInertia)
+        return labels, centroids
+    examCentroids = kmeansPlusPlus(examData, k, np.random.default_rng(seed))
+    return createClustersNumpy(k, examCentroids, examData, repeats, verbose=True)
+
+
+# plotDir 를 주면 PASS 마다 그림을 plotDir/pass_001.png ... 로 저장한다.
+def clusterAnalysis(dataFile, engine='python', plotDir=None):
+    if engine == 'array':
+        return clusterAnalysisArray(dataFile)
+
     examDict = readFile(dataFile)
     print('examDict =', examDict)
     examCentroids = createCentroids(4, examDict)
-    examClusters, examCentroids = createClusters(4, examCentroids, examDict, 5)
+    renderer = None
+    if plotDir is not None:
+        from K_mean_plot import FrameRenderer
+        renderer = FrameRenderer(examDict, plotDir)
+    examClusters, examCentroids = createClusters(4, examCentroids, examDict, 5, engine,
+                                                 renderer=renderer)
+    if renderer is not None:
+        renderer.close()
 
     #keysList = list(examDict.keys())
     #anyKey = keysList[0]
@@ -175,4 +234,5 @@ def clusterAnalysis(dataFile):
     #    plotScatter(examDict, examClusters, examCentroids)
 
 
-clusterAnalysis("exam.txt")
+if __name__ == "__main__":
+    clusterAnalysis("exam.txt")
@@ -0,0 +1,212 @@
+# exam.txt 처럼 공백으로 구분된 점수 파일을 큰 덩어리(chunk) 단위로 읽어서
+# 바로 (n, d) 크기의 numpy 배열로 만드는 로더입니다.
+# readFile 은 한줄씩 읽고 학생마다 print 하며 파이썬 int 리스트의 dict 를 만들지만,
+# 여기서는 줄마다 출력하지 않고 값 하나당 dtype 크기(int32 면 4바이트)만 사용합니다.
+#
+#   loadScores(파일)          -> 전체를 메모리 배열로
+#   iterScoreBlocks(파일, n)   -> n 행씩 잘라서 차례로 돌려주는 iterator
+#   loadScoresCached(파일)     -> 바이너리 캐시 파일을 memmap 으로 (원본이 바뀌지 않았으면 재사용)
+
+import os
+import json
+
+import numpy as np
+
+CHUNK_BYTES = 1 << 24  # 한번에 읽는 바이트 수 (16MB)
+FIELD_SLICE_BYTES = 1 << 20  # 줄마다 값의 개수를 셀 때 한번에 보는 바이트 수 (1MB)
+
+
+# 파일을 CHUNK_BYTES 씩 읽되 줄 중간에서 자르지 않고 줄 단위로 끊어서 돌려준다.
+def _readChunks(filename, chunkBytes=CHUNK_BYTES):
+    with open(filename, "rb") as dataFile:
+        rest = b""
+        while True:
+            chunk = dataFile.read(chunkBytes)
+            if not chunk:
+                break
+            chunk = rest + chunk
+            cut = chunk.rfind(b"\n") + 1
+            rest = chunk[cut:]
+            if cut:
+                yield chunk[:cut]
+        if rest.strip():
+            yield rest
+
+
+# 첫번째 (빈 줄이 아닌) 줄의 값 개수 = 데이터 차원
+def countColumns(filename):
+    with open(filename, "rb") as dataFile:
+        for aLine in dataFile:
+            if aLine.split():
+                return len(aLine.split())
+    return 0
+
+
+# 줄 수의 상한 (빈 줄도 센다). 배열을 미리 한번에 잡아두기 위해 사용
+def countLines(filename, chunkBytes=CHUNK_BYTES):
+    lines = 0
+    last = b"\n"
+    with open(filename, "rb") as dataFile:
+        while True:
+            chunk = dataFile.read(chunkBytes)
+            if not chunk:
+                break
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    if last != b"\n":
+        lines += 1
+    return lines
+
+
+# 줄로 끝나는 bytes 조각에서 줄마다 값(공백으로 나뉜 토큰)의 개수. 빈 줄은 0
+def _sliceFieldCounts(piece):
+    raw = np.frombuffer(piece, dtype=np.uint8)
+    blank = raw <= ord(" ")  # 공백, 탭, \r, \n (그 밖의 제어 문자도 공백으로 본다)
+    tokenStart = ~blank
+    tokenStart[1:] &= blank[:-1]
+    del blank
+    # 줄 i 는 [starts[i], starts[i + 1]) (줄바꿈 문자를 포함하므로 빈 구간이 없다)
+    starts = np.flatnonzero(raw == ord("\n"))
+    starts += 1
+    starts = np.concatenate(([0], starts[starts < len(raw)]))
+    return np.add.reduceat(tokenStart, starts, dtype=np.int32)
+
+
+# chunk 에서 줄마다 값의 개수. 임시 배열이 chunk 크기에 비례하지 않도록
+# 줄 경계에서 자른 FIELD_SLICE_BYTES 정도의 조각마다 센다 (결과는 줄당 4 바이트).
+def _fieldCounts(chunk):
+    view = memoryview(chunk)
+    parts = []
+    start = 0
+    while start < len(chunk):
+        stop = start + FIELD_SLICE_BYTES
+        if stop >= len(chunk):
+            stop = len(chunk)
+        else:
+            cut = chunk.rfind(b"\n", start, stop)
+            if cut < 0:  # 조각보다 긴 줄은 그 줄 끝까지
+                cut = chunk.find(b"\n", stop)
+            stop = len(chunk) if cut < 0 else cut + 1
+        parts.append(_sliceFieldCounts(view[start:stop]))
+        start = stop
+    return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int32)
+
+
+# chunk 하나를 (rows, columns) 배열로 변환한다.
+# 줄마다 값의 개수를 확인해서 "1 2\n3 4 5\n6" 처럼 들쭉날쭉한 줄이 섞여 있으면 ValueError
+def _parseChunk(chunk, columns, dtype):
+    counts = _fieldCounts(chunk)
+    bad = np.flatnonzero((counts != 0) & (counts != columns))
+    if len(bad):
+        raise ValueError("every row must have {} values (chunk line {} has {})".format(
+            columns, bad[0] + 1, counts[bad[0]]))
+    values = np.fromstring(chunk, dtype=dtype, sep=" ")
+    if values.size != np.count_nonzero(counts) * columns:
+        raise ValueError("malformed value in score file")
+    return values.reshape(-1, columns)
+
+
+def _parsedChunks(filename, columns, dtype, chunkBytes=CHUNK_BYTES):
+    for chunk in _readChunks(filename, chunkBytes):
+        block = _parseChunk(chunk, columns, dtype)
+        if len(block):
+            yield block
+
+
+# 점수 파일 전체를 (n, d) 배열로 읽는다.
+# 먼저 줄 수를 세서 결과 배열을 한번만 만들고, chunk 단위로 파싱해서 채운다.
+def loadScores(filename, dtype=np.int32, chunkBytes=CHUNK_BYTES):
+    columns = countColumns(filename)
+    out = np.empty((countLines(filename, chunkBytes), columns), dtype=dtype)
+    rows = 0
+    for block in _parsedChunks(filename, columns, dtype, chunkBytes):
+        out[rows:rows + len(block)] = block
+        rows += len(block)
+    return out[:rows]
+
+
+# blockRows 행씩 (마지막은 더 적을 수 있음) 배열을 차례로 돌려준다.
+# 캐시가 유효하면 캐시(memmap)에서 잘라서 준다. 메모리는 blockRows 와 chunk 크기만큼만 쓴다.
+def iterScoreBlocks(filename, blockRows=65536, dtype=np.int32, chunkBytes=CHUNK_BYTES):
+    cached = _openCache(filename, cachePath(filename), dtype)
+    if cached is not None:
+        for start in range(0, len(cached), blockRows):
+            yield np.array(cached[start:start + blockRows])
+        return
+
+    columns = countColumns(filename)
+    pending = []
+    pendingRows = 0
+    for block in _parsedChunks(filename, columns, dtype, chunkBytes):
+        pending.append(block)
+        pendingRows += len(block)
+        if pendingRows < blockRows:
+            continue
+        merged = np.concatenate(pending)
+        start = 0
+        while len(merged) - start >= blockRows:
+            yield merged[start:start + blockRows]
+            start += blockRows
+        pending = [merged[start:]]
+        pendingRows = len(merged) - start
+    if pendingRows:
+        yield np.concatenate(pending)
+
+
+# ---------------- 바이너리 캐시 -----------------------------------------------#
+# exam.txt -> exam.txt.scores (원시 바이너리) + exam.txt.scores.json (모양, dtype, 원본 정보)
+
+def cachePath(filename):
+    return filename + ".scores"
+
+
+def _sourceInfo(filename):
+    stat = os.stat(filename)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _openCache(filename, cacheFile, dtype):
+    try:
+        with open(cacheFile + ".json", "r") as infoFile:
+            info = json.load(infoFile)
+    except (OSError, ValueError):
+        return None
+    if info.get("source") != _sourceInfo(filename) or info.get("dtype") != np.dtype(dtype).str:
+        return None
+    shape = tuple(info["shape"])
+    if shape[0] == 0:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(cacheFile, dtype=dtype, mode="r", shape=shape)
+
+
+# 캐시 파일이 있고 원본 파일(크기, 수정시각)이 그대로면 캐시를 memmap 으로 연다.
+# 아니면 원본을 chunk 단위로 파싱하면서 바로 캐시 파일에 써서 만든다.
+def loadScoresCached(filename, cacheFile=None, dtype=np.int32, chunkBytes=CHUNK_BYTES):
+    if cacheFile is None:
+        cacheFile = cachePath(filename)
+    cached = _openCache(filename, cacheFile, dtype)
+    if cached is not None:
+        return cached
+
+    # 두 파일 모두 임시 이름에 다 쓴 다음 os.replace 로 바꾼다. .json 을 마지막에 바꾸므로
+    # 도중에 죽어도 새 .json 옆에 덜 쓴 .scores 가 남지 않는다 (옛 .json 은 원본 정보가 달라 무시됨)
+    source = _sourceInfo(filename)
+    columns = countColumns(filename)
+    rows = 0
+    binTemp = cacheFile + ".tmp"
+    infoTemp = cacheFile + ".json.tmp"
+    try:
+        with open(binTemp, "wb") as binFile:
+            for block in _parsedChunks(filename, columns, dtype, chunkBytes):
+                block.tofile(binFile)
+                rows += len(block)
+        info = {"shape": [rows, columns], "dtype": np.dtype(dtype).str, "source": source}
+        with open(infoTemp, "w") as infoFile:
+            json.dump(info, infoFile)
+        os.replace(binTemp, cacheFile)
+        os.replace(infoTemp, cacheFile + ".json")
+    finally:
+        for temp in (binTemp, infoTemp):
+            if os.path.exists(temp):
+                os.remove(temp)
+    return _openCache(filename, cacheFile, dtype)
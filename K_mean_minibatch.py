@@ -0,0 +1,81 @@
+# 메모리보다 큰 점수 파일을 위한 mini-batch(스트리밍) k-means 입니다.
+# createClusters 는 dataDict 전체를 메모리에 두고 매 PASS 마다 전부 다시 보지만,
+# 여기서는 파일에서 블록(batch) 단위로 읽어 오면서 중심점을 조금씩 갱신합니다.
+# 중심점마다 지금까지 포함된 학생 수(counts)를 기억하고, 새 학생이 들어오면
+# 중심점을 그 학생들까지 포함한 평균으로 옮깁니다 (학습률 1/counts, Sculley 2010).
+# 메모리는 batch 크기와 k 에만 비례하고 전체 행 수와는 관계가 없습니다.
+
+import numpy as np
+
+from K_mean_numpy import assignLabels, blockSums
+from K_mean_loader import iterScoreBlocks
+from K_mean_seeding import kmeansPlusPlus
+
+
+class MiniBatchKMeans(object):
+
+    # centroids 를 주면 (예: clusterAnalysis 의 examCentroids) 그 중심점에서 이어서 학습한다.
+    # 이때 counts (각 중심점에 이미 포함된 학생 수, 예: [len(c) for c in examClusters]) 도 꼭 줘야 한다.
+    # counts 가 없으면 이전 중심점의 무게를 알 수 없어서 첫 batch 가 중심점을 덮어쓰게 되므로 ValueError.
+    def __init__(self, k, centroids=None, counts=None, seed=None):
+        self.k = k
+        self.rng = np.random.default_rng(seed)
+        self.centroids = None
+        self.counts = None
+        self.rowsSeen = 0
+        if centroids is not None:
+            if counts is None:
+                raise ValueError("counts (rows already in each centroid) are required with centroids")
+            self.centroids = np.array(centroids, dtype=np.float64).reshape(k, -1)
+            self.counts = np.array(counts, dtype=np.float64).reshape(k)
+        elif counts is not None:
+            raise ValueError("counts given without centroids")
+
+    # 첫번째 batch 에서 k-means++ 로 초기 중심점을 고른다
+    def _initCentroids(self, block):
+        if len(block) < self.k:
+            raise ValueError("first batch needs at least k rows")
+        self.centroids = kmeansPlusPlus(block, self.k, self.rng)
+        self.counts = np.zeros(self.k)
+
+    # 새 학생 데이터(rows, d)를 현재 중심점에 반영한다. 반환값: 이 batch 의 labels
+    def partialFit(self, block):
+        block = np.ascontiguousarray(block, dtype=np.float64)
+        if block.ndim == 1:
+            block = block.reshape(-1, 1)
+        if len(block) == 0:
+            return np.empty(0, dtype=np.intp)
+        if self.centroids is None:
+            self._initCentroids(block)
+
+        labels, minDist = assignLabels(block, self.centroids)
+        sums, batchCounts = blockSums(block, labels, self.k, 0, len(block))
+        self.counts += batchCounts
+        moved = batchCounts > 0
+        # c <- c + (sum(x) - m*c) / counts  (= 지금까지 포함된 모든 점의 평균)
+        self.centroids[moved] += (sums[moved] - batchCounts[moved, None] * self.centroids[moved]) \
+            / self.counts[moved, None]
+        self.rowsSeen += len(block)
+        return labels
+
+    def predict(self, block):
+        block = np.ascontiguousarray(block, dtype=np.float64)
+        if block.ndim == 1:
+            block = block.reshape(-1, 1)
+        labels, minDist = assignLabels(block, self.centroids)
+        return labels
+
+    # 점수 파일을 batchSize 행씩 읽어서 passes 번 학습한다.
+    def fitFile(self, filename, passes=1, batchSize=65536):
+        for aPass in range(passes):
+            for block in iterScoreBlocks(filename, batchSize):
+                self.partialFit(block)
+        return self
+
+    # 파일의 모든 행에 대한 labels 를 batch 단위로 돌려준다 (전체를 메모리에 만들지 않음).
+    def iterLabels(self, filename, batchSize=65536):
+        for block in iterScoreBlocks(filename, batchSize):
+            yield self.predict(block)
+
+    def getCentroids(self):
+        return self.centroids.tolist()
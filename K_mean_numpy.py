@@ -0,0 +1,130 @@
+# K_mean_cluster.py 의 createClusters 를 numpy 배열 연산으로 바꾼 엔진입니다.
+# 학생 데이터를 (n, d) 크기의 연속된 float 배열 하나로 두고,
+# 할당 단계(거리 계산 + argmin)와 중심점 갱신을 블록 단위로 한꺼번에 계산합니다.
+# 같은 초기 중심점이면 K_mean_cluster.createClusters 와 같은 클러스터 결과가 나옵니다.
+
+import numpy as np
+
+# 중심점 합계를 구할 때 쓰는 고정 블록 크기(행 수).
+# 블록별 부분합을 항상 같은 순서로 더하므로, 병렬로 나눠 계산해도 결과가 비트 단위로 같다.
+BLOCK_ROWS = 65536
+
+# 할당 단계에서 한번에 만드는 거리행렬(rows x k)의 최대 원소 수
+ASSIGN_ELEMS = 1 << 22
+
+
+# dataDict(학번: 점수리스트)를 (학번리스트, (n, d) float64 배열)로 바꾼다.
+def toArray(dataDict):
+    keys = list(dataDict.keys())
+    data = np.array([dataDict[aKey] for aKey in keys], dtype=np.float64)
+    if data.ndim == 1:  # 학생별 데이터가 1개인 경우
+        data = data.reshape(-1, 1)
+    return keys, np.ascontiguousarray(data)
+
+
+# labels 배열을 원래 코드의 clusters(학번 리스트의 리스트) 형태로 바꾼다.
+def labelsToClusters(keys, labels, k):
+    clusters = []
+    for clusterIndex in range(k):
+        clusters.append([keys[i] for i in np.flatnonzero(labels == clusterIndex)])
+    return clusters
+
+
+# block 의 각 행과 모든 중심점 사이의 거리 (rows, k).
+# euclidD 와 같은 순서(차원 0, 1, ...)로 제곱차를 누적한 다음 sqrt 한다.
+def blockDistances(block, centroids):
+    total = np.zeros((block.shape[0], centroids.shape[0]))
+    for ind in range(block.shape[1]):
+        diff = block[:, ind, None] - centroids[None, :, ind]
+        total += diff * diff
+    return np.sqrt(total)
+
+
+# 할당 단계: 모든 점에 대해 가장 가까운 중심점 번호와 그 거리를 구한다.
+# 거리가 같으면 원래 코드의 distances.index(min) 처럼 앞 번호가 선택된다.
+def assignLabels(data, centroids, labels=None, minDist=None):
+    n = data.shape[0]
+    k = centroids.shape[0]
+    if labels is None:
+        labels = np.empty(n, dtype=np.intp)
+    if minDist is None:
+        minDist = np.empty(n)
+    step = max(1, ASSIGN_ELEMS // k)
+    for start in range(0, n, step):
+        stop = min(start + step, n)
+        dist = blockDistances(data[start:stop], centroids)
+        labels[start:stop] = np.argmin(dist, axis=1)
+        minDist[start:stop] = dist[np.arange(stop - start), labels[start:stop]]
+    return labels, minDist
+
+
+# [start, stop) 구간의 클러스터별 합계(k, d)와 개수(k)
+def blockSums(data, labels, k, start, stop):
+    part = labels[start:stop]
+    counts = np.bincount(part, minlength=k)
+    sums = np.empty((k, data.shape[1]))
+    for ind in range(data.shape[1]):
+        sums[:, ind] = np.bincount(part, weights=data[start:stop, ind], minlength=k)
+    return sums, counts
+
+
+# [start, stop) 구간을 BLOCK_ROWS 경계에 맞춰 나눈 블록별 부분합 리스트
+def partialSums(data, labels, k, start=0, stop=None):
+    if stop is None:
+        stop = data.shape[0]
+    partials = []
+    for blockStart in range(start, stop, BLOCK_ROWS):
+        partials.append(blockSums(data, labels, k, blockStart, min(blockStart + BLOCK_ROWS, stop)))
+    return partials
+
+
+# 블록별 부분합을 순서대로 더해서 새 중심점을 만든다.
+# 원래 코드처럼 학생이 없는 클러스터의 중심점은 0 벡터가 된다.
+def reduceCentroids(partials, k, dimensions):
+    sums = np.zeros((k, dimensions))
+    counts = np.zeros(k, dtype=np.int64)
+    for blockSum, blockCount in partials:
+        sums += blockSum
+        counts += blockCount
+    nonEmpty = counts > 0
+    sums[nonEmpty] = sums[nonEmpty] / counts[nonEmpty, None]
+    return sums, counts
+
+
+def updateCentroids(data, labels, k):
+    centroids, counts = reduceCentroids(partialSums(data, labels, k), k, data.shape[1])
+    return centroids
+
+
+# 중심점이 이동한 거리 (k,)
+def centroidShift(oldCentroids, newCentroids):
+    return np.sqrt(((newCentroids - oldCentroids) ** 2).sum(axis=1))
+
+
+# createClusters 의 numpy 버전. data 는 (n, d) 배열, centroids 는 (k, d) 배열 또는 리스트.
+# tol 을 주면 수렴 모드: labels 가 더 이상 바뀌지 않거나 모든 중심점의 이동거리가
+# tol 이하가 되면 repeats 전에 멈춘다. renderer 는 K_mean_plot.FrameRenderer (없으면 그리지 않음)
+# 반환값: (labels, centroids)
+def createClustersNumpy(k, centroids, data, repeats, verbose=False, tol=None, renderer=None):
+    data = np.ascontiguousarray(data, dtype=np.float64)
+    centroids = np.array(centroids, dtype=np.float64).reshape(k, data.shape[1])
+    labels = np.empty(data.shape[0], dtype=np.intp)
+    minDist = np.empty(data.shape[0])
+    oldLabels = None
+    for aPass in range(repeats):
+        assignLabels(data, centroids, labels, minDist)
+        if tol is not None and oldLabels is not None and (labels == oldLabels).all():
+            break  # 할당이 그대로면 중심점도 그대로다
+        newCentroids = updateCentroids(data, labels, k)
+        shift = centroidShift(centroids, newCentroids)
+        centroids = newCentroids
+        if renderer is not None:
+            renderer.submit(aPass + 1, labels, centroids)
+        if verbose:
+            print("****PASS", aPass + 1, "****")
+            print("cluster sizes =", np.bincount(labels, minlength=k).tolist())
+        if tol is not None:
+            if shift.max() <= tol:
+                break
+            oldLabels = labels.copy()
+    return labels, centroids
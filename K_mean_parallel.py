@@ -0,0 +1,78 @@
+# 여러 CPU 코어를 사용하는 k-means 입니다.
+# 데이터를 공유 메모리(multiprocessing.RawArray)에 한번만 복사해 두고, 작업 프로세스마다
+# 연속된 구간(shard)을 맡깁니다. 매 PASS 마다 프로세스에 보내는 것은 중심점(k x d)뿐이고,
+# 한 PASS 는 두 단계입니다.
+#   1. 할당: 행을 작업 프로세스 수만큼 고르게 나눈 구간마다 labels 를 계산해 공유 배열에 직접 쓴다.
+#   2. 부분합: K_mean_numpy.BLOCK_ROWS 경계에 맞춘 구간마다 클러스터별 부분합/개수만 돌려준다.
+# 부모 프로세스는 부분합을 블록 순서대로 더해 새 중심점을 만듭니다. 그래서 거리 계산은 행 수가 적어도
+# 모든 프로세스가 나눠 하고, 작업 프로세스 수와 관계없이 createClustersNumpy 와 labels/중심점이 정확히 같습니다.
+
+import os
+
+import numpy as np
+
+from K_mean_numpy import BLOCK_ROWS, assignLabels, partialSums, reduceCentroids
+from sharedPool import shared, sharedArray, sharedPool
+
+
+# 작업 프로세스: [start, stop) 구간 할당
+def _shardAssign(args):
+    start, stop, centroids = args
+    shardLabels, minDist = assignLabels(shared['data'][start:stop], centroids)
+    shared['labels'][start:stop] = shardLabels
+
+
+# 작업 프로세스: [start, stop) 구간의 블록별 부분합
+def _shardSums(args):
+    start, stop, k = args
+    return partialSums(shared['data'], shared['labels'], k, start, stop)
+
+
+# n 행을 workers 개의 연속된 구간으로 고르게 나눈다 (할당용).
+def makeShards(n, workers):
+    workers = max(1, min(workers, n))
+    return [(n * w // workers, n * (w + 1) // workers) for w in range(workers)]
+
+
+# 전체 블록을 workers 개의 연속된 구간으로 나눈다. 경계는 항상 BLOCK_ROWS 의 배수 (부분합용).
+def makeBlockShards(n, workers):
+    blocks = (n + BLOCK_ROWS - 1) // BLOCK_ROWS
+    workers = max(1, min(workers, blocks))
+    shards = []
+    for w in range(workers):
+        first = blocks * w // workers
+        last = blocks * (w + 1) // workers
+        shards.append((first * BLOCK_ROWS, min(last * BLOCK_ROWS, n)))
+    return shards
+
+
+# createClustersNumpy 와 같은 인터페이스. workers 가 None 이면 CPU 코어 수만큼 사용.
+# 반환값: (labels, centroids)
+def createClustersParallel(k, centroids, data, repeats, workers=None, verbose=False, renderer=None):
+    data = np.asarray(data, dtype=np.float64)
+    if data.ndim == 1:
+        data = data.reshape(-1, 1)
+    n, dimensions = data.shape
+    centroids = np.array(centroids, dtype=np.float64).reshape(k, dimensions)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    dataRaw, sharedData = sharedArray('d', np.float64, (n, dimensions))
+    labelsRaw, labels = sharedArray('q', np.int64, (n,))
+    sharedData[:] = data
+
+    shards = makeShards(n, workers)
+    blockShards = makeBlockShards(n, workers)
+    with sharedPool(len(shards), {'data': (dataRaw, sharedData), 'labels': (labelsRaw, labels)}) as pool:
+        for aPass in range(repeats):
+            pool.map(_shardAssign, [(start, stop, centroids) for start, stop in shards])
+            results = pool.map(_shardSums, [(start, stop, k) for start, stop in blockShards])
+            partials = [part for shardPartials in results for part in shardPartials]
+            centroids, counts = reduceCentroids(partials, k, dimensions)
+            if renderer is not None:
+                renderer.submit(aPass + 1, labels, centroids)
+            if verbose:
+                print("****PASS", aPass + 1, "****")
+                print("cluster sizes =", counts.tolist())
+
+    return labels.astype(np.intp), centroids
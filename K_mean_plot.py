@@ -0,0 +1,127 @@
+# k-means 결과 그리기 (화면 없이 이미지 파일로 저장)
+# plotScatter 는 점-중심점 선을 하나씩 plt.plot 으로 그리고 plt.show() + sleep(2) 로 기다리기 때문에
+# 서버에서는 멈추거나 계산보다 오래 걸립니다. 여기서는
+#   - 모든 점-중심점 선을 LineCollection 하나로 한번에 그리고
+#   - 그리기는 별도의 프로세스(FrameRenderer)에서 하며, 계산 쪽은 labels/중심점만 넘기고 바로 돌아갑니다.
+#   - 그리기가 밀리면 (대기열이 가득 차면) 그 PASS 그림은 건너뜁니다 (dropped 로 셉니다).
+#   - 그리기 프로세스에서 난 오류는 close() 에서 다시 raise 됩니다.
+# 그리기를 하지 않을 때는 renderer=None 으로 두면 아무 일도 하지 않습니다.
+
+import os
+import queue
+import traceback
+from multiprocessing import Process, Queue
+
+import numpy as np
+
+COLORS = ['red', 'pink', 'green', 'blue']
+MARKERS = ['o', 'x', 'x', 'x']
+
+
+# ax 에 클러스터별 점, 중심점, 점-중심점 선을 그린다. data 는 (n, 2 이상) 배열
+def drawClusters(ax, data, labels, centroids):
+    from matplotlib.collections import LineCollection
+
+    data = np.asarray(data, dtype=np.float64)
+    centroids = np.asarray(centroids, dtype=np.float64)
+    labels = np.asarray(labels)
+    colors = [COLORS[i % len(COLORS)] for i in range(len(centroids))]
+
+    # 선 n 개를 (n, 2, 2) 배열 하나로 만들어서 한번에 그린다
+    segments = np.stack([centroids[labels, :2], data[:, :2]], axis=1)
+    ax.add_collection(LineCollection(segments, colors=[colors[i] for i in labels],
+                                     linestyles='--', linewidths=0.5))
+    for clusterNum in range(len(centroids)):
+        points = data[labels == clusterNum]
+        ax.scatter(points[:, 0], points[:, 1], color=colors[clusterNum],
+                   marker=MARKERS[clusterNum % len(MARKERS)], label='exam')
+        ax.scatter(centroids[clusterNum][0], centroids[clusterNum][1], color=colors[clusterNum],
+                   marker='v', label='exam')
+    ax.grid()
+
+
+# 그리기 프로세스: 대기열에서 (PASS 번호, labels, 중심점)을 꺼내 PNG 파일로 저장한다.
+# 오류가 나면 traceback 문자열을 errors 로 보내고 끝난다 (close() 에서 다시 raise).
+def _renderLoop(data, outDir, frames, errors):
+    try:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        while True:
+            frame = frames.get()
+            if frame is None:
+                break
+            aPass, labels, centroids = frame
+            fig = Figure(figsize=(6, 6))
+            FigureCanvasAgg(fig)
+            drawClusters(fig.add_subplot(1, 1, 1), data, labels, centroids)
+            fig.savefig(os.path.join(outDir, 'pass_{:03d}.png'.format(aPass)))
+    except BaseException:
+        errors.put(traceback.format_exc())
+        raise
+
+
+class FrameRenderer(object):
+
+    # data 는 dataDict 또는 (n, d) 배열. 그리기 프로세스에는 시작할 때 한번만 보낸다.
+    def __init__(self, data, outDir, maxPending=16):
+        if isinstance(data, dict):
+            from K_mean_numpy import toArray
+            keys, data = toArray(data)
+            self.rowOfKey = {aKey: row for row, aKey in enumerate(keys)}
+        else:
+            self.rowOfKey = None
+        if np.ndim(data) != 2 or np.shape(data)[1] < 2:
+            raise ValueError("FrameRenderer needs data with at least 2 dimensions")
+        self.n = len(data)
+        self.dropped = 0
+        os.makedirs(outDir, exist_ok=True)
+        self.frames = Queue(maxPending)
+        self.errors = Queue()
+        self.worker = Process(target=_renderLoop,
+                              args=(np.asarray(data)[:, :2], outDir, self.frames, self.errors),
+                              daemon=True)
+        self.worker.start()
+
+    # numpy 엔진용: labels 배열과 중심점을 넘긴다 (기다리지 않음)
+    # 대기열은 나중에 따로 pickle 하므로, 다음 PASS 에서 바뀌지 않게 복사본을 넣는다.
+    def submit(self, aPass, labels, centroids):
+        try:
+            self.frames.put_nowait((aPass, np.array(labels), np.array(centroids)))
+        except queue.Full:
+            self.dropped += 1
+
+    # python 엔진용: clusters(학번 리스트의 리스트)를 labels 로 바꿔서 넘긴다
+    def submitClusters(self, aPass, clusters, centroids):
+        labels = np.empty(self.n, dtype=np.intp)
+        for clusterIndex in range(len(clusters)):
+            labels[[self.rowOfKey[aKey] for aKey in clusters[clusterIndex]]] = clusterIndex
+        self.submit(aPass, labels, centroids)
+
+    # 남은 그림을 모두 그릴 때까지 (최대 timeout 초) 기다리고 프로세스를 끝낸다.
+    # 그리기 프로세스가 이미 죽었으면 기다리지 않는다. 그 프로세스의 오류는 RuntimeError 로 다시 raise.
+    def close(self, timeout=60.0):
+        if self.worker.is_alive():
+            try:
+                self.frames.put(None, timeout=timeout)
+            except queue.Full:
+                pass
+            self.worker.join(timeout)
+        if self.worker.is_alive():
+            self.worker.terminate()
+            self.worker.join()
+            self.frames.cancel_join_thread()
+            raise RuntimeError("render worker did not finish within {} s".format(timeout))
+        try:
+            error = self.errors.get(timeout=1.0) if self.worker.exitcode else None
+        except queue.Empty:
+            error = "exit code {}".format(self.worker.exitcode)
+        if error is not None:
+            self.frames.cancel_join_thread()  # 아무도 읽지 않는 대기열 때문에 종료가 멈추지 않게
+            raise RuntimeError("render worker failed:\n" + error)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
@@ -0,0 +1,120 @@
+# 초기 중심점 고르기(seeding)와 여러번 다시 시작(restart)해서 가장 좋은 결과를 고르는 기능입니다.
+# createCentroids 는 임의의 학생 k 명을 고르기 때문에 나쁜 시작점에서 좋지 않은 결과로 끝나는 일이 많습니다.
+#   kmeansPlusPlus     : 이미 고른 중심점에서 먼 점일수록 잘 뽑히게 (거리^2 에 비례) 하나씩 고른다.
+#   kmeansParallelInit : k-means|| (Bahmani 2012). 몇 번의 라운드에서 후보를 여러 개씩 뽑고
+#                        후보들 중에서 k-means++ 로 k 개를 고른다. 데이터를 읽는 횟수가 적다.
+#   bestOfRestarts     : 서로 다른 시작점으로 여러 번 돌려서 inertia(거리제곱 합)가 가장 작은 결과를 고른다.
+#                        restart 들은 여러 프로세스에서 동시에 돈다.
+# seed 가 같으면 (작업 프로세스 수와 관계없이) 항상 같은 결과가 나온다.
+
+import os
+
+import numpy as np
+
+from K_mean_numpy import assignLabels, createClustersNumpy
+from sharedPool import shared, sharedArray, sharedPool
+
+
+# 각 점에서 가장 가까운 중심점까지 거리의 제곱
+def closestSquared(data, centroids):
+    labels, minDist = assignLabels(data, centroids)
+    return minDist * minDist, labels
+
+
+# weights 가 있으면 각 점이 weights 만큼 있는 것으로 보고 고른다.
+def kmeansPlusPlus(data, k, rng, weights=None):
+    data = np.asarray(data, dtype=np.float64)
+    n = data.shape[0]
+    if weights is None:
+        weights = np.ones(n)
+    chosen = [rng.choice(n, p=weights / weights.sum())]
+    d2, labels = closestSquared(data, data[chosen])
+    for i in range(1, k):
+        p = d2 * weights
+        if p.sum() <= 0:  # 남은 점이 모두 중심점과 같은 위치
+            candidates = np.setdiff1d(np.arange(n), chosen)
+            chosen.append(rng.choice(candidates))
+        else:
+            chosen.append(rng.choice(n, p=p / p.sum()))
+        newD2, labels = closestSquared(data, data[chosen[-1:]])
+        d2 = np.minimum(d2, newD2)
+    return data[chosen].copy()
+
+
+# k-means|| : rounds 번 동안 각 점을 oversampling * d^2 / 합계 확률로 후보에 추가한다.
+def kmeansParallelInit(data, k, rng, oversampling=None, rounds=5):
+    data = np.asarray(data, dtype=np.float64)
+    n = data.shape[0]
+    if oversampling is None:
+        oversampling = 2 * k
+    candidates = [rng.integers(n)]
+    d2, labels = closestSquared(data, data[candidates])
+    for aRound in range(rounds):
+        total = d2.sum()
+        if total <= 0:
+            break
+        picked = np.flatnonzero(rng.random(n) < oversampling * d2 / total)
+        if len(picked) == 0:
+            continue
+        candidates.extend(picked.tolist())
+        newD2, labels = closestSquared(data, data[picked])
+        d2 = np.minimum(d2, newD2)
+
+    candidates = np.unique(candidates)
+    if len(candidates) <= k:
+        extra = rng.choice(np.setdiff1d(np.arange(n), candidates), size=k - len(candidates),
+                           replace=False)
+        return data[np.concatenate([candidates, extra])].copy()
+    # 후보마다 자기에게 가장 가까운 점의 수를 가중치로 해서 k-means++ 로 k 개를 고른다
+    d2, labels = closestSquared(data, data[candidates])
+    weights = np.bincount(labels, minlength=len(candidates)).astype(np.float64)
+    return kmeansPlusPlus(data[candidates], k, rng, weights)
+
+
+def initCentroids(data, k, rng, init='kmeans++'):
+    if init == 'kmeans++':
+        return kmeansPlusPlus(data, k, rng)
+    if init == 'kmeans||':
+        return kmeansParallelInit(data, k, rng)
+    if init == 'random':
+        return np.asarray(data, dtype=np.float64)[np.sort(rng.choice(len(data), size=k, replace=False))]
+    raise ValueError("unknown init: " + str(init))
+
+
+# 거리제곱 합. 작을수록 클러스터가 잘 모여 있다.
+def inertia(data, centroids):
+    d2, labels = closestSquared(data, centroids)
+    return float(d2.sum())
+
+
+# ---------------- 여러 프로세스에서 restart 동시에 돌리기 ----------------------#
+def _runRestart(args):
+    k, repeats, tol, init, seedSequence = args
+    data = shared['data']
+    rng = np.random.default_rng(seedSequence)
+    labels, centroids = createClustersNumpy(k, initCentroids(data, k, rng, init), data, repeats,
+                                            tol=tol)
+    return centroids, inertia(data, centroids)
+
+
+# restarts 번 다시 시작해서 inertia 가 가장 작은 결과를 고른다.
+# 각 restart 는 SeedSequence(seed).spawn 으로 만든 독립적인 난수열을 쓴다.
+# 반환값: (labels, centroids, inertia)
+def bestOfRestarts(k, data, restarts=8, repeats=5, seed=None, init='kmeans++', workers=None,
+                   tol=0.0):
+    data = np.asarray(data, dtype=np.float64)
+    if data.ndim == 1:
+        data = data.reshape(-1, 1)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    tasks = [(k, repeats, tol, init, child) for child in np.random.SeedSequence(seed).spawn(restarts)]
+
+    dataRaw, sharedData = sharedArray('d', np.float64, data.shape)
+    sharedData[:] = data
+    with sharedPool(max(1, min(workers, restarts)), {'data': (dataRaw, sharedData)}) as pool:
+        results = pool.map(_runRestart, tasks)
+
+    best = min(range(restarts), key=lambda i: results[i][1])  # 같으면 앞 번호
+    centroids, bestInertia = results[best]
+    labels, minDist = assignLabels(data, centroids)
+    return labels, centroids, bestInertia
@@ -14,10 +14,10 @@
 
  
    
-import numpy as np  
-import math
+import sys
+
+from rotationEngine import toImage, rotate, rotationMatrix
 
-print('hello')
 b = (0, 0, 0)
 r = (100, 0, 0)
 
@@ -29,30 +29,35 @@ figIn = [[b, b, b, b, b, b, b, b],
          [b, b, r, r, r, b, b, b],
          [b, b, b, b, b, b, b, b], 
          [b, b, b, b, b, b, b, b]]
-figOut = [[]]
-
-th = 45
-
-i = 0
-j = 0
 
-color = figIn[i][j]
 
-x = j-3
-y = -i+3
+# 빨간 픽셀은 '#', 나머지는 '.' 로 출력
+def printFigure(fig):
+    for row in fig:
+        print(''.join('#' if pixel[0] else '.' for pixel in row))
 
 
+if __name__ == "__main__":
+    th = 45
 
-v = np.array([[x],[y]])
+    M = rotationMatrix(th)
+    print(M)
 
-v1x = math.cos(math.radians(th))
-v1y = math.sin(math.radians(th))
-v2x = -1 * math.sin(math.radians(th))
-v2y = math.cos(math.radians(th))
+    # 이미지 전체를 (8, 8, 3) 배열로 바꾸고 모든 픽셀을 한번에 돌린다 (rotationEngine 참고)
+    figOut = rotate(toImage(figIn), th)
 
-M = np.array([[v1x, v2x], [v1y, v2y]])
+    printFigure(figIn)
+    print()
+    printFigure(figOut)
 
-v_out = M.dot(v)
-print (v)
+    # python LinearAlgebraRotationMatrix.py animate : 도는 무늬를 SenseHat 에 보여준다.
+    # SenseHat 이 없으면 frames.rgb 파일에 프레임을 쓴다 (rotationAnimation 참고)
+    if len(sys.argv) > 1 and sys.argv[1] == 'animate':
+        from rotationAnimation import loadTable, play, SenseHatSink, FileSink
 
-print (v_out)
+        try:
+            sink = SenseHatSink()
+        except ImportError:
+            sink = FileSink('frames.rgb')
+        count, average, worst = play(loadTable(8, 8), toImage(figIn), sink, fps=30, loops=3)
+        print('frames =', count, ' cpu per frame =', round(average * 1e6, 1), 'us')
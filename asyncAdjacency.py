@@ -0,0 +1,182 @@
+# 친구 목록을 필요할 때만 디스크에서 읽어오는 비동기(asyncio) 그래프 저장소입니다.
+# findJob.py, BreadthFirstSearch.py, 너비우선탐색_기초.py 는 graph/friend/friends dict 전체를
+# 먼저 메모리에 만들어야 탐색을 할 수 있습니다. 여기서는
+#   - 친구 목록을 여러 개의 shard 파일(dbm key-value 파일)에 나눠 저장해 두고
+#   - 탐색 중에 만난 사람의 친구 목록만 읽어오며, 한 단계(frontier)의 읽기를 동시에 여러 개 진행하고
+#   - 자주 보는 사람의 친구 목록은 LRU 캐시에 둡니다.
+# 그래서 탐색 시간은 전체 그래프 크기가 아니라 방문한 사람 수에 따라 달라집니다.
+#
+#   writeShards(graph, 폴더, numShards)            -> 디스크에 저장
+#   provider = ShardedFileProvider(폴더)           -> await provider.neighbors(이름)
+#   await asyncSearch(provider, '시작', predicate)  -> (찾은 사람, 방문한 사람 수)
+
+import os
+import json
+import zlib
+import dbm
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+# 이름이 어느 shard 에 들어가는지 (실행할 때마다 같은 값이 나오도록 crc32 사용)
+def shardOf(name, numShards):
+    return zlib.crc32(name.encode('utf-8')) % numShards
+
+
+def _shardPath(directory, shard):
+    return os.path.join(directory, 'shard_{:03d}'.format(shard))
+
+
+# graph({이름: 친구 목록}) 를 numShards 개의 dbm 파일로 나눠 저장한다.
+# 친구 목록은 이름 리스트(BreadthFirstSearch) 또는 {'name', 'job'} dict 리스트(findJob) 모두 가능.
+def writeShards(graph, directory, numShards=16):
+    os.makedirs(directory, exist_ok=True)
+    shards = [dbm.open(_shardPath(directory, shard), 'n') for shard in range(numShards)]
+    try:
+        for name in graph:
+            shards[shardOf(name, numShards)][name] = json.dumps(graph[name])
+    finally:
+        for db in shards:
+            db.close()
+    with open(os.path.join(directory, 'shards.json'), 'w') as infoFile:
+        json.dump({'numShards': numShards}, infoFile)
+
+
+class AdjacencyProvider(ABC):
+
+    # name 의 친구 목록. 없는 사람이면 빈 리스트
+    @abstractmethod
+    async def neighbors(self, name):
+        pass
+
+
+# 메모리의 dict 를 그대로 쓰는 provider (작은 그래프, 시험용)
+class DictProvider(AdjacencyProvider):
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    async def neighbors(self, name):
+        return self.graph.get(name, [])
+
+
+class ShardedFileProvider(AdjacencyProvider):
+
+    # cacheSize : LRU 캐시에 둘 사람 수, maxInFlight : 동시에 진행할 디스크 읽기 수
+    def __init__(self, directory, cacheSize=100000, maxInFlight=64):
+        with open(os.path.join(directory, 'shards.json'), 'r') as infoFile:
+            self.numShards = json.load(infoFile)['numShards']
+        self.directory = directory
+        self.cacheSize = cacheSize
+        self.maxInFlight = maxInFlight
+        self.cache = OrderedDict()
+        self.pending = {}  # 읽는 중인 이름 -> Future (같은 사람을 두번 읽지 않도록)
+        self.shards = {}
+        self.locks = [threading.Lock() for shard in range(self.numShards)]
+        self.semaphore = None
+        self.hits = 0
+        self.reads = 0
+
+    # (작업 스레드에서 실행) shard 파일에서 한 사람의 친구 목록을 읽는다.
+    def _read(self, name):
+        shard = shardOf(name, self.numShards)
+        with self.locks[shard]:
+            db = self.shards.get(shard)
+            if db is None:
+                db = dbm.open(_shardPath(self.directory, shard), 'r')
+                self.shards[shard] = db
+            value = db.get(name.encode('utf-8'))
+        return json.loads(value) if value is not None else []
+
+    async def neighbors(self, name):
+        while True:
+            if name in self.cache:
+                self.cache.move_to_end(name)
+                self.hits += 1
+                return self.cache[name]
+            future = self.pending.get(name)
+            if future is None:
+                break
+            # shield: 기다리던 이 작업이 취소되어도 같이 기다리는 다른 작업의 Future 는 그대로 둔다
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise  # 이 작업이 취소되었다
+                # 읽던 작업이 취소되었으면 처음부터 다시 (캐시 -> 다른 작업이 읽는 중 -> 직접 읽기)
+
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.maxInFlight)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[name] = future
+        try:
+            async with self.semaphore:
+                friends = await asyncio.get_running_loop().run_in_executor(None, self._read, name)
+            self.reads += 1
+            self.cache[name] = friends
+            if len(self.cache) > self.cacheSize:
+                self.cache.popitem(last=False)
+            future.set_result(friends)
+        except Exception as error:
+            future.set_exception(error)
+            # 같은 사람을 기다리는 다른 작업이 없으면 아무도 이 예외를 꺼내지 않으므로
+            # 여기서 한번 꺼내 둔다 ("Future exception was never retrieved" 경고 방지)
+            future.exception()
+            raise
+        finally:
+            # 이 작업이 취소되어 결과가 없으면 Future 를 취소해서 기다리던 작업들이 다시 읽게 한다
+            if not future.done():
+                future.cancel()
+            if self.pending.get(name) is future:
+                del self.pending[name]
+        return friends
+
+    # 아직 읽는 중인 Future 는 취소한다.
+    def close(self):
+        for future in self.pending.values():
+            future.cancel()
+        self.pending = {}
+        for db in self.shards.values():
+            db.close()
+        self.shards = {}
+
+
+# provider 에서 친구 목록을 받아가며 너비우선탐색을 한다.
+# 한 단계의 친구 목록은 asyncio.gather 로 동시에 요청하고, 결과는 원래 BFS 순서대로 확인한다.
+# nameOf 는 친구 목록의 원소에서 이름을 꺼내는 함수 (findJob 형태면 lambda p: p['name']).
+# predicate 는 친구 목록의 원소를 받는다. start 자신은 검사하지 않는다.
+# 반환값: (찾은 원소 또는 None, 방문한 사람 수)
+async def asyncSearch(provider, start, predicate, nameOf=None):
+    if nameOf is None:
+        nameOf = lambda entry: entry
+    searched = {start}
+    frontier = [start]
+    while frontier:
+        lists = await asyncio.gather(*[provider.neighbors(name) for name in frontier])
+        nextFrontier = []
+        for friends in lists:
+            for entry in friends:
+                name = nameOf(entry)
+                if name in searched:
+                    continue
+                searched.add(name)
+                if predicate(entry):
+                    return entry, len(searched)
+                nextFrontier.append(name)
+        frontier = nextFrontier
+    return None, len(searched)
+
+
+if __name__ == "__main__":
+    import tempfile
+    from findJob import graph, person_is_police
+
+    with tempfile.TemporaryDirectory() as directory:
+        writeShards(graph, directory, 4)
+        provider = ShardedFileProvider(directory)
+        found, visited = asyncio.run(asyncSearch(provider, 'you', person_is_police,
+                                                 lambda person: person['name']))
+        provider.close()
+        print(found['name'], 'is a policeOfficer!', '(visited', visited, ')')
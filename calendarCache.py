@@ -0,0 +1,93 @@
+# print_month 를 아주 자주 부르는 경우(여러 사람이 아무 달이나 계속 보는 서비스)를 위한 캐시입니다.
+# 그레고리력에서 한 달의 본문은 (1 일의 요일, 달의 길이) 로만 정해지므로 7 * 4 = 28 가지뿐이고,
+# 400 년(= 146097 일, 7 의 배수)마다 모든 달의 요일이 그대로 되풀이됩니다. 그래서
+#   - 본문 모양(layout)은 (요일, 길이) 마다 한번만 만들고
+#   - (year % 400, 달) -> layout 번호 표(CYCLE_LAYOUTS)를 처음에 한번 만들어 두고
+#   - 제목까지 붙인 달력 문자열은 크기가 정해진 LRU 캐시에 넣어 같은 요청은 바로 돌려줍니다.
+#
+#   cache = MonthCache(maxsize=4096)
+#   sys.stdout.write(cache.render('march', 2024))
+
+import sys
+import random
+from collections import OrderedDict
+from time import perf_counter
+
+import numpy as np
+
+from calendarEngine import (MONTH_NAMES, WEEK_HEADER, BODY_TEMPLATES, bodySize, monthIndex,
+                            firstWeekdays, monthLengths, renderMonth)
+
+CYCLE_YEARS = 400
+
+
+# layout 번호 = 요일 * 4 + (길이 - 28)
+def layoutId(wd, length):
+    return wd * 4 + (length - 28)
+
+
+def _cycleLayouts():
+    years = np.repeat(np.arange(CYCLE_YEARS), 12)
+    months = np.tile(np.arange(1, 13), CYCLE_YEARS)
+    ids = layoutId(firstWeekdays(years, months), monthLengths(years, months))
+    return ids.astype(np.uint8).reshape(CYCLE_YEARS, 12)
+
+
+CYCLE_LAYOUTS = _cycleLayouts()  # [year % 400][달 - 1] -> layout 번호
+LAYOUTS = [BODY_TEMPLATES[i // 4][:bodySize(i // 4, 28 + i % 4)] + '\n' for i in range(28)]
+
+
+class MonthCache(object):
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.months = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # print_month(month, year) 가 출력하는 문자열. month 는 달 이름(대소문자 무시) 또는 1 ~ 12
+    def render(self, month, year):
+        key = (month, year)
+        text = self.months.get(key)
+        if text is not None:
+            self.months.move_to_end(key)
+            self.hits += 1
+            return text
+        self.misses += 1
+        idx = monthIndex(month)
+        monthName = month if isinstance(month, str) else MONTH_NAMES[idx]
+        text = ('{} {}'.format(monthName, year).center(20) + '\n' + WEEK_HEADER
+                + LAYOUTS[CYCLE_LAYOUTS[year % CYCLE_YEARS, idx]])
+        self.months[key] = text
+        if len(self.months) > self.maxsize:
+            self.months.popitem(last=False)
+        return text
+
+
+# 1 ~ 2100 년의 달을 무작위로 요청할 때 초당 처리 수 (캐시 없는 renderMonth 와 비교).
+# hot 비율만큼은 최근 몇 년(hotYears) 안에서 요청한다.
+def benchmark(requests=10 ** 6, maxsize=4096, hot=0.9, hotYears=range(2000, 2031), seed=0):
+    rng = random.Random(seed)
+    queries = []
+    for i in range(requests):
+        year = rng.choice(hotYears) if rng.random() < hot else rng.randint(1, 2100)
+        queries.append((rng.randint(1, 12), year))
+
+    cache = MonthCache(maxsize)
+    start = perf_counter()
+    for month, year in queries:
+        cache.render(month, year)
+    seconds = perf_counter() - start
+    print('cached   {:.3f}s  {:.0f} req/s  hit rate={:.3f}'.format(
+        seconds, requests / seconds, cache.hits / requests))
+
+    count = requests // 10
+    start = perf_counter()
+    for month, year in queries[:count]:
+        renderMonth(month, year)
+    seconds = perf_counter() - start
+    print('uncached {:.3f}s  {:.0f} req/s'.format(seconds, count / seconds))
+
+
+if __name__ == "__main__":
+    benchmark(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 6)
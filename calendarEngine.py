@@ -0,0 +1,124 @@
+# printCalendar.py 의 print_month 를 여러 해, 여러 달에 대해 한꺼번에 만드는 달력 엔진입니다.
+# print_month 는 달마다 date(...).weekday() 를 부르고 날짜마다 print 를 하며, month_length 가 10 개라서
+# 11 월, 12 월은 IndexError 가 나고, 달 이름은 대소문자까지 같아야 찾을 수 있었습니다. 여기서는
+#   - 윤년, 달의 길이, 1 일의 요일을 numpy 배열 연산으로 (Sakamoto 공식) 한번에 계산하고
+#   - 달력 본문은 1 일의 요일(7 가지)마다 미리 만든 긴 문자열의 앞부분이라는 점을 이용해서
+#     문자열 조각을 모아 마지막에 한번만 씁니다 (날짜마다 print 하지 않음).
+# 출력 모양은 print_month 와 글자 하나까지 같습니다.
+#
+#   sys.stdout.write(renderMonth('march', 2024))
+#   writeCalendar(outFile, 1, 10000)       # 1 년 ~ 10000 년의 모든 달
+
+import io
+import sys
+from time import perf_counter
+
+import numpy as np
+
+MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December')
+MONTH_LENGTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+WEEK_HEADER = 'Su Mo Tu We Th Fr sa\n'
+
+_MONTH_INDEX = dict((name.lower(), i) for i, name in enumerate(MONTH_NAMES))
+_SAKAMOTO = np.array([0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4])
+
+
+# 달 이름(대소문자 무시) 또는 1 ~ 12 숫자 -> 0 ~ 11
+def monthIndex(month):
+    if isinstance(month, str):
+        try:
+            return _MONTH_INDEX[month.lower()]
+        except KeyError:
+            raise ValueError("unknown month: " + month)
+    if not 1 <= month <= 12:
+        raise ValueError("month must be 1..12: " + str(month))
+    return month - 1
+
+
+def isLeap(years):
+    years = np.asarray(years)
+    return (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+
+
+# months 는 1 ~ 12
+def monthLengths(years, months):
+    years = np.asarray(years)
+    months = np.asarray(months)
+    return MONTH_LENGTH[months - 1] + ((months == 2) & isLeap(years))
+
+
+# 그 달 1 일의 요일 (0 = 일요일 ... 6 = 토요일, Sakamoto 공식)
+def firstWeekdays(years, months):
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    y = years - (months < 3)
+    return (y + y // 4 - y // 100 + y // 400 + _SAKAMOTO[months - 1] + 1) % 7
+
+
+# startYear 1 월 ~ endYear 12 월의 모든 달: (years, months, 1 일의 요일, 길이) 배열
+def monthTable(startYear, endYear):
+    years = np.repeat(np.arange(startYear, endYear + 1), 12)
+    months = np.tile(np.arange(1, 13), endYear - startYear + 1)
+    return years, months, firstWeekdays(years, months), monthLengths(years, months)
+
+
+# 1 일이 요일 wd 인 달의 본문 = BODY_TEMPLATES[wd] 의 앞 bodySize(wd, 길이) 글자 + '\n'
+# (print_month 처럼 날짜마다 '{:2d} ', 토요일 뒤에 줄바꿈)
+def _bodyTemplate(wd):
+    cells = ['   '] * wd + ['{:2d} '.format(day) for day in range(1, 32)]
+    return ''.join(cell + ('\n' if (k + 1) % 7 == 0 else '') for k, cell in enumerate(cells))
+
+
+BODY_TEMPLATES = [_bodyTemplate(wd) for wd in range(7)]
+
+
+def bodySize(wd, length):
+    return 3 * (wd + length) + (wd + length) // 7
+
+
+def _title(monthName, year):
+    return '{} {}'.format(monthName, year).center(20) + '\n'
+
+
+# 한 달의 달력 문자열. monthName 을 주면 제목에 그 이름을 쓴다 (print_month 처럼 입력한 이름 그대로).
+def renderMonth(month, year, monthName=None):
+    idx = monthIndex(month)
+    wd = int(firstWeekdays(year, idx + 1))
+    length = int(monthLengths(year, idx + 1))
+    if monthName is None:
+        monthName = month if isinstance(month, str) else MONTH_NAMES[idx]
+    return _title(monthName, year) + WEEK_HEADER + BODY_TEMPLATES[wd][:bodySize(wd, length)] + '\n'
+
+
+# 여러 달의 달력을 이어 붙인 문자열
+def renderMonths(years, months):
+    wd = firstWeekdays(years, months)
+    sizes = bodySize(wd, monthLengths(years, months))
+    parts = []
+    for year, month, w, size in zip(np.asarray(years).tolist(), np.asarray(months).tolist(),
+                                    wd.tolist(), sizes.tolist()):
+        parts.append(_title(MONTH_NAMES[month - 1], year))
+        parts.append(WEEK_HEADER)
+        parts.append(BODY_TEMPLATES[w][:size])
+        parts.append('\n')
+    return ''.join(parts)
+
+
+# startYear ~ endYear 의 모든 달을 out 에 한번에 쓴다. 반환값: 쓴 달의 수
+def writeCalendar(out, startYear, endYear):
+    years, months, wd, lengths = monthTable(startYear, endYear)
+    out.write(renderMonths(years, months))
+    return len(years)
+
+
+def benchmark(years=10000):
+    buffer = io.StringIO()
+    start = perf_counter()
+    count = writeCalendar(buffer, 1, years)
+    seconds = perf_counter() - start
+    print('months={:d}  {:.3f}s  {:.2f}MB'.format(count, seconds, buffer.tell() / 1e6))
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -12,31 +12,36 @@ graph["fom"] = []
 graph["gil"] = []
 
 
-from collections import deque
-search_queue = deque()
-search_queue += graph["you"]
-print(search_queue)
-
-
-
-def search(name):
-    search_queue = deque()
-    search_queue += graph[name]
-    searched = []
-    
-    while search_queue:
-        person = search_queue.popleft()
-        print('person = ', person)
-        if person_is_police(person):
-            if not person in searched:
-                print (person['name'] + " is a policeOfficer!")
-                return True
-        else:
-            search_queue += graph[person['name']]
-            searched.append(person)
+from graphStore import GraphStore
+from friendSearch import shortestPath
+
+
+# graph 를 GraphStore(정수 id + CSR 배열)로 바꿔서 너비우선탐색을 한다.
+# 이미 확인한 사람은 기록해 두므로 사람이 많아도 확인이 O(1) 이다.
+# 찾은 경찰관까지 이어지는 친구 관계(경로)와 거리도 출력한다.
+def search(name, store=None):
+    if store is None:
+        store = GraphStore.fromJobGraph(graph)
+
+    path, visited = shortestPath(store, name, store.jobMatches(job_is_police))
+    if path is not None:
+        print (path[-1] + " is a policeOfficer!")
+        print (' -> '.join(path), '(distance', len(path) - 1, ')')
+        return True
     return False
 
 def person_is_police(personDict):
-    return personDict['job'] == 'policeOffice'
+    return job_is_police(personDict['job'])
+
+def job_is_police(job):
+    return job == 'policeOffice'
+
+
+if __name__ == "__main__":
+    search("you")
 
-search("you")
+    # 여러 사람에 대해 물어볼 때는 직업별 색인을 한번 만들어 두고 O(1) 로 찾는다.
+    from nearestJobIndex import NearestJobIndex
+    index = NearestJobIndex(GraphStore.fromJobGraph(graph), ['policeOffice'])
+    for name in graph:
+        print(name, '->', index.nearestHolder(name, 'policeOffice'))
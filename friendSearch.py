@@ -0,0 +1,108 @@
+# BreadthFirstSearch.py, 너비우선탐색_기초.py, findJob.py 가 같이 쓰는 최단경로 탐색 모듈입니다.
+# 세 파일 모두 처음 찾은 사람의 이름만 출력하고 멈추는데, 여기서는
+#   - 시작한 사람에서 찾은 사람까지 이어지는 친구 관계(경로)와 거리(몇 단계인지)를 돌려주고
+#   - 두 사람 사이의 경로를 찾을 때는 양쪽에서 동시에 넓혀가는 양방향 BFS 를 쓸 수 있습니다.
+# 그래프는 graphStore.GraphStore 를 사용합니다.
+#
+#   shortestPath(store, '시작', isTarget)      -> (경로 이름 리스트, 방문한 사람 수)
+#   bidirectionalPath(store, '시작', '도착')   -> (경로 이름 리스트, 방문한 사람 수)
+# 경로를 찾지 못하면 경로는 None 입니다. 거리는 len(경로) - 1 입니다.
+
+from array import array
+from collections import deque
+
+
+# parent[v] 를 따라 거꾸로 올라가서 source -> node 경로(id 리스트)를 만든다.
+def _walkBack(parent, node):
+    path = [node]
+    while parent[node] != node:
+        node = parent[node]
+        path.append(node)
+    path.reverse()
+    return path
+
+
+# isTarget 은 사람 id 마다 0/1 인 bytearray (GraphStore.jobMatches / nameMatches).
+# 시작한 사람 자신은 검사하지 않는다 (원래 스크립트들과 같음).
+# 반환값: (경로 id 리스트 또는 None, 방문한 사람 수)
+def shortestPathId(store, source, isTarget):
+    parent = array('q', [-1]) * store.numNodes()
+    parent[source] = source
+    offsets = store.offsets
+    targets = store.targets
+    visited = 1
+    searchQueue = deque([source])
+    while searchQueue:
+        v = searchQueue.popleft()
+        for w in targets[offsets[v]:offsets[v + 1]].tolist():
+            if parent[w] != -1:
+                continue
+            parent[w] = v
+            visited += 1
+            if isTarget[w]:
+                return _walkBack(parent, w), visited
+            searchQueue.append(w)
+    return None, visited
+
+
+def shortestPath(store, start, isTarget):
+    path, visited = shortestPathId(store, store.idOf(start), isTarget)
+    if path is None:
+        return None, visited
+    return [store.names[v] for v in path], visited
+
+
+# 한 방향으로 한 단계(level) 넓힌다. 다른 방향에서 이미 방문한 사람을 만나면
+# 그 중 전체 거리가 가장 짧은 사람을 돌려준다 (없으면 -1).
+def _expandLevel(graph, frontier, parent, dist, otherDist):
+    offsets = graph.offsets
+    targets = graph.targets
+    nextFrontier = []
+    meet = -1
+    meetLength = -1
+    for v in frontier:
+        for w in targets[offsets[v]:offsets[v + 1]].tolist():
+            if w in parent:
+                continue
+            parent[w] = v
+            dist[w] = dist[v] + 1
+            nextFrontier.append(w)
+            if w in otherDist and (meet < 0 or dist[w] + otherDist[w] < meetLength):
+                meet = w
+                meetLength = dist[w] + otherDist[w]
+    return nextFrontier, meet
+
+
+# 양방향 BFS: source 에서 앞으로, goal 에서 (간선을 뒤집은 그래프로) 뒤로 넓혀가다가 만나면 멈춘다.
+# 방문 기록은 dict 에 하므로 메모리도 방문한 사람 수에만 비례한다.
+# reverse 는 store.reversed() (여러 번 찾을 때는 한번 만들어서 넘기세요).
+def bidirectionalPathId(store, source, goal, reverse=None):
+    if source == goal:
+        return [source], 1
+    if reverse is None:
+        reverse = store.reversed()
+    fwdParent = {source: source}
+    fwdDist = {source: 0}
+    bwdParent = {goal: goal}
+    bwdDist = {goal: 0}
+    fwdFrontier = [source]
+    bwdFrontier = [goal]
+    while fwdFrontier and bwdFrontier:
+        # 더 작은 쪽을 넓힌다
+        if len(fwdFrontier) <= len(bwdFrontier):
+            fwdFrontier, meet = _expandLevel(store, fwdFrontier, fwdParent, fwdDist, bwdDist)
+        else:
+            bwdFrontier, meet = _expandLevel(reverse, bwdFrontier, bwdParent, bwdDist, fwdDist)
+        if meet >= 0:
+            path = _walkBack(fwdParent, meet)
+            back = _walkBack(bwdParent, meet)  # goal -> meet
+            back.reverse()
+            return path + back[1:], len(fwdParent) + len(bwdParent)
+    return None, len(fwdParent) + len(bwdParent)
+
+
+def bidirectionalPath(store, start, goal, reverse=None):
+    path, visited = bidirectionalPathId(store, store.idOf(start), store.idOf(goal), reverse)
+    if path is None:
+        return None, visited
+    return [store.names[v] for v in path], visited
@@ -0,0 +1,136 @@
+# 한 단계(level)씩 통째로 넓혀가는 너비우선탐색 엔진입니다.
+# BreadthFirstSearch.py 는 큐에서 한 명씩 꺼내고, 확인한 사람 목록에서 list.index + try/except 로
+# 찾고, 한 명마다 sleep(0.75) 를 합니다. 여기서는
+#   - 지금 단계의 사람들(frontier) 전체의 친구를 CSR 배열에서 한번에 모으고
+#   - 방문 여부와 checkMangoMen 같은 조건을 numpy 배열로 한꺼번에 검사하고
+#   - frontier 가 크면 여러 작업 프로세스에 나눠서 친구를 모읍니다 (그래프는 공유 메모리).
+# search 는 찾은 사람과 함께 거기까지의 최단경로, 걸린 시간, 초당 방문한 사람 수(nodes/sec)를 돌려줍니다.
+
+import os
+from time import perf_counter
+
+import numpy as np
+
+from sharedPool import shared, sharedArray, sharedPool
+
+# frontier 가 이보다 크면 작업 프로세스에 나눠서 처리한다
+PARALLEL_FRONTIER = 1 << 16
+
+
+# frontier 의 모든 친구를 frontier 순서, 친구 목록 순서대로 모은다.
+def gatherNeighbors(offsets, targets, frontier):
+    starts = offsets[frontier]
+    lengths = offsets[frontier + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    # 각 친구의 targets 위치 = 그 사람의 시작 위치 + (0, 1, 2, ...)
+    firstOfRun = np.cumsum(lengths) - lengths
+    positions = np.arange(total) - np.repeat(firstOfRun - starts, lengths)
+    return targets[positions], np.repeat(frontier, lengths)
+
+
+# 방문하지 않은 친구만 남기고, 같은 사람은 처음 나온 것만 남긴다 (순서 유지).
+def newNodes(neighbors, parents, visited):
+    fresh = ~visited[neighbors]
+    neighbors = neighbors[fresh]
+    parents = parents[fresh]
+    unique, first = np.unique(neighbors, return_index=True)
+    first.sort()
+    return neighbors[first], parents[first]
+
+
+# ---------------- 작업 프로세스 ------------------------------------------------#
+def _expandChunk(frontier):
+    neighbors, parents = gatherNeighbors(shared['offsets'], shared['targets'], frontier)
+    return newNodes(neighbors, parents, shared['visited'])
+
+
+class FrontierEngine(object):
+
+    # store 는 graphStore.GraphStore. workers > 1 이면 큰 frontier 를 그 수의 프로세스에 나눈다.
+    def __init__(self, store, workers=1, parallelFrontier=PARALLEL_FRONTIER):
+        self.store = store
+        self.parallelFrontier = parallelFrontier
+        n = store.numNodes()
+        offsetsRaw, self.offsets = sharedArray('q', np.int64, (len(store.offsets),))
+        targetsRaw, self.targets = sharedArray('q', np.int64, (len(store.targets),))
+        visitedRaw, self.visited = sharedArray('b', np.bool_, (n,))
+        # 사람마다 처음 만났을 때 거쳐 온 사람 (경로를 되짚는 데 쓴다). 부모 프로세스에만 둔다.
+        self.parent = np.empty(n, dtype=np.int64)
+        self.offsets[:] = store.offsets
+        self.targets[:] = store.targets
+        self.pool = None
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.workers = workers
+        if workers > 1:
+            self.pool = sharedPool(workers, {'offsets': (offsetsRaw, self.offsets),
+                                             'targets': (targetsRaw, self.targets),
+                                             'visited': (visitedRaw, self.visited)})
+
+    def _expand(self, frontier):
+        if self.pool is None or len(frontier) < self.parallelFrontier:
+            neighbors, parents = gatherNeighbors(self.offsets, self.targets, frontier)
+            return newNodes(neighbors, parents, self.visited)
+        chunks = np.array_split(frontier, self.workers)
+        results = self.pool.map(_expandChunk, chunks)
+        neighbors = np.concatenate([r[0] for r in results])
+        parents = np.concatenate([r[1] for r in results])
+        # 다른 조각에서 같은 사람이 나올 수 있으므로 한번 더 정리한다
+        return newNodes(neighbors, parents, self.visited)
+
+    # start 의 친구부터 한 단계씩 넓혀가며 isTarget 이 참인 첫번째 사람을 찾는다 (start 자신은 검사 안 함).
+    # isTarget 은 사람마다 0/1 (GraphStore.nameMatches / jobMatches 결과).
+    # 반환값: (찾은 사람 id 또는 -1, stats)
+    #   stats : levels(단계 수), visited(방문한 사람 수), seconds, nodesPerSec,
+    #           path(start 부터 찾은 사람까지의 id 목록, 못 찾으면 None)
+    def search(self, start, isTarget):
+        begin = perf_counter()
+        isTarget = np.frombuffer(bytes(isTarget), dtype=np.bool_)
+        self.visited[:] = False
+        source = self.store.idOf(start)
+        self.visited[source] = True
+        self.parent[source] = source
+        frontier = np.array([source], dtype=np.int64)
+        found = -1
+        levels = 0
+        visited = 1
+        while len(frontier) and found < 0:
+            frontier, parents = self._expand(frontier)
+            levels += 1
+            hits = np.flatnonzero(isTarget[frontier])
+            if len(hits):
+                found = int(frontier[hits[0]])
+                frontier = frontier[:hits[0] + 1]  # 원래 BFS 처럼 찾은 사람까지만 방문
+                parents = parents[:hits[0] + 1]
+            self.visited[frontier] = True
+            self.parent[frontier] = parents
+            visited += len(frontier)
+
+        seconds = perf_counter() - begin
+        stats = {'levels': levels, 'visited': visited, 'seconds': seconds,
+                 'nodesPerSec': visited / seconds if seconds > 0 else float('inf'),
+                 'path': self.pathTo(found) if found >= 0 else None}
+        return found, stats
+
+    # 마지막 search 에서 방문한 사람 v 까지의 경로 (start 부터 v 까지의 id 목록)
+    def pathTo(self, v):
+        path = [v]
+        while self.parent[v] != v:
+            v = int(self.parent[v])
+            path.append(v)
+        path.reverse()
+        return path
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
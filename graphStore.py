@@ -0,0 +1,160 @@
+# 친구 관계 그래프를 작고 빠르게 저장하는 GraphStore 입니다.
+# findJob.py 의 graph 는 {이름: [{'name':..., 'job':...}, ...]} 형태의 dict 이고,
+# search 는 이미 확인한 사람을 list 에 넣고 `in` 으로 찾기 때문에 사람이 많아지면 매우 느립니다.
+#
+#   - 이름은 0, 1, 2, ... 정수 번호(id)로 바꿔서 다룬다 (names[id] = 이름, ids[이름] = id).
+#   - 친구 목록은 CSR 배열 두 개로 저장한다.
+#       offsets[v] ~ offsets[v+1] 구간의 targets 가 v 의 친구 id 들
+#   - 직업은 사람마다 직업 번호(jobOf) 하나만 저장하고, 직업 이름은 jobNames 에 한번만 저장한다.
+#   - BFS 는 방문 여부를 bytearray 로 기록해서 O(1) 로 확인한다.
+# 메모리는 (사람 수 + 친구 관계 수)에 비례합니다.
+
+from collections import deque
+
+import numpy as np
+
+NO_JOB = 0  # jobNames[0] = '' : 직업 정보가 없는 사람
+
+
+class GraphStore(object):
+
+    def __init__(self, names, offsets, targets, jobOf=None, jobNames=None):
+        self.names = list(names)
+        self.ids = {name: v for v, name in enumerate(self.names)}
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.targets = np.asarray(targets, dtype=np.int64)
+        if jobOf is None:
+            jobOf = np.zeros(len(self.names), dtype=np.int32)
+        self.jobOf = np.asarray(jobOf, dtype=np.int32)
+        self.jobNames = list(jobNames) if jobNames is not None else ['']
+
+    # ---------------- 만들기 ---------------------------------------------------#
+
+    # 간선 (src[i] -> dst[i]) 배열로 만든다. 같은 사람의 친구 순서는 입력 순서를 그대로 유지한다.
+    @classmethod
+    def fromEdges(cls, src, dst, numNodes, names=None, jobOf=None, jobNames=None):
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        order = np.argsort(src, kind='stable')
+        offsets = np.zeros(numNodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=numNodes), out=offsets[1:])
+        if names is None:
+            names = [str(v) for v in range(numNodes)]
+        return cls(names, offsets, dst[order], jobOf, jobNames)
+
+    # findJob.py 형태: {이름: [{'name': 친구이름, 'job': 직업}, ...]}
+    @classmethod
+    def fromJobGraph(cls, graph):
+        builder = _Builder()
+        for name in graph:
+            v = builder.intern(name)
+            for person in graph[name]:
+                w = builder.intern(person['name'], person.get('job'))
+                builder.addEdge(v, w)
+        return builder.build(cls)
+
+    # BreadthFirstSearch.py / 너비우선탐색_기초.py 형태: {이름: [친구이름, ...]}
+    @classmethod
+    def fromFriendDict(cls, friends):
+        builder = _Builder()
+        for name in friends:
+            v = builder.intern(name)
+            for friendName in friends[name]:
+                builder.addEdge(v, builder.intern(friendName))
+        return builder.build(cls)
+
+    # ---------------- 조회 -----------------------------------------------------#
+
+    def numNodes(self):
+        return len(self.names)
+
+    def numEdges(self):
+        return len(self.targets)
+
+    def idOf(self, name):
+        return self.ids[name]
+
+    def neighbors(self, v):
+        return self.targets[self.offsets[v]:self.offsets[v + 1]]
+
+    # 모든 간선의 방향을 뒤집은 그래프 (v 를 친구로 둔 사람들 = reversed().neighbors(v))
+    def reversed(self):
+        src = np.repeat(np.arange(self.numNodes(), dtype=np.int64), np.diff(self.offsets))
+        return GraphStore.fromEdges(self.targets, src, self.numNodes(), self.names,
+                                    self.jobOf, self.jobNames)
+
+    def jobName(self, v):
+        return self.jobNames[self.jobOf[v]]
+
+    # 사람마다 predicate(직업이름) 결과 (0/1) 를 담은 bytearray.
+    # predicate 는 직업 종류마다 한번씩만 호출된다.
+    def jobMatches(self, predicate):
+        jobMatch = np.array([bool(predicate(job)) for job in self.jobNames], dtype=np.uint8)
+        return bytearray(jobMatch[self.jobOf].tobytes())
+
+    # 사람마다 predicate(이름) 결과 (0/1). 예: BreadthFirstSearch.checkMangoMen
+    def nameMatches(self, predicate):
+        return bytearray(1 if predicate(name) else 0 for name in self.names)
+
+    # start 의 친구부터 너비우선으로 찾아서 직업이 predicate 를 만족하는 첫번째 사람의 id (없으면 -1).
+    # findJob.search 처럼 start 자신은 검사하지 않는다.
+    def searchJobId(self, start, predicate):
+        isTarget = self.jobMatches(predicate)
+        visited = bytearray(self.numNodes())
+        source = self.ids[start]
+        visited[source] = 1
+        searchQueue = deque([source])
+        offsets = self.offsets
+        targets = self.targets
+        while searchQueue:
+            v = searchQueue.popleft()
+            for w in targets[offsets[v]:offsets[v + 1]].tolist():
+                if visited[w]:
+                    continue
+                visited[w] = 1
+                if isTarget[w]:
+                    return w
+                searchQueue.append(w)
+        return -1
+
+    # searchJobId 의 결과를 이름으로 돌려준다 (없으면 None).
+    def searchJob(self, start, predicate):
+        found = self.searchJobId(start, predicate)
+        return self.names[found] if found >= 0 else None
+
+
+# dict 형태의 그래프를 읽으면서 이름/직업에 번호를 붙이고 간선을 모으는 도우미
+class _Builder(object):
+
+    def __init__(self):
+        self.ids = {}
+        self.names = []
+        self.jobIds = {'': NO_JOB}
+        self.jobNames = ['']
+        self.jobOf = []
+        self.src = []
+        self.dst = []
+
+    def intern(self, name, job=None):
+        v = self.ids.get(name)
+        if v is None:
+            v = len(self.names)
+            self.ids[name] = v
+            self.names.append(name)
+            self.jobOf.append(NO_JOB)
+        if job is not None:
+            jobId = self.jobIds.get(job)
+            if jobId is None:
+                jobId = len(self.jobNames)
+                self.jobIds[job] = jobId
+                self.jobNames.append(job)
+            self.jobOf[v] = jobId
+        return v
+
+    def addEdge(self, v, w):
+        self.src.append(v)
+        self.dst.append(w)
+
+    def build(self, cls):
+        return cls.fromEdges(self.src, self.dst, len(self.names), self.names,
+                             self.jobOf, self.jobNames)
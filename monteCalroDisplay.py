@@ -0,0 +1,94 @@
+# monteCalroPi.py 의 turtle 화면을 많은 점에서도 쓸 수 있게 만든 표시 모드입니다.
+# 점 하나마다 goto + dot 을 애니메이션으로 그리면 그리기가 계산보다 훨씬 느립니다. 여기서는
+#   - turtle 의 tracer 를 끄고, 정해진 시간(frameSeconds)마다 한번만 화면을 갱신하고
+#   - 지금까지 던진 점 중에서 고르게 뽑은 최대 maxPoints 개(reservoir sample)만 그리고
+#   - 현재 원주율 추정값과 신뢰구간을 글자로 보여줍니다.
+# 계산은 monteCalroEngine 의 블록 단위로 하므로, 그리는 점의 수와 관계없이 계산 속도는 같습니다.
+
+import math
+from time import perf_counter
+
+import numpy as np
+
+from monteCalroEngine import BLOCK_SIZE, sampleBlocks, countInside, estimatePi
+
+
+class DartDisplay(object):
+
+    # pen 은 turtle.Turtle, r 은 사분원의 반지름(화면 좌표)
+    def __init__(self, pen, r, maxPoints=2000, frameSeconds=0.2, dotSize=4):
+        self.pen = pen
+        self.screen = pen.getscreen()
+        self.r = r
+        self.maxPoints = maxPoints
+        self.frameSeconds = frameSeconds
+        self.dotSize = dotSize
+        self.pointsX = np.empty(maxPoints)
+        self.pointsY = np.empty(maxPoints)
+        self.filled = 0
+        self.seen = 0
+        self.frames = 0
+        # Algorithm L 상태: 현재 가중치와 다음에 바꿀 점의 번호 (저장소가 다 차면 정한다)
+        self.weight = 1.0
+        self.nextIndex = 0
+
+    # 지금까지 던진 모든 점 중에서 각 점이 같은 확률로 남도록 최대 maxPoints 개를 유지한다.
+    # (reservoir sampling, Li 1994 의 Algorithm L: 다음에 바뀔 점까지 건너뛸 개수를 바로 뽑으므로
+    #  블록이 커도 바뀌는 점의 수만큼만 반복한다)
+    def _keepSample(self, rng, x, y):
+        k = self.maxPoints
+        start = self.seen
+        end = start + len(x)
+        if self.filled < k:
+            room = min(k - self.filled, len(x))
+            self.pointsX[self.filled:self.filled + room] = x[:room]
+            self.pointsY[self.filled:self.filled + room] = y[:room]
+            self.filled += room
+            if self.filled == k:
+                self.weight = math.exp(math.log(rng.random()) / k)
+                self.nextIndex = start + room - 1 + self._skip(rng)
+        while self.filled == k and self.nextIndex < end:
+            slot = rng.integers(k)
+            self.pointsX[slot] = x[self.nextIndex - start]
+            self.pointsY[slot] = y[self.nextIndex - start]
+            self.weight *= math.exp(math.log(rng.random()) / k)
+            self.nextIndex += self._skip(rng)
+        self.seen = end
+
+    def _skip(self, rng):
+        return int(math.floor(math.log(rng.random()) / math.log(1 - self.weight))) + 1
+
+    def _drawFrame(self, hits, total):
+        pen = self.pen
+        pen.clear()
+        pointsX = self.pointsX[:self.filled]
+        pointsY = self.pointsY[:self.filled]
+        inside = pointsX * pointsX + pointsY * pointsY <= 1.0
+        for px, py, isInside in zip((pointsX * self.r).tolist(),
+                                    (pointsY * self.r).tolist(), inside.tolist()):
+            pen.goto(px, py)
+            pen.dot(self.dotSize, 'red' if isInside else 'green')
+        pi, low, high = estimatePi(hits, total)
+        pen.goto(0, -30)
+        pen.write('points={:,}  pi={:.6f}  (95% {:.6f} ~ {:.6f})'.format(total, pi, low, high))
+        self.screen.update()
+        self.frames += 1
+
+    # samples 개의 점을 던지며 frameSeconds 마다 화면을 갱신한다. 반환값: (hits, 추정값, 아래, 위)
+    def run(self, samples, seed=None, blockSize=BLOCK_SIZE):
+        self.screen.tracer(0)
+        self.pen.hideturtle()
+        self.pen.penup()
+        rng = np.random.default_rng(seed)
+        hits = 0
+        total = 0
+        lastFrame = perf_counter()
+        for x, y in sampleBlocks(rng, samples, blockSize):
+            self._keepSample(rng, x, y)  # countInside 가 x, y 를 덮어쓰기 전에
+            hits += countInside(x, y)
+            total += len(x)
+            if perf_counter() - lastFrame >= self.frameSeconds:
+                self._drawFrame(hits, total)
+                lastFrame = perf_counter()
+        self._drawFrame(hits, total)
+        return (hits,) + estimatePi(hits, total)
@@ -0,0 +1,81 @@
+# 몬테카를로 방법으로 원주율(π)을 구하는 계산 엔진입니다 (turtle 그리기와 분리).
+# monteCalroPi.py 는 점을 하나씩 randint 로 뽑고 점마다 sqrt 를 계산하고 turtle 을 움직입니다.
+# 여기서는
+#   - [0, 1) 실수 좌표를 큰 블록 단위로 numpy 로 한번에 만들고 (정수 좌표는 원 경계에 몰려서 치우침)
+#   - x*x + y*y <= 1 인 점의 개수를 배열 연산으로 세고 (sqrt 필요 없음)
+#   - 블록마다 지금까지의 추정값과 신뢰구간을 돌려줍니다.
+# 메모리는 블록 크기에만 비례하므로 10^9 개의 점도 처리할 수 있습니다.
+#
+# 사분원 안에 들어갈 확률 p = π/4, 추정값 = 4 * hits / total,
+# 표준오차 = 4 * sqrt(p (1 - p) / total)
+
+import sys
+import math
+from time import perf_counter
+
+import numpy as np
+
+BLOCK_SIZE = 1 << 20  # 한번에 만드는 점의 수
+Z_95 = 1.959963984540054  # 95% 신뢰구간
+
+
+# [0, 1) x [0, 1) 의 점을 blockSize 개씩 (x, y) 배열로 돌려준다. 마지막 블록은 더 작을 수 있다.
+def sampleBlocks(rng, samples, blockSize=BLOCK_SIZE):
+    done = 0
+    while done < samples:
+        size = min(blockSize, samples - done)
+        points = rng.random((2, size))
+        yield points[0], points[1]
+        done += size
+
+
+# 사분원 안(x^2 + y^2 <= 1)에 들어간 점의 수. 메모리를 아끼려고 x, y 배열을 덮어쓴다.
+def countInside(x, y):
+    x *= x
+    y *= y
+    x += y
+    return int(np.count_nonzero(x <= 1.0))
+
+
+# hits / total 로 (추정값, 신뢰구간 아래, 위). 점이 하나도 없으면 (total < 1) ValueError
+def estimatePi(hits, total, z=Z_95):
+    if total < 1:
+        raise ValueError("need at least one sample, got " + str(total))
+    p = hits / total
+    error = 4 * math.sqrt(p * (1 - p) / total) * z
+    return 4 * p, 4 * p - error, 4 * p + error
+
+
+# 블록마다 (지금까지 점 수, 추정값, 신뢰구간 아래, 위)를 돌려준다.
+def streamEstimates(samples, seed=None, blockSize=BLOCK_SIZE):
+    rng = np.random.default_rng(seed)
+    hits = 0
+    total = 0
+    for x, y in sampleBlocks(rng, samples, blockSize):
+        hits += countInside(x, y)
+        total += len(x)
+        yield (total,) + estimatePi(hits, total)
+
+
+# samples 개로 추정한 (hits, 추정값, 신뢰구간 아래, 위)
+def runPi(samples, seed=None, blockSize=BLOCK_SIZE):
+    if samples < 1:
+        raise ValueError("need at least one sample, got " + str(samples))
+    rng = np.random.default_rng(seed)
+    hits = 0
+    for x, y in sampleBlocks(rng, samples, blockSize):
+        hits += countInside(x, y)
+    return (hits,) + estimatePi(hits, samples)
+
+
+# 초당 처리한 점의 수
+def benchmark(samples=10 ** 8, blockSize=BLOCK_SIZE):
+    start = perf_counter()
+    hits, pi, low, high = runPi(samples, 0, blockSize)
+    seconds = perf_counter() - start
+    print('samples={:d}  pi={:.6f}  95% CI=[{:.6f}, {:.6f}]  {:.3f}s  {:.3e} samples/s'.format(
+        samples, pi, low, high, seconds, samples / seconds))
+
+
+if __name__ == "__main__":
+    benchmark(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 8)
@@ -0,0 +1,68 @@
+# 여러 프로세스로 나눠서 원주율을 구하는 몬테카를로 실행기입니다.
+# 전체 점의 수(samples)를 라운드로 나누고, 라운드마다 작업 프로세스 수만큼의 조각(chunk)을
+# 동시에 계산한 뒤 hits 를 더합니다. 조각마다 SeedSequence(seed, spawn_key=(작업번호, 라운드))
+# 로 만든 독립적인 난수열을 쓰므로, seed 와 작업 프로세스 수가 같으면 결과가 비트 단위로 같습니다.
+# tol 을 주면 라운드가 끝날 때마다 95% 신뢰구간의 절반 폭이 tol 이하인지 보고 일찍 멈춥니다.
+
+import os
+import sys
+from multiprocessing import Pool
+from time import perf_counter
+
+import numpy as np
+
+from monteCalroEngine import BLOCK_SIZE, sampleBlocks, countInside, estimatePi
+
+CHUNK_SAMPLES = 1 << 24  # 작업 프로세스 하나가 한 라운드에 처리하는 점의 수
+
+
+def _countChunk(args):
+    entropy, spawnKey, samples = args
+    rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=spawnKey))
+    hits = 0
+    for x, y in sampleBlocks(rng, samples, BLOCK_SIZE):
+        hits += countInside(x, y)
+    return hits
+
+
+# 반환값: (hits, 사용한 점의 수, 추정값, 신뢰구간 아래, 위)
+def parallelPi(samples, seed=None, workers=None, tol=None, chunkSamples=CHUNK_SAMPLES):
+    if samples < 1:
+        raise ValueError("need at least one sample, got " + str(samples))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    entropy = np.random.SeedSequence(seed).entropy
+    hits = 0
+    total = 0
+    aRound = 0
+    with Pool(workers) as pool:
+        while total < samples:
+            roundSamples = min(chunkSamples * workers, samples - total)
+            tasks = []
+            for worker in range(workers):
+                size = roundSamples * (worker + 1) // workers - roundSamples * worker // workers
+                tasks.append((entropy, (worker, aRound), size))
+            hits += sum(pool.map(_countChunk, tasks))
+            total += roundSamples
+            aRound += 1
+            if tol is not None:
+                pi, low, high = estimatePi(hits, total)
+                if (high - low) / 2 <= tol:
+                    break
+    return (hits, total) + estimatePi(hits, total)
+
+
+# 작업 프로세스 수를 1, 2, 4, ... 코어 수까지 늘리며 초당 처리한 점의 수를 출력한다.
+def benchmark(samples=4 * 10 ** 8, seed=0):
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = perf_counter()
+        hits, total, pi, low, high = parallelPi(samples, seed, workers)
+        seconds = perf_counter() - start
+        print('workers={:3d}  pi={:.8f}  {:.3f}s  {:.3e} samples/s'.format(
+            workers, pi, seconds, total / seconds))
+        workers = workers * 2
+
+
+if __name__ == "__main__":
+    benchmark(int(float(sys.argv[1])) if len(sys.argv) > 1 else 4 * 10 ** 8)
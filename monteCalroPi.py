@@ -2,9 +2,8 @@
 #2023. 4. 6(화)
 
 
+import sys
 from turtle import Turtle
-from random import randint
-from time import sleep
 from math import sqrt
 
 r = 150
@@ -33,18 +32,36 @@ for i in range(100):
   dart_arrow.dot(10, 'red')
 '''
 
-totalDot = 100
-i =0
-while i<totalDot:
-  x = randint(0, r)
-  y = randint(0, r)
-  distance = sqrt(x**2 + y**2)
-  dart_arrow.goto(x, y)
-  if distance <= r:
-    dart_arrow.dot(10, 'red')
+# 점은 monteCalroEngine 에서 [0, 1) 실수 좌표로 만들어 r 배로 늘려서 그린다.
+# (randint(0, r) 정수 좌표는 추정값이 치우친다)
+# 점의 수는 실행할 때 정한다: python monteCalroPi.py [점 수] (기본 100)
+# 점이 많을 때(sampledDisplay, 1000 개 초과)는 monteCalroDisplay 로 화면 갱신을 묶고 일부 점만 그린다.
+# 그리지 않고 점을 아주 많이 (예: 10^7 개) 쓰는 계산은 python monteCalroEngine.py 1e7
+import numpy as np
+from monteCalroEngine import sampleBlocks, estimatePi
+
+totalDot = int(float(sys.argv[1])) if len(sys.argv) > 1 else 100
+if totalDot < 1:
+  sys.exit('점의 수는 1 이상이어야 합니다: ' + str(totalDot))
+sampledDisplay = totalDot > 1000
+
+if sampledDisplay:
+  from monteCalroDisplay import DartDisplay
+  hits, pi, low, high = DartDisplay(dart_arrow, r).run(totalDot)
+  print('점', totalDot, '개로 구한 원주율 =', pi, '(95% 신뢰구간', low, '~', high, ')')
 
-  else:
-    dart_arrow.dot(10, 'green')
-  i = i+1
+else:
+  x, y = next(sampleBlocks(np.random.default_rng(), totalDot))
+  inside = x * x + y * y <= 1.0
+  i =0
+  while i<totalDot:
+    dart_arrow.goto(x[i] * r, y[i] * r)
+    if inside[i]:
+      dart_arrow.dot(10, 'red')
 
+    else:
+      dart_arrow.dot(10, 'green')
+    i = i+1
 
+  pi, low, high = estimatePi(int(inside.sum()), totalDot)
+  print('그린 점', totalDot, '개로 구한 원주율 =', pi, '(95% 신뢰구간', low, '~', high, ')')
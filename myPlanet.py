@@ -1,134 +1,411 @@
 #만든사람 이름과 이 파일에 대해서 간략히 요약 설명해보세요~
 
+# 천체의 값(반지름, 질량, 거리, 위치, 속도)은 BodyStore 의 numpy 배열(struct-of-arrays)에 모아 두고,
+# Planet / Sun 객체는 __slots__ 로 (저장소, 번호)만 가지는 가벼운 창구입니다. SolarSystem 에 넣기 전에는
+# 배열 대신 파이썬 리스트 몇 개(_LooseStore)에 값을 둡니다. turtle 은 만들지 않으므로
+# 화면 없이도 천체를 만들고 계산할 수 있습니다. 화면 그리기는 SolarSystem.addObserver 로 붙이는
+# TurtleRenderer 가 tracer 를 끄고 한 프레임에 한번만 화면을 갱신합니다.
+# 천체가 아주 많으면 객체 없이 SolarSystem.addBodies 로 배열째 넣습니다.
+
+import sys
+from time import perf_counter
+
+import numpy as np
+
+
+# 천체 값을 담는 배열 묶음. 자리가 모자라면 두 배로 늘린다.
+# version 은 천체를 넣거나 창구(moveTo, setXVel ...)로 값을 고칠 때마다 1 씩 늘어난다.
+# 배열을 직접 고쳤으면 touch() 를 불러야 SolarSystem 이 중력 계산을 새 값으로 다시 준비한다.
+class BodyStore(object):
+
+    FIELDS = ('radius', 'mass', 'distance', 'x', 'y', 'vx', 'vy')
+
+    def __init__(self, capacity=16):
+        self.size = 0
+        for field in self.FIELDS:
+            setattr(self, field, np.zeros(capacity))
+        self.names = []
+        self.colors = []
+        self.version = 0
+
+    def touch(self):
+        self.version += 1
+
+    def reserve(self, capacity):
+        if capacity <= len(self.x):
+            return
+        capacity = max(capacity, 2 * len(self.x))
+        for field in self.FIELDS:
+            column = np.zeros(capacity)
+            column[:self.size] = getattr(self, field)[:self.size]
+            setattr(self, field, column)
+
+    # 천체 하나를 넣고 번호를 돌려준다
+    def add(self, name, radius, mass, distance, x, y, vx, vy, color):
+        i = self.size
+        self.reserve(i + 1)
+        self.radius[i] = radius
+        self.mass[i] = mass
+        self.distance[i] = distance
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.names.append(name)
+        self.colors.append(color)
+        self.size = i + 1
+        self.version += 1
+        return i
+
+    # 천체 여러 개를 배열째 넣고 번호 범위를 돌려준다. names, colors 는 None 이면 비워 둔다.
+    def addMany(self, names, radius, mass, distance, x, y, vx, vy, colors):
+        n = len(mass)
+        start = self.size
+        self.reserve(start + n)
+        for field, values in zip(self.FIELDS, (radius, mass, distance, x, y, vx, vy)):
+            getattr(self, field)[start:start + n] = values
+        self.names.extend(names if names is not None else [None] * n)
+        self.colors.extend(colors if colors is not None else [None] * n)
+        self.size = start + n
+        self.version += 1
+        return range(start, start + n)
+
+    # 실제로 쓰는 부분 [0, size) 의 배열
+    def column(self, field):
+        return getattr(self, field)[:self.size]
+
+
+# SolarSystem 에 넣기 전 천체 하나의 값. BodyStore 와 같은 이름의 길이 1 리스트라서
+# 창구(_Body)는 어느 저장소인지 신경쓰지 않는다. numpy 배열을 만들지 않으므로 만들기가 빠르다.
+class _LooseStore(object):
+    __slots__ = BodyStore.FIELDS + ('names', 'colors', 'version')
+
+    def __init__(self, name, radius, mass, distance, x, y, vx, vy, color):
+        self.radius = [radius]
+        self.mass = [mass]
+        self.distance = [distance]
+        self.x = [x]
+        self.y = [y]
+        self.vx = [vx]
+        self.vy = [vy]
+        self.names = [name]
+        self.colors = [color]
+        self.version = 0
+
+
+class _Body(object):
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store, index) :
+        self._store = store
+        self._index = index
+
+    # 다른 저장소(SolarSystem 의 저장소)로 옮긴다
+    def _moveToStore(self, store) :
+        old, i = self._store, self._index
+        self._index = store.add(old.names[i], old.radius[i], old.mass[i], old.distance[i],
+                                old.x[i], old.y[i], old.vx[i], old.vy[i], old.colors[i])
+        self._store = store
 
-from time import sleep
+    def getName(self) :
+        name = self._store.names[self._index]
+        return name if name is not None else 'body' + str(self._index)
 
-class Planet :  # Make planet class
-    def __init__(self, iName, iRad, iM, iDist, iC) :
-        self.__name = iName
-        self.__radius = iRad
-        self.__mass = iM
-        self.__distance = iDist
-        self.__x = self.__distance
-        self.__y = 0
-        self.__color = iC
-        
+    def getRadius(self) :
+        return float(self._store.radius[self._index])
 
-        self.__pTurtle = turtle.Turtle()
+    def getMass(self) :
+        return float(self._store.mass[self._index])
 
-        self.__pTurtle.color(self.__color)
-        self.__pTurtle.shape("circle")
+    def getColor(self) :
+        return self._store.colors[self._index]
 
-        self.__pTurtle.up()
-        self.__pTurtle.goto(self.__x, self.__y)
-        self.__pTurtle.down()
+    def getXPos(self) :
+        return float(self._store.x[self._index])
 
-    def getName(self) :
-         return self.__name
+    def getYPos(self) :
+        return float(self._store.y[self._index])
 
-    def getRadius(self) :
-         return self.__radius
+    def getXVel(self) :
+        return float(self._store.vx[self._index])
 
-    def getMass(self) :
-         return self.__mass
+    def getYVel(self) :
+        return float(self._store.vy[self._index])
+
+    def moveTo(self, newX, newY) :
+        self._store.x[self._index] = newX
+        self._store.y[self._index] = newY
+        self._store.version += 1
+
+    def __str__(self) :
+        return self.getName()
+
+
+class Planet(_Body) :  # Make planet class
+    __slots__ = ()
+
+    def __init__(self, iName, iRad, iM, iDist, iC, iVx=0.0, iVy=0.0) :
+        _Body.__init__(self, _LooseStore(iName, iRad, iM, iDist, iDist, 0, iVx, iVy, iC), 0)
 
     def getDistance(self) :
-         return self.__distance
+         return float(self._store.distance[self._index])
 
     def getVolume(self) :
          import math
-         v = 4/3 * math.pi *self.__radius**3
+         v = 4/3 * math.pi *self.getRadius()**3
          return v
 
     def getSurfaceArea(self) :
          import math
-         sa = 4 * math.pi * self.__radius**2
+         sa = 4 * math.pi * self.getRadius()**2
+         return sa
 
     def getDensity(self) :
-         d = self.__mass / self.getVolume()
+         d = self.getMass() / self.getVolume()
          return d
 
     def setName(self, newName) :
-        self.__name = newName
+        self._store.names[self._index] = newName
 
-    def __str__(self) :
-        return self.__name
+    def setXVel(self, newVx) :
+        self._store.vx[self._index] = newVx
+        self._store.version += 1
+
+    def setYVel(self, newVy) :
+        self._store.vy[self._index] = newVy
+        self._store.version += 1
 
     def __lt__(self, otherPlanet) :
-        return self.__distance < otherPlanet.__distance
+        return self.getDistance() < otherPlanet.getDistance()
 
     def __gt__(self, otherPlanet) :
-        return self.__distance > otherPlanet.__distance
+        return self.getDistance() > otherPlanet.getDistance()
 
-    def getXPos(self) :
-        return self.__x
 
-    def getYPos(self) :
-        return self.__y
+class Sun(_Body) : # Make sun class
+    __slots__ = ('__temp',)
 
-class Sun : # Make sun class
     def __init__(self, iName, iRad, iM, iTemp) :
-       self.__name = iName
-       self.__radius = iRad
-       self.__mass = iM
-       self.__temp = iTemp
-       self.__x = 0
-       self.__y = 0
+        _Body.__init__(self, _LooseStore(iName, iRad, iM, 0, 0, 0, 0, 0, "orange"), 0)
+        self.__temp = iTemp
 
-       self.__sTurtle = turtle.Turtle()
-       self.__sTurtle.shape("circle")
-       self.__sTurtle.color("orange")
-
-    def getMass(self) :
-        return self.__mass
+    def getTemperature(self) :
+        return self.__temp
 
-    def __str__(self) :
-        return self.__name
-    def getXPos(self) :
-        return self.__x
 
-    def getYPos(self) :
-        return self.__y
-    
 class SolarSystem : # Make solar class
-    def __init__(self,width, height) : # make constructor 
+    def __init__(self,width, height) : # make constructor
+        self.__width = width
+        self.__height = height
         self.__theSun = None
         self.__planets = []
-        self.__ssTurtle = turtle.Turtle()
-        self.__ssTurtle.hideturtle()
-        self.__ssScreen = turtle.Screen()
-        self.__ssScreen.setworldcoordinates(-width/2.0, -height/2.0, width/2.0, height/2.0)
+        self.__store = BodyStore()
+        self.__engine = None
+        self.__engineVersion = None  # 엔진을 만들 때의 저장소 version
+        self.__engineSettings = {}
+        self.__observers = []
 
     def addPlanet(self, aPlanet) :
+        aPlanet._moveToStore(self.__store)
         self.__planets.append(aPlanet)
 
     def addSun(self, aSun) :
+        aSun._moveToStore(self.__store)
         self. __theSun = aSun
 
-    def showPlanets(self) :
-        for aPlanet in self.__planets:
-            print(aPlanet)
+    # 객체를 만들지 않고 천체를 배열째 넣는다. 반환값: 번호 범위
+    def addBodies(self, radius, mass, x, y, vx, vy, names=None, colors=None) :
+        distance = np.hypot(x, y)
+        return self.__store.addMany(names, radius, mass, distance, x, y, vx, vy, colors)
 
-    def freeze(self) :
-        self.__ssScreen.exitonclick()
+    def getStore(self) :
+        return self.__store
 
- 
-import turtle
-ss = SolarSystem(2, 2)
+    def getSize(self) :
+        return (self.__width, self.__height)
 
-sun = Sun("Sun", 5000, 10, 5800)
-ss.addSun(sun)
+    def getSun(self) :
+        return self.__theSun
 
-m = Planet("Mercury", 19.5, 1000, .25, "sky blue")
-ss.addPlanet(m)
+    # 번호 index 천체의 Planet 창구 (addBodies 로 넣은 천체도)
+    def getBody(self, index) :
+        body = Planet.__new__(Planet)
+        _Body.__init__(body, self.__store, index)
+        return body
 
-m = Planet("Earth", 47.5, 5000, 0.3, "blue")
-ss.addPlanet(m)
+    def showPlanets(self) :
+        for aPlanet in self.__planets:
+            print(aPlanet)
 
-m = Planet("Mars", 50, 9000, 0.5, "red")
-ss.addPlanet(m)
+    # observer.attach(solarSystem) 를 한번, 천체가 움직일 때마다 observer.update(solarSystem) 를 부른다
+    def addObserver(self, observer) :
+        self.__observers.append(observer)
+        observer.attach(self)
 
-m = Planet("Jupiter", 100, 49000, 0.7, "brown")
-ss.addPlanet(m)
+    def freeze(self) :
+        for observer in self.__observers:
+            observer.freeze()
+
+    # 저장소의 위치, 속도, 질량 배열을 nBodyEngine 으로 넘겨서 중력 계산을 준비한다.
+    # 엔진은 배열을 복사해 가므로, 그 뒤에 천체를 넣거나 값을 고치면 movePlanets 가 다시 준비한다.
+    # mode 는 'direct' 또는 'barnes-hut', planetsAttract=False 면 태양만 다른 천체를 끌어당긴다.
+    def setupEngine(self, G=0.1, dt=0.001, mode='direct', theta=0.5, softening=0.0, planetsAttract=True,
+                    trackEnergy=True) :
+        from nBodyEngine import NBodyEngine
+
+        self.__engineSettings = dict(G=G, dt=dt, mode=mode, theta=theta, softening=softening,
+                                     planetsAttract=planetsAttract, trackEnergy=trackEnergy)
+        store = self.__store
+        mass = store.column('mass')
+        if planetsAttract:
+            sourceMass = mass
+        else:
+            sourceMass = np.zeros(store.size)
+            if self.__theSun is not None:
+                sourceMass[self.__theSun._index] = mass[self.__theSun._index]
+        self.__engine = NBodyEngine(store.column('x'), store.column('y'), store.column('vx'),
+                                    store.column('vy'), mass, G, dt, mode, theta, softening, sourceMass,
+                                    trackEnergy)
+        self.__engineVersion = store.version
+
+    # steps 단계 움직이고 새 위치와 속도를 저장소에 적는다.
+    def movePlanets(self, steps=1) :
+        store = self.__store
+        if self.__engine is None or self.__engineVersion != store.version:
+            self.setupEngine(**self.__engineSettings)
+        engine = self.__engine
+        engine.step(steps)
+        store.column('x')[:] = engine.x
+        store.column('y')[:] = engine.y
+        store.column('vx')[:] = engine.vx
+        store.column('vy')[:] = engine.vy
+        for observer in self.__observers:
+            observer.update(self)
+
+    def getEnergyDrift(self) :
+        return self.__engine.energyDrift()
+
+
+# SolarSystem 을 turtle 로 그리는 observer.
+# 천체가 maxTurtles 개 이하면 천체마다 turtle 하나(지나간 자리를 그림),
+# 더 많으면 펜 하나로 고르게 고른 maxDots 개의 점만 찍는다. 어느 쪽이든 tracer 를 끄고 한번에 갱신한다.
+class TurtleRenderer(object):
+
+    def __init__(self, maxTurtles=100, maxDots=2000, dotSize=4) :
+        self.maxTurtles = maxTurtles
+        self.maxDots = maxDots
+        self.dotSize = dotSize
+        self.turtles = []
+        self.pen = None
+
+    def attach(self, solarSystem) :
+        import turtle
+
+        self.turtle = turtle
+        width, height = solarSystem.getSize()
+        self.screen = turtle.Screen()
+        self.screen.setworldcoordinates(-width/2.0, -height/2.0, width/2.0, height/2.0)
+        self.screen.tracer(0)
+        self.update(solarSystem)
+
+    def update(self, solarSystem) :
+        store = solarSystem.getStore()
+        x = store.column('x')
+        y = store.column('y')
+        if store.size <= self.maxTurtles:
+            while len(self.turtles) < store.size:
+                i = len(self.turtles)
+                t = self.turtle.Turtle()
+                t.color(store.colors[i] or "black")
+                t.shape("circle")
+                t.up()
+                t.goto(x[i], y[i])
+                t.down()
+                self.turtles.append(t)
+            for t, px, py in zip(self.turtles, x.tolist(), y.tolist()):
+                t.goto(px, py)
+        else:
+            if self.pen is None:
+                self.pen = self.turtle.Turtle()
+                self.pen.hideturtle()
+                self.pen.up()
+            self.pen.clear()
+            every = max(1, store.size // self.maxDots)
+            for i in range(0, store.size, every):
+                self.pen.goto(x[i], y[i])
+                self.pen.dot(self.dotSize, store.colors[i] or "black")
+        self.screen.update()
 
-ss.freeze()
+    def freeze(self) :
+        self.screen.update()
+        self.screen.exitonclick()
+
+
+# 화면 없이 n 개의 천체를 만들고 steps 단계 계산하는 시간과 메모리를 출력한다.
+# 태양만 끌어당기는 모델(direct)과 모든 천체가 서로 끌어당기는 모델(barnes-hut) 한 단계씩.
+def benchmark(n=10 ** 5, steps=10) :
+    import tracemalloc
+    from nBodyEngine import randomDisk
+
+    # 원궤도 속도는 G * 태양질량 = 0.1 * 10 = 1 로 맞춘다
+    x, y, vx, vy, mass = randomDisk(n, centralMass=1.0)
+    tracemalloc.start()
+    start = perf_counter()
+    ss = SolarSystem(2, 2)
+    ss.addSun(Sun("Sun", 5000, 10, 5800))
+    ss.addBodies(np.full(n, 1.0), mass[1:], x[1:], y[1:], vx[1:], vy[1:])
+    built = perf_counter() - start
+    ss.setupEngine(G=0.1, dt=0.001, planetsAttract=False)
+    ss.movePlanets(steps)
+    seconds = perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('bodies={:d}  build={:.3f}s  build+{:d} steps={:.3f}s  peak memory={:.1f}MB  energy drift={:.2e}'.format(
+        n + 1, built, steps, seconds, peak / 1e6, ss.getEnergyDrift()))
+
+    start = perf_counter()
+    ss.setupEngine(G=0.1, dt=0.001, mode='barnes-hut', trackEnergy=False)
+    ss.movePlanets(1)
+    print('barnes-hut (all bodies attract) 1 step={:.3f}s'.format(perf_counter() - start))
+
+    # 같은 수의 천체를 Planet 객체로 하나씩 만들어 addPlanet 으로 넣는 시간
+    start = perf_counter()
+    ss = SolarSystem(2, 2)
+    ss.addSun(Sun("Sun", 5000, 10, 5800))
+    for px, pvy, pm in zip(x[1:].tolist(), vy[1:].tolist(), mass[1:].tolist()):
+        ss.addPlanet(Planet(None, 1.0, pm, px, "black", 0.0, pvy))
+    print('Planet + addPlanet x {:d}={:.3f}s'.format(n, perf_counter() - start))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == 'benchmark':
+        benchmark(int(float(sys.argv[2])) if len(sys.argv) > 2 else 10 ** 5)
+        sys.exit()
+
+    ss = SolarSystem(2, 2)
+
+    sun = Sun("Sun", 5000, 10, 5800)
+    ss.addSun(sun)
+
+    # 속도는 태양 주위 원궤도 속도 sqrt(G * 태양질량 / 거리) (G = 0.1)
+    m = Planet("Mercury", 19.5, 1000, .25, "sky blue", 0, 2.0)
+    ss.addPlanet(m)
+
+    m = Planet("Earth", 47.5, 5000, 0.3, "blue", 0, 1.826)
+    ss.addPlanet(m)
+
+    m = Planet("Mars", 50, 9000, 0.5, "red", 0, 1.414)
+    ss.addPlanet(m)
+
+    m = Planet("Jupiter", 100, 49000, 0.7, "brown", 0, 1.195)
+    ss.addPlanet(m)
+
+    ss.addObserver(TurtleRenderer())
+
+    # 행성 질량이 태양보다 커서 행성끼리 끌어당기면 궤도가 바로 깨지므로 태양만 끌어당기게 한다
+    ss.setupEngine(G=0.1, dt=0.001, planetsAttract=False)
+    for i in range(2000):
+        ss.movePlanets()
+    print('energy drift =', ss.getEnergyDrift())
+
+    ss.freeze()
@@ -0,0 +1,285 @@
+# myPlanet.SolarSystem 에서 쓰는 N 체 중력 시뮬레이션 엔진입니다 (2차원).
+# 천체의 위치, 속도, 질량을 numpy 배열(x, y, vx, vy, mass)로 두고
+#   - 'direct'      : 모든 쌍의 중력을 배열 연산으로 한번에 계산 (블록 단위, O(N^2))
+#   - 'barnes-hut'  : 사분트리(quadtree)로 멀리 있는 천체 묶음을 질량중심 하나로 계산 (O(N log N))
+# 으로 가속도를 구하고, leapfrog(kick-drift-kick) 적분으로 시간을 진행합니다.
+# leapfrog 는 symplectic 이라 오래 돌려도 에너지가 한쪽으로 새지 않으므로 energyDrift 로 확인합니다.
+#
+# Barnes-Hut 트리는 Morton 코드로 천체를 정렬해서 만든 층(level)별 배열이고, 트리 탐색도
+# (천체, 노드) 쌍 배열을 한 층씩 내려가며 한번에 처리하므로 파이썬 반복은 층의 수만큼만 합니다.
+#
+# sourceMass 는 중력을 만드는 질량입니다. 0 으로 두면 중력을 받기만 하는 천체(test particle)가 되어
+# 태양만 행성을 끌어당기는 모델(행성끼리의 인력 무시)도 같은 엔진으로 계산할 수 있습니다.
+
+import sys
+import math
+from time import perf_counter
+
+import numpy as np
+
+MODES = ('direct', 'barnes-hut')
+BLOCK_ROWS = 1024  # direct 계산에서 한번에 처리하는 천체 수 (메모리 = BLOCK_ROWS * N)
+MAX_DEPTH = 16     # 트리 깊이 (Morton 코드 좌표 16 비트)
+LEAF_SIZE = 8      # 천체가 이 수 이하인 노드는 더 나누지 않고 직접 계산
+
+
+# 중력의 근원(sx, sy, sm) 이 점 (x, y) 에 만드는 가속도. 같은 위치(거리 0)의 쌍은 자기 자신이므로 뺀다.
+def _pairAccelerations(dx, dy, sm, G, softening):
+    d2 = dx * dx + dy * dy
+    inv = np.zeros_like(d2)
+    np.power(d2 + softening * softening, -1.5, out=inv, where=d2 > 0)
+    inv *= G * sm
+    return dx * inv, dy * inv
+
+
+def directAccelerations(x, y, sx, sy, sm, G=1.0, softening=0.0, blockRows=BLOCK_ROWS):
+    ax = np.empty(len(x))
+    ay = np.empty(len(x))
+    for start in range(0, len(x), blockRows):
+        end = min(start + blockRows, len(x))
+        dx = sx[None, :] - x[start:end, None]
+        dy = sy[None, :] - y[start:end, None]
+        px, py = _pairAccelerations(dx, dy, sm[None, :], G, softening)
+        ax[start:end] = px.sum(axis=1)
+        ay[start:end] = py.sum(axis=1)
+    return ax, ay
+
+
+# 16 비트 정수의 비트 사이사이에 0 을 끼워 넣는다 (Morton 코드용)
+def _spreadBits(v):
+    v = v & 0xFFFF
+    v = (v | (v << 8)) & 0x00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F
+    v = (v | (v << 2)) & 0x33333333
+    v = (v | (v << 1)) & 0x55555555
+    return v
+
+
+# 정렬된 구간들 [starts, ends) 를 이어 붙인 번호 배열과, 각 번호가 몇 번째 구간에서 왔는지
+def _expandRanges(starts, ends):
+    counts = ends - starts
+    owner = np.repeat(np.arange(len(starts)), counts)
+    offsets = np.cumsum(counts) - counts
+    return np.arange(counts.sum()) - np.repeat(offsets - starts, counts), owner
+
+
+class QuadTree(object):
+
+    # 중력의 근원 천체(sx, sy, sm, sm > 0)로 층별 노드 배열을 만든다.
+    # 층 l 의 노드 i: 정렬된 천체 구간 [start, end), 질량 mass, 질량중심 (cx, cy),
+    # 다음 층 자식 노드 구간 [childStart, childEnd), 한 변의 길이 = rootSize / 2^l
+    def __init__(self, sx, sy, sm, leafSize=LEAF_SIZE, maxDepth=MAX_DEPTH):
+        minX, minY = sx.min(), sy.min()
+        self.rootSize = max(sx.max() - minX, sy.max() - minY) * (1 + 1e-9) or 1.0
+        scale = (1 << maxDepth) / self.rootSize
+        ix = np.minimum((sx - minX) * scale, (1 << maxDepth) - 1).astype(np.int64)
+        iy = np.minimum((sy - minY) * scale, (1 << maxDepth) - 1).astype(np.int64)
+        codes = _spreadBits(ix) | (_spreadBits(iy) << 1)
+        order = np.argsort(codes, kind='stable')
+        codes = codes[order]
+        self.x = sx[order]
+        self.y = sy[order]
+        self.m = sm[order]
+        # 구간 [start, end) 합을 reduceat 으로 구하려고 끝에 0 을 하나 붙인다 (end == n 인 구간)
+        padM = np.append(self.m, 0.0)
+        padX = np.append(self.x * self.m, 0.0)
+        padY = np.append(self.y * self.m, 0.0)
+
+        self.levels = []
+        n = len(codes)
+        level = 0
+        starts = np.zeros(1, dtype=np.int64)
+        ends = np.array([n], dtype=np.int64)
+        while True:
+            bounds = np.empty(2 * len(starts), dtype=np.int64)
+            bounds[0::2] = starts
+            bounds[1::2] = ends
+            mass = np.add.reduceat(padM, bounds)[0::2]
+            cx = np.add.reduceat(padX, bounds)[0::2] / mass
+            cy = np.add.reduceat(padY, bounds)[0::2] / mass
+            # 천체가 하나인 노드는 질량중심이 그 천체 위치와 정확히 같아야 자기 자신을 뺄 수 있다
+            single = ends - starts == 1
+            cx[single] = self.x[starts[single]]
+            cy[single] = self.y[starts[single]]
+            node = {'start': starts, 'end': ends, 'mass': mass, 'cx': cx, 'cy': cy,
+                    'size': self.rootSize / (1 << level)}
+            self.levels.append(node)
+            split = ends - starts > leafSize
+            if level == maxDepth or not split.any():
+                node['leaf'] = np.ones(len(starts), dtype=bool)
+                break
+            node['leaf'] = ~split
+            # 다음 층: 나눌 노드들의 천체 구간 안에서 코드의 윗부분이 바뀌는 곳이 자식의 시작
+            level += 1
+            index, owner = _expandRanges(starts[split], ends[split])
+            keys = codes[index] >> (2 * (maxDepth - level))
+            first = np.ones(len(index), dtype=bool)
+            first[1:] = (keys[1:] != keys[:-1]) | (owner[1:] != owner[:-1])
+            childStarts = index[first]
+            last = np.append(np.flatnonzero(first)[1:], len(index)) - 1
+            childEnds = index[last] + 1
+            node['childStart'] = np.searchsorted(childStarts, starts)
+            node['childEnd'] = np.searchsorted(childStarts, ends)
+            starts, ends = childStarts, childEnds
+
+    # 점들 (x, y) 에서의 가속도. theta 가 작을수록 정확하고 느리다.
+    def accelerations(self, x, y, G=1.0, softening=0.0, theta=0.5):
+        n = len(x)
+        ax = np.zeros(n)
+        ay = np.zeros(n)
+        targets = np.arange(n)
+        nodes = np.zeros(n, dtype=np.int64)
+        theta2 = theta * theta
+        for node in self.levels:
+            if len(targets) == 0:
+                break
+            dx = node['cx'][nodes] - x[targets]
+            dy = node['cy'][nodes] - y[targets]
+            count = node['end'][nodes] - node['start'][nodes]
+            far = (node['size'] * node['size'] < theta2 * (dx * dx + dy * dy)) | (count == 1)
+            # 충분히 멀거나 천체가 하나뿐인 노드: 질량중심 하나로 계산
+            px, py = _pairAccelerations(dx[far], dy[far], node['mass'][nodes[far]], G, softening)
+            ax += np.bincount(targets[far], px, n)
+            ay += np.bincount(targets[far], py, n)
+            # 가까운 잎 노드: 안의 천체와 하나씩 계산
+            leaf = ~far & node['leaf'][nodes]
+            if leaf.any():
+                leafNodes = nodes[leaf]
+                index, owner = _expandRanges(node['start'][leafNodes], node['end'][leafNodes])
+                who = targets[leaf][owner]
+                px, py = _pairAccelerations(self.x[index] - x[who], self.y[index] - y[who],
+                                            self.m[index], G, softening)
+                ax += np.bincount(who, px, n)
+                ay += np.bincount(who, py, n)
+            # 나머지는 자식 노드로 내려간다
+            inner = ~far & ~leaf
+            if not inner.any():
+                break
+            innerNodes = nodes[inner]
+            nodes, owner = _expandRanges(node['childStart'][innerNodes], node['childEnd'][innerNodes])
+            targets = targets[inner][owner]
+        return ax, ay
+
+
+# 위치에서의 중력 퍼텐셜 에너지 합: U = sum_i m_i phi_i - 1/2 sum_i s_i phi_i
+# (phi_i = -sum_j G s_j / r_ij, 근원끼리의 쌍은 한번만, test particle 과 근원의 쌍은 그대로 센다)
+def potentialEnergy(x, y, mass, sourceMass, G=1.0, softening=0.0, blockRows=BLOCK_ROWS):
+    src = sourceMass > 0
+    sx, sy, sm = x[src], y[src], sourceMass[src]
+    total = 0.0
+    for start in range(0, len(x), blockRows):
+        end = min(start + blockRows, len(x))
+        dx = sx[None, :] - x[start:end, None]
+        dy = sy[None, :] - y[start:end, None]
+        d2 = dx * dx + dy * dy
+        inv = np.zeros_like(d2)
+        np.power(d2 + softening * softening, -0.5, out=inv, where=d2 > 0)
+        phi = -G * (inv * sm[None, :]).sum(axis=1)
+        total += float(np.dot(mass[start:end] - 0.5 * sourceMass[start:end], phi))
+    return total
+
+
+class NBodyEngine(object):
+
+    # trackEnergy=False 면 처음 에너지를 계산하지 않는다 (에너지 계산은 근원 수 * N 이라
+    # 모든 천체가 서로 끌어당기는 아주 큰 계에서는 한 단계 계산보다 훨씬 오래 걸린다)
+    def __init__(self, x, y, vx, vy, mass, G=1.0, dt=0.01, mode='direct', theta=0.5,
+                 softening=0.0, sourceMass=None, trackEnergy=True):
+        if mode not in MODES:
+            raise ValueError("unknown mode: " + str(mode))
+        self.x = np.array(x, dtype=np.float64)
+        self.y = np.array(y, dtype=np.float64)
+        self.vx = np.array(vx, dtype=np.float64)
+        self.vy = np.array(vy, dtype=np.float64)
+        self.mass = np.array(mass, dtype=np.float64)
+        self.sourceMass = self.mass.copy() if sourceMass is None else np.array(sourceMass, dtype=np.float64)
+        self.G = G
+        self.dt = dt
+        self.mode = mode
+        self.theta = theta
+        self.softening = softening
+        self.time = 0.0
+        self.steps = 0
+        self.ax, self.ay = self.accelerations()
+        self.initialEnergy = self.energy() if trackEnergy else None
+        self.energyHistory = []
+
+    def accelerations(self):
+        src = self.sourceMass > 0
+        if not src.any():
+            return np.zeros(len(self.x)), np.zeros(len(self.x))
+        if self.mode == 'direct':
+            return directAccelerations(self.x, self.y, self.x[src], self.y[src],
+                                       self.sourceMass[src], self.G, self.softening)
+        tree = QuadTree(self.x[src], self.y[src], self.sourceMass[src])
+        return tree.accelerations(self.x, self.y, self.G, self.softening, self.theta)
+
+    def kineticEnergy(self):
+        return 0.5 * float(np.dot(self.mass, self.vx * self.vx + self.vy * self.vy))
+
+    def energy(self):
+        return self.kineticEnergy() + potentialEnergy(self.x, self.y, self.mass, self.sourceMass,
+                                                      self.G, self.softening)
+
+    # 처음 에너지 대비 지금 에너지의 상대 오차
+    def energyDrift(self):
+        if self.initialEnergy is None:
+            raise ValueError("engine was created with trackEnergy=False")
+        return abs(self.energy() - self.initialEnergy) / (abs(self.initialEnergy) or 1.0)
+
+    # leapfrog (kick-drift-kick) 으로 steps 단계 진행한다.
+    # energyEvery 를 주면 그 단계마다 (시간, energyDrift) 를 energyHistory 에 기록한다.
+    def step(self, steps=1, energyEvery=None):
+        halfDt = 0.5 * self.dt
+        for i in range(steps):
+            self.vx += halfDt * self.ax
+            self.vy += halfDt * self.ay
+            self.x += self.dt * self.vx
+            self.y += self.dt * self.vy
+            self.ax, self.ay = self.accelerations()
+            self.vx += halfDt * self.ax
+            self.vy += halfDt * self.ay
+            self.time += self.dt
+            self.steps += 1
+            if energyEvery and self.steps % energyEvery == 0:
+                self.energyHistory.append((self.time, self.energyDrift()))
+
+
+# 중심 질량 주위 원반에 n 개의 천체를 원궤도 속도로 뿌린다.
+def randomDisk(n, seed=0, centralMass=1.0, bodyMass=None):
+    rng = np.random.default_rng(seed)
+    r = np.sqrt(rng.uniform(0.01, 1.0, n))
+    angle = rng.uniform(0, 2 * math.pi, n)
+    if bodyMass is None:
+        bodyMass = 0.1 / n
+    mass = np.full(n, bodyMass)
+    x, y = r * np.cos(angle), r * np.sin(angle)
+    speed = np.sqrt((centralMass + bodyMass * n * r * r) / r)
+    vx, vy = -speed * np.sin(angle), speed * np.cos(angle)
+    return (np.append(0.0, x), np.append(0.0, y), np.append(0.0, vx), np.append(0.0, vy),
+            np.append(centralMass, mass))
+
+
+# direct 와 barnes-hut 의 한 단계 시간, 가속도 오차, 에너지 오차를 비교한다.
+def benchmark(n=5000, steps=10, theta=0.5, dt=1e-3, softening=1e-2):
+    x, y, vx, vy, mass = randomDisk(n)
+    results = {}
+    for mode in MODES:
+        engine = NBodyEngine(x, y, vx, vy, mass, dt=dt, mode=mode, theta=theta, softening=softening)
+        start = perf_counter()
+        engine.step(steps)
+        seconds = (perf_counter() - start) / steps
+        results[mode] = engine
+        print('{:10s} bodies={:d}  {:.4f}s/step  {:.1f} steps/s  energy drift={:.2e}'.format(
+            mode, n + 1, seconds, 1 / seconds, engine.energyDrift()))
+
+    ax, ay = directAccelerations(x, y, x, y, mass, 1.0, softening)
+    tree = QuadTree(x, y, mass)
+    bx, by = tree.accelerations(x, y, 1.0, softening, theta)
+    error = np.hypot(bx - ax, by - ay) / np.hypot(ax, ay)
+    print('barnes-hut acceleration error: median={:.2e} max={:.2e}'.format(
+        float(np.median(error)), float(error.max())))
+
+
+if __name__ == "__main__":
+    benchmark(int(float(sys.argv[1])) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,116 @@
+# "이 사람에게서 가장 가까운 policeOffice 는 누구?" 같은 질문을 미리 계산해 두는 색인입니다.
+# findJob.search(name) 은 부를 때마다 BFS 를 처음부터 다시 하지만, 여기서는 직업마다 한번,
+# 그 직업을 가진 모든 사람에서 동시에 출발하는 BFS(multi-source BFS)를 간선을 뒤집은 그래프에서 돌려
+# 모든 사람에 대해 (가장 가까운 그 직업의 사람, 거리)를 저장합니다. 질문은 배열을 한번 읽는 O(1) 입니다.
+#
+#   - 그 직업을 가진 사람 자신은 거리 0, 자기 자신이 답입니다.
+#   - 거리가 같은 사람이 여럿이면 그 중 한 명을 저장합니다.
+#   - addEdge / addJob 으로 친구 관계나 직업이 추가되면 거리가 줄어드는 사람만 다시 계산합니다.
+#     (관계나 직업을 지우는 것은 지원하지 않습니다. 그럴 때는 새로 만드세요.)
+
+from array import array
+from collections import deque
+
+UNREACHABLE = -1
+
+
+class NearestJobIndex(object):
+
+    # store 는 graphStore.GraphStore, jobs 는 색인할 직업 이름 리스트 (없으면 모든 직업)
+    def __init__(self, store, jobs=None):
+        self.names = list(store.names)
+        self.ids = dict(store.ids)
+        self.jobOfNode = [store.jobNames[j] for j in store.jobOf.tolist()]
+        self.reverse = store.reversed()
+        self.extraReverse = {}  # 나중에 추가된 간선: v -> [v 를 친구로 둔 사람 id, ...]
+        self.dist = {}
+        self.nearest = {}
+        if jobs is None:
+            jobs = [job for job in store.jobNames if job != '']
+        for job in jobs:
+            self._build(job)
+
+    # v 를 친구로 둔 사람들 (처음 그래프 + 추가된 간선)
+    def _reverseNeighbors(self, v):
+        if v < self.reverse.numNodes():
+            friends = self.reverse.neighbors(v).tolist()
+        else:
+            friends = []
+        return friends + self.extraReverse.get(v, [])
+
+    def _build(self, job):
+        n = len(self.names)
+        self.dist[job] = array('q', [UNREACHABLE]) * n
+        self.nearest[job] = array('q', [UNREACHABLE]) * n
+        holders = [v for v in range(n) if self.jobOfNode[v] == job]
+        for v in holders:
+            self.dist[job][v] = 0
+            self.nearest[job][v] = v
+        self._relax(job, holders)
+
+    # starts 의 거리가 줄어들었을 때, 그 사람을 친구로 둔 사람들 쪽으로 줄어든 거리를 전파한다.
+    # 처음 만들 때는 모든 직업 보유자에서 시작하는 multi-source BFS 와 같다.
+    def _relax(self, job, starts):
+        dist = self.dist[job]
+        nearest = self.nearest[job]
+        searchQueue = deque(starts)
+        while searchQueue:
+            v = searchQueue.popleft()
+            for u in self._reverseNeighbors(v):
+                if dist[u] == UNREACHABLE or dist[v] + 1 < dist[u]:
+                    dist[u] = dist[v] + 1
+                    nearest[u] = nearest[v]
+                    searchQueue.append(u)
+
+    def _addPerson(self, name):
+        v = self.ids.get(name)
+        if v is None:
+            v = len(self.names)
+            self.ids[name] = v
+            self.names.append(name)
+            self.jobOfNode.append('')
+            for job in self.dist:
+                self.dist[job].append(UNREACHABLE)
+                self.nearest[job].append(UNREACHABLE)
+        return v
+
+    # ---------------- 질문 -----------------------------------------------------#
+
+    # 반환값: (가장 가까운 job 인 사람 이름, 거리). 닿을 수 없으면 (None, -1)
+    def nearestHolder(self, name, job):
+        if job not in self.dist:
+            self._build(job)
+        v = self.ids[name]
+        holder = self.nearest[job][v]
+        if holder == UNREACHABLE:
+            return None, UNREACHABLE
+        return self.names[holder], self.dist[job][v]
+
+    # ---------------- 추가 -----------------------------------------------------#
+
+    # name 의 친구 목록에 friendName 을 추가한다 (없는 사람이면 새로 만든다).
+    def addEdge(self, name, friendName):
+        u = self._addPerson(name)
+        w = self._addPerson(friendName)
+        self.extraReverse.setdefault(w, []).append(u)
+        for job in self.dist:
+            dist = self.dist[job]
+            if dist[w] != UNREACHABLE and (dist[u] == UNREACHABLE or dist[w] + 1 < dist[u]):
+                dist[u] = dist[w] + 1
+                self.nearest[job][u] = self.nearest[job][w]
+                self._relax(job, [u])
+
+    # 직업이 없는 name 의 직업을 job 으로 정한다. (다른 직업으로 바꾸는 것은 지우는 것과 같아서 안 됨)
+    def addJob(self, name, job):
+        v = self._addPerson(name)
+        if self.jobOfNode[v] not in ('', job):
+            raise ValueError(name + " already has job " + self.jobOfNode[v])
+        self.jobOfNode[v] = job
+        if job not in self.dist:
+            self._build(job)
+            return
+        if self.dist[job][v] != 0:
+            self.dist[job][v] = 0
+            self.nearest[job][v] = v
+            self._relax(job, [v])
+
@@ -0,0 +1,29 @@
+#minseokim
+#2023.3.11
+# 요일과 달의 길이는 calendarEngine 이 계산합니다.
+# (예전 이름 calendar.py 는 표준 라이브러리 calendar 를 가려서 같은 폴더의 matplotlib, dateutil 이
+#  동작하지 않았으므로 printCalendar.py 로 바꿨습니다)
+import sys
+
+from calendarEngine import writeCalendar
+from calendarCache import MonthCache
+
+day = 4
+
+month_cache = MonthCache(maxsize=4096)  # 같은 달은 다시 만들지 않는다
+
+month_length = [31,28,31,30,31,30,31,31,30,31,30,31]
+
+key_array = ['January','February','March','April','May'
+             ,'June','July','August','September','October','November','December']
+
+# month 는 달 이름(대소문자 무시) 또는 1 ~ 12
+def print_month(month, year):
+  sys.stdout.write(month_cache.render(month, year))
+
+# start_year ~ end_year 의 모든 달을 한번에 출력
+def print_years(start_year, end_year):
+  writeCalendar(sys.stdout, start_year, end_year)
+
+if __name__ == "__main__":
+  print_month('march', 2024)
@@ -0,0 +1,108 @@
+# quizGame_02 의 문제 은행입니다.
+# quizGame_02 는 q1 ~ q3 를 리스트로 적어 두고 questions.pop(0) 으로 하나씩 꺼내서 (매번 O(n)),
+# 한 사람이 풀면 문제가 없어졌습니다. 여기서는
+#   - 문제를 작은 텍스트 파일(탭으로 나눈 한 줄에 문제 하나)에서 한번만 읽어
+#     열(column)별 리스트와 배열로 두고, 번호(id)와 주제(topic)로 찾을 수 있게 하고
+#   - 사람마다 문제 순서를 섞을 때 목록을 복사하지 않고 (a * k + b) mod n 순열의 두 숫자만 기억합니다.
+#     (a 와 n 이 서로소이면 k = 0 ~ n-1 이 모든 문제를 한번씩 지나감)
+#
+# 파일 형식 (UTF-8, 한 줄에 문제 하나):
+#   id <TAB> topic <TAB> 정답 번호(1 부터) <TAB> 문제 <TAB> 보기1|보기2|...
+
+import math
+import random
+from array import array
+
+FIELD_SEPARATOR = '\t'
+CHOICE_SEPARATOR = '|'
+
+
+class QuestionBank(object):
+
+    def __init__(self):
+        self.ids = []
+        self.topics = []
+        self.texts = []
+        self.choices = []
+        self.answers = array('B')
+        self.rowOf = {}         # id -> 행 번호
+        self.topicRows = {}     # topic -> 행 번호 array('I')
+        self.allRows = array('I')
+
+    def add(self, qid, topic, answer, text, choices):
+        if qid in self.rowOf:
+            raise ValueError("duplicate question id: " + str(qid))
+        if not 1 <= answer <= len(choices):
+            raise ValueError("answer out of range for question " + str(qid))
+        row = len(self.ids)
+        self.ids.append(qid)
+        self.topics.append(topic)
+        self.texts.append(text)
+        self.choices.append(tuple(choices))
+        self.answers.append(answer)
+        self.rowOf[qid] = row
+        self.topicRows.setdefault(topic, array('I')).append(row)
+        self.allRows.append(row)
+        return row
+
+    @classmethod
+    def load(cls, filename):
+        bank = cls()
+        with open(filename, 'r', encoding='utf-8') as bankFile:
+            for line in bankFile:
+                line = line.rstrip('\n')
+                if not line or line.startswith('#'):
+                    continue
+                qid, topic, answer, text, choices = line.split(FIELD_SEPARATOR)
+                bank.add(qid, topic, int(answer), text, choices.split(CHOICE_SEPARATOR))
+        return bank
+
+    def save(self, filename):
+        with open(filename, 'w', encoding='utf-8') as bankFile:
+            for row in range(len(self.ids)):
+                bankFile.write(FIELD_SEPARATOR.join([
+                    self.ids[row], self.topics[row], str(self.answers[row]), self.texts[row],
+                    CHOICE_SEPARATOR.join(self.choices[row])]) + '\n')
+
+    def __len__(self):
+        return len(self.ids)
+
+    # topic 의 행 번호들. 문제가 없는 topic (또는 빈 은행) 이면 ValueError
+    def rows(self, topic=None):
+        rows = self.allRows if topic is None else self.topicRows.get(topic)
+        if not rows:
+            raise ValueError("no questions for topic: " + str(topic))
+        return rows
+
+    def byId(self, qid):
+        return self.rowOf[qid]
+
+    # (문제, 보기) 와 정답 확인
+    def question(self, row):
+        return self.texts[row], self.choices[row]
+
+    def isCorrect(self, row, answer):
+        return self.answers[row] == answer
+
+    # topic 의 문제를 섞는 순열 (a, b). 사람(세션)마다 이 두 숫자만 저장한다.
+    def shuffle(self, topic=None, rng=random):
+        n = len(self.rows(topic))
+        a = rng.randrange(1, n) if n > 1 else 1
+        while math.gcd(a, n) != 1:
+            a = rng.randrange(1, n)
+        return a, rng.randrange(n)
+
+    # 섞은 순서에서 k 번째 문제의 행 번호
+    def rowAt(self, topic, a, b, k):
+        rows = self.rows(topic)
+        return rows[(a * k + b) % len(rows)]
+
+
+# 보기 수 choices 개의 가짜 문제 n 개 (부하 시험용)
+def syntheticBank(n, topics=8, choices=4, seed=0):
+    rng = random.Random(seed)
+    bank = QuestionBank()
+    for i in range(n):
+        bank.add('s{}'.format(i), 'topic{}'.format(i % topics), rng.randint(1, choices),
+                 'Question {}?'.format(i), ['choice {}'.format(c) for c in range(1, choices + 1)])
+    return bank
@@ -0,0 +1,189 @@
+# 여러 사람이 동시에 quizGame_02 를 하는 asyncio 퀴즈 서비스입니다.
+# quizGame_02 는 input() 으로 기다리고 score, gameOver 가 전역 변수라 한 프로세스에 한 사람만 할 수 있었습니다.
+# 여기서는 사람(세션)마다 작은 Session 기록(__slots__: 점수, 몇 번째 문제, 끝났는지, 섞는 순열 a, b)만 두고
+# 문제는 모두 QuestionBank 하나를 같이 씁니다. 답 하나를 처리하는 일은 세션 수와 관계없이 O(1) 입니다.
+#
+# 요청/응답은 dict 입니다.
+#   {'type': 'start', 'name': 이름, 'topic': 주제 또는 None, 'seed': 숫자 또는 None}
+#       -> {'session': 번호, 'id': 문제 id, 'question': 문제, 'choices': 보기}
+#   {'type': 'answer', 'session': 번호, 'answer': 보기 번호(1 부터)}
+#       -> {'correct': bool, 'score': 점수, 'gameOver': bool, 'message': ...,
+#           'id': 다음 문제 id, 'question': 다음 문제 또는 None, 'choices': 보기}
+# 문제가 없는 topic 으로 start 하면 ValueError
+#
+# LocalClient 는 네트워크 대신 같은 프로세스에서 서버를 부르는 클라이언트이고, loadTest 로 동시에
+# 수천 명이 푸는 상황에서 답 하나의 처리 시간을 잽니다. 부하는 open-loop 입니다: 사람마다 평균 thinkSeconds
+# 간격(지수분포)으로 정해 둔 시각에 답을 보내므로, 앞 요청이 늦어져도 다음 요청 시각은 밀리지 않고
+# 그 늦어진 시간까지 지연시간에 들어갑니다. 지연시간(latency)은 이벤트 루프에서 차례를 기다린 시간(wait)과
+# 서버가 답을 처리한 시간(service)으로 나눠서 보고합니다. asyncio 의 타이머는 1ms 단위로 올림해서 깨우므로
+# wait 에는 부하와 관계없이 평균 0.5ms 정도가 들어갑니다.
+
+import sys
+import random
+import asyncio
+from time import perf_counter
+
+from quizBank import syntheticBank
+
+APP_TEXT = {"end message": "GG",
+            "correct message": "Good Cool",
+            "Quiz Empty": "모든 문제를 풀었음"}
+POINTS = 10
+
+
+class Session(object):
+    __slots__ = ('name', 'topic', 'a', 'b', 'position', 'row', 'score', 'gameOver')
+
+    def __init__(self, name, topic, a, b, row):
+        self.name = name
+        self.topic = topic
+        self.a = a
+        self.b = b
+        self.position = 0  # 지금 문제가 섞은 순서에서 몇 번째인지
+        self.row = row
+        self.score = 0
+        self.gameOver = False
+
+
+class QuizServer(object):
+
+    # maxQuestions 를 주면 한 사람이 그 수만큼 풀면 끝난다 (없으면 주제의 모든 문제)
+    def __init__(self, bank, maxQuestions=None):
+        self.bank = bank
+        self.maxQuestions = maxQuestions
+        self.sessions = {}
+        self.nextSession = 0
+        self.peakSessions = 0
+
+    def start(self, name, topic=None, seed=None):
+        rng = random.Random(seed) if seed is not None else random
+        a, b = self.bank.shuffle(topic, rng)
+        session = Session(name, topic, a, b, self.bank.rowAt(topic, a, b, 0))
+        sessionId = self.nextSession
+        self.nextSession += 1
+        self.sessions[sessionId] = session
+        self.peakSessions = max(self.peakSessions, len(self.sessions))
+        text, choices = self.bank.question(session.row)
+        return {'session': sessionId, 'id': self.bank.ids[session.row], 'question': text, 'choices': choices}
+
+    def answer(self, sessionId, answer):
+        session = self.sessions[sessionId]
+        reply = {'correct': self.bank.isCorrect(session.row, answer)}
+        if reply['correct']:
+            session.score += POINTS
+            session.position += 1
+            limit = len(self.bank.rows(session.topic))
+            if self.maxQuestions is not None:
+                limit = min(limit, self.maxQuestions)
+            if session.position >= limit:
+                session.gameOver = True
+                reply['message'] = APP_TEXT["Quiz Empty"]
+            else:
+                reply['message'] = APP_TEXT["correct message"]
+                session.row = self.bank.rowAt(session.topic, session.a, session.b, session.position)
+        else:
+            session.gameOver = True
+            reply['message'] = APP_TEXT["end message"]
+        reply['score'] = session.score
+        reply['gameOver'] = session.gameOver
+        if session.gameOver:
+            del self.sessions[sessionId]  # 끝난 세션은 바로 지운다
+            reply['id'] = reply['question'] = None
+        else:
+            reply['id'] = self.bank.ids[session.row]
+            reply['question'], reply['choices'] = self.bank.question(session.row)
+        return reply
+
+    async def handle(self, message):
+        kind = message['type']
+        if kind == 'start':
+            return self.start(message.get('name'), message.get('topic'), message.get('seed'))
+        if kind == 'answer':
+            return self.answer(message['session'], message['answer'])
+        raise ValueError("unknown message type: " + str(kind))
+
+
+async def _sleepUntil(deadline):
+    delay = deadline - perf_counter()
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+
+# 같은 프로세스의 서버를 부르는 클라이언트. 요청마다 한번 다른 작업에 차례를 넘겨서(네트워크 대신)
+# 여러 클라이언트가 번갈아 실행되게 한다. 답 하나마다 timings 에 모은다.
+#   timings['latency'] : 보내기로 한 시각부터 응답을 받을 때까지
+#   timings['wait']    : 보내기로 한 시각부터 서버가 처리를 시작할 때까지 (이벤트 루프 대기)
+#   timings['service'] : 서버가 처리한 시간
+class LocalClient(object):
+
+    def __init__(self, server, timings):
+        self.server = server
+        self.timings = timings
+
+    # scheduled 는 이 요청을 보내기로 한 시각 (perf_counter 기준, 없으면 지금)
+    async def request(self, message, scheduled=None):
+        if scheduled is None:
+            scheduled = perf_counter()
+        await asyncio.sleep(0)
+        begin = perf_counter()
+        reply = await self.server.handle(message)
+        end = perf_counter()
+        if message['type'] == 'answer':
+            self.timings['latency'].append(end - scheduled)
+            self.timings['wait'].append(begin - scheduled)
+            self.timings['service'].append(end - begin)
+        return reply
+
+    # 한 사람이 끝날 때까지 푼다. 처음은 0 ~ thinkSeconds 사이, 그 다음부터는 평균 thinkSeconds 간격으로
+    # 정해 둔 시각에 답을 보내고, correctRate 확률로 정답을 고른다.
+    # 정답을 아는 가짜 사람이라서 응답의 문제 id 로 answerKey(QuestionBank) 에서 정답을 찾는다.
+    async def play(self, name, topic, rng, correctRate, answerKey, thinkSeconds=0.5):
+        scheduled = perf_counter() + rng.random() * thinkSeconds
+        await _sleepUntil(scheduled)
+        reply = await self.request({'type': 'start', 'name': name, 'topic': topic,
+                                    'seed': rng.randrange(1 << 30)}, scheduled)
+        sessionId = reply['session']
+        while True:
+            answer = answerKey.answers[answerKey.byId(reply['id'])]
+            guess = answer if rng.random() < correctRate else 0
+            scheduled += rng.expovariate(1.0 / thinkSeconds)
+            await _sleepUntil(scheduled)
+            reply = await self.request({'type': 'answer', 'session': sessionId, 'answer': guess}, scheduled)
+            if reply['gameOver']:
+                return reply['score']
+
+
+def _percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))]
+
+
+# players 명이 동시에 푸는 open-loop 부하 시험 (한 사람당 평균 thinkSeconds 마다 답 하나).
+# 반환값: (답의 수, {'latency' | 'wait' | 'service': (중간값, 99%) [s]}, 최대 동시 세션 수)
+async def loadTest(bank, players, correctRate=0.95, maxQuestions=10, seed=0, thinkSeconds=0.5):
+    server = QuizServer(bank, maxQuestions)
+    timings = {'latency': [], 'wait': [], 'service': []}
+    rng = random.Random(seed)
+    topics = list(bank.topicRows)
+    clients = [LocalClient(server, timings).play('player{}'.format(i), rng.choice(topics),
+                                                  random.Random(rng.random()), correctRate, bank, thinkSeconds)
+               for i in range(players)]
+    await asyncio.gather(*clients)
+    summary = dict((name, (_percentile(values, 0.5), _percentile(values, 0.99)))
+                   for name, values in timings.items())
+    return len(timings['latency']), summary, server.peakSessions
+
+
+def benchmark(playerCounts=(100, 1000, 10000), questions=10000, thinkSeconds=0.5):
+    bank = syntheticBank(questions)
+    print('session record = {} bytes'.format(sys.getsizeof(Session('player', 'topic0', 1, 0, 0))))
+    for players in playerCounts:
+        answers, summary, peak = asyncio.run(loadTest(bank, players, thinkSeconds=thinkSeconds))
+        print('players={:6d}  offered={:6.0f}/s  answers={:6d}  peak sessions={:6d}  '.format(
+            players, players / thinkSeconds, answers, peak)
+            + '  '.join('{} p50={:.1f}us p99={:.1f}us'.format(name, p50 * 1e6, p99 * 1e6)
+                        for name, (p50, p99) in summary.items()))
+
+
+if __name__ == "__main__":
+    benchmark(tuple(int(float(n)) for n in sys.argv[1:]) or (100, 1000, 10000))
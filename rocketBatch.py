@@ -0,0 +1,111 @@
+# 로켓 여러 개(N 개)를 배열로 한꺼번에 계산하는 시뮬레이터입니다.
+# rocketSim.moveRocket 은 로켓 하나를 한 단계(dt) 움직이며,
+# 메인 반복문은 rocketA, rocketB 두 개만 다룹니다. 여기서는 N 개 로켓의 (x, y, vx, vy, status) 를
+# numpy 배열로 두고 모든 로켓을 한번에 한 단계씩 움직입니다. y < 0 이 된 로켓은 빼고 계속합니다.
+# 계산 순서가 rocketSim 과 같아서, 같은 입력이면 이동거리가 rocketSim.final_Distance 와 똑같고,
+# 비행시간도 rocketScheduler.printResults 처럼 이동거리 / vx 로 구해서 똑같습니다.
+# (vx 가 0 인 수직 발사는 x / vx 를 구할 수 없으므로 단계 수 * dt)
+#
+#   distance, flightTime, steps = simulateBatch(발사각도 배열, 속도 배열)
+
+import sys
+import math
+from time import perf_counter
+
+import numpy as np
+
+FLYING = 0
+ENDED = 1  # rocketSim 의 status 'simulation end'
+
+
+# rocketSim.calcVxVy_TimeZero 와 같은 방법(math.cos/sin)으로 초기 속도를 구한다.
+# (numpy 의 cos/sin 은 마지막 자리가 다를 수 있어서 rocketSim 과 결과를 똑같이 맞추려고 math 사용)
+def launchVelocities(angles, speeds):
+    angles, speeds = np.broadcast_arrays(np.asarray(angles, dtype=np.float64),
+                                         np.asarray(speeds, dtype=np.float64))
+    pairs = list(zip(angles.ravel().tolist(), speeds.ravel().tolist()))
+    vx = np.array([v * math.cos(math.radians(a)) for a, v in pairs])
+    vy = np.array([v * math.sin(math.radians(a)) for a, v in pairs])
+    return vx, vy
+
+
+class RocketBatch(object):
+
+    def __init__(self, angles, speeds, g=-9.8, dt=0.1):
+        self.g = g
+        self.dt = dt
+        self.vx, self.vy = launchVelocities(angles, speeds)
+        n = len(self.vx)
+        self.x = np.zeros(n)
+        self.y = np.zeros(n)
+        self.status = np.full(n, FLYING, dtype=np.int8)
+        self.steps = np.zeros(n, dtype=np.int64)
+        self.finalDistance = np.zeros(n)
+        self.active = np.arange(n)  # 아직 날고 있는 로켓 번호
+
+    # 날고 있는 모든 로켓을 한 단계 움직인다 (rocketSim.moveRocket 과 같은 식, sleep 없음).
+    def step(self):
+        a = self.active
+        gdt = self.g * self.dt
+        self.vy[a] = self.vy[a] + gdt
+        self.x[a] = self.x[a] + self.vx[a] * self.dt
+        self.y[a] = self.y[a] + self.vy[a] * self.dt
+        self.steps[a] += 1
+
+        # rocketSim.set_finalDistance: y < 0 이 되면 그 때의 x 가 이동거리
+        landed = self.y[a] < 0
+        if landed.any():
+            ended = a[landed]
+            self.finalDistance[ended] = self.x[ended]
+            self.status[ended] = ENDED
+            self.active = a[~landed]
+
+    def run(self, maxSteps=10 ** 7):
+        while len(self.active) and maxSteps > 0:
+            self.step()
+            maxSteps -= 1
+        return self.finalDistance, self.flightTime(), self.steps
+
+    # rocketSim 과 같은 정의의 비행시간 (이동거리 / vx, vx 가 0 이면 단계 수 * dt)
+    def flightTime(self):
+        flightTime = self.steps * self.dt
+        np.divide(self.finalDistance, self.vx, out=flightTime, where=self.vx != 0)
+        return flightTime
+
+
+# 반환값: (이동거리, 비행시간(= 이동거리 / vx), 단계 수) 배열
+def simulateBatch(angles, speeds, g=-9.8, dt=0.1, maxSteps=10 ** 7):
+    return RocketBatch(angles, speeds, g, dt).run(maxSteps)
+
+
+# 같은 입력으로 rocketSim 클래스를 하나씩 돌린 (이동거리, 비행시간) (비교용)
+def simulateScalar(angle, speed, g=-9.8, dt=0.1):
+    from rocketSim import rocketSim
+
+    rocket = rocketSim(g, dt, speed, 'check')
+    rocket.setAngle(angle)
+    while rocket.status != 'simulation end':
+        if rocket.y < 0:
+            rocket.set_finalDistance()
+        else:
+            rocket.moveRocket()
+    return rocket.final_Distance, rocket.x / rocket.vx
+
+
+# 임의의 (발사각도, 속도) n 쌍을 계산하는 시간과, 일부를 rocketSim 과 비교한 결과를 출력한다.
+def benchmark(n=10 ** 6, seed=0):
+    rng = np.random.default_rng(seed)
+    angles = rng.uniform(1, 89, n)
+    speeds = rng.uniform(5, 50, n)
+    start = perf_counter()
+    distance, flightTime, steps = simulateBatch(angles, speeds)
+    seconds = perf_counter() - start
+    print('rockets={:d}  {:.3f}s  max steps={:d}'.format(n, seconds, int(steps.max())))
+
+    check = rng.choice(n, size=200, replace=False)
+    same = all(simulateScalar(angles[i], speeds[i]) == (distance[i], flightTime[i]) for i in check)
+    print('same distance and flight time as rocketSim:', same)
+
+
+if __name__ == "__main__":
+    benchmark(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 6)
@@ -0,0 +1,167 @@
+# rocketSim 의 계산 방법(적분기)을 고를 수 있게 하고, 땅에 닿는 순간을 정확하게 구하는 모듈입니다.
+# rocketSim.moveRocket 은 고정된 dt 로 (속도를 먼저 바꾸고 그 속도로 위치를 바꾸는) semi-implicit Euler 를
+# 쓰고, set_finalDistance 는 y < 0 이 된 첫 단계의 x 를 기록하므로 이동거리가 최대 한 단계만큼 틀립니다.
+# 여기서는
+#   - 'euler'(explicit), 'semi-implicit'(rocketSim 과 같음), 'rk4', 'rk45'(오차에 따라 dt 를 바꿈) 중에서 고르고
+#   - y 가 0 아래로 내려간 단계에서 앞뒤 상태(위치, 속도)로 3차 Hermite 보간을 해서
+#     땅에 닿는 정확한 시간과 위치를 구합니다 (event detection).
+# 그래서 훨씬 적은 단계로 같은 정확도를 얻습니다. 포물선 운동의 정답(해석해)과 비교하는 benchmark 포함.
+
+import math
+from time import perf_counter
+
+METHODS = ('euler', 'semi-implicit', 'rk4', 'rk45')
+
+
+# 상태 = (x, y, vx, vy). 중력만 있으므로 도함수는 (vx, vy, 0, g)
+def derivative(state, g):
+    x, y, vx, vy = state
+    return (vx, vy, 0.0, g)
+
+
+def _add(state, rate, h):
+    return tuple(s + h * r for s, r in zip(state, rate))
+
+
+def stepEuler(state, dt, g):
+    return _add(state, derivative(state, g), dt)
+
+
+# rocketSim.moveRocket 과 같은 순서: vy 를 먼저 바꾸고 바뀐 vy 로 y 를 바꾼다.
+def stepSemiImplicit(state, dt, g):
+    x, y, vx, vy = state
+    vy = vy + g * dt
+    return (x + vx * dt, y + vy * dt, vx, vy)
+
+
+def stepRK4(state, dt, g):
+    k1 = derivative(state, g)
+    k2 = derivative(_add(state, k1, dt / 2), g)
+    k3 = derivative(_add(state, k2, dt / 2), g)
+    k4 = derivative(_add(state, k3, dt), g)
+    return tuple(s + dt / 6 * (a + 2 * b + 2 * c + d)
+                 for s, a, b, c, d in zip(state, k1, k2, k3, k4))
+
+
+# Dormand-Prince 5(4) 계수
+_DP_C = (0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1)
+_DP_A = ((),
+         (1 / 5,),
+         (3 / 40, 9 / 40),
+         (44 / 45, -56 / 15, 32 / 9),
+         (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+         (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+         (35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84))
+_DP_B5 = (35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0)
+_DP_B4 = (5179 / 57600, 0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40)
+
+
+# 5차 결과와 (5차 - 4차) 오차 추정값
+def stepRK45(state, dt, g):
+    stages = []
+    for i in range(7):
+        s = state
+        for a, k in zip(_DP_A[i], stages):
+            s = _add(s, k, dt * a)
+        stages.append(derivative(s, g))
+    new = state
+    error = 0.0
+    for b5, b4, k in zip(_DP_B5, _DP_B4, stages):
+        new = _add(new, k, dt * b5)
+    for i in range(4):
+        error = max(error, abs(dt * sum((b5 - b4) * k[i] for b5, b4, k in zip(_DP_B5, _DP_B4, stages))))
+    return new, error
+
+
+_STEPS = {'euler': stepEuler, 'semi-implicit': stepSemiImplicit, 'rk4': stepRK4}
+
+
+# 단계 시작(s0)과 끝(s1) 사이 [0, h] 에서 위치를 3차 Hermite 보간해서 y = 0 이 되는 t 와 그 때의 x.
+def landing(s0, s1, h):
+    def hermite(p0, v0, p1, v1, t):
+        u = t / h
+        return ((2 * u ** 3 - 3 * u ** 2 + 1) * p0 + (u ** 3 - 2 * u ** 2 + u) * h * v0
+                + (-2 * u ** 3 + 3 * u ** 2) * p1 + (u ** 3 - u ** 2) * h * v1)
+
+    low, high = 0.0, h  # y(low) >= 0, y(high) < 0 : 이분법
+    for i in range(100):
+        mid = (low + high) / 2
+        if mid == low or mid == high:
+            break
+        if hermite(s0[1], s0[3], s1[1], s1[3], mid) >= 0:
+            low = mid
+        else:
+            high = mid
+    return low, hermite(s0[0], s0[2], s1[0], s1[2], low)
+
+
+# 한 로켓을 땅에 닿을 때까지 계산한다.
+# 반환값: (이동거리, 비행시간, 단계 수). exactLanding=False 면 rocketSim 처럼 y < 0 이 된 단계의 x, 시간
+def simulate(angle, speed, g=-9.8, dt=0.1, method='rk4', tol=1e-9, exactLanding=True,
+             maxSteps=10 ** 7):
+    if method not in METHODS:
+        raise ValueError("unknown method: " + str(method))
+    rad = math.radians(angle)
+    state = (0.0, 0.0, speed * math.cos(rad), speed * math.sin(rad))
+    t = 0.0
+    steps = 0
+    h = dt
+    while steps < maxSteps:
+        if method == 'rk45':
+            new, error = stepRK45(state, h, g)
+            if error > tol:  # 오차가 크면 dt 를 줄여서 다시
+                h = h * max(0.2, 0.9 * (tol / error) ** 0.2)
+                continue
+        else:
+            new = _STEPS[method](state, h, g)
+        steps += 1
+        if new[1] < 0:
+            if not exactLanding:
+                return new[0], t + h, steps
+            tHit, xHit = landing(state, new, h)
+            return xHit, t + tHit, steps
+        state = new
+        t += h
+        if method == 'rk45':
+            h = h * (5.0 if error == 0 else min(5.0, 0.9 * (tol / error) ** 0.2))
+    raise RuntimeError("rocket did not land in maxSteps")
+
+
+# 포물선 운동의 정답: (이동거리, 비행시간)
+def analytic(angle, speed, g=-9.8):
+    rad = math.radians(angle)
+    return speed ** 2 * math.sin(2 * rad) / -g, 2 * speed * math.sin(rad) / -g
+
+
+# 방법마다 이동거리 오차가 target 이하가 될 때까지 dt 를 절반씩 줄여 보고,
+# 그 때의 dt, 단계 수, 걸린 시간을 출력한다. maxSteps 안에 target 에 못 미치면 'not reached'
+def benchmark(angle=45.0, speed=10.0, target=1e-6, maxSteps=10 ** 7):
+    exactDistance, exactTime = analytic(angle, speed)
+    print('analytic distance = {:.9f} m, time = {:.9f} s'.format(exactDistance, exactTime))
+    cases = [('semi-implicit', False), ('euler', True), ('semi-implicit', True), ('rk4', True)]
+    for method, exactLanding in cases:
+        dt = 0.5
+        reached = False
+        while exactTime / dt <= maxSteps:
+            start = perf_counter()
+            distance, flightTime, steps = simulate(angle, speed, dt=dt, method=method,
+                                                   exactLanding=exactLanding, maxSteps=maxSteps)
+            seconds = perf_counter() - start
+            runDt = dt
+            if abs(distance - exactDistance) <= target:
+                reached = True
+                break
+            dt = dt / 2
+        print('{:14s} landing={:6s} dt={:.3e} steps={:9d} error={:.2e} {:.4f}s{}'.format(
+            method, 'exact' if exactLanding else 'step', runDt, steps,
+            abs(distance - exactDistance), seconds, '' if reached else '  not reached'))
+
+    start = perf_counter()
+    distance, flightTime, steps = simulate(angle, speed, dt=0.5, method='rk45', tol=target)
+    seconds = perf_counter() - start
+    print('{:14s} landing={:6s} tol={:.1e} steps={:9d} error={:.2e} {:.4f}s'.format(
+        'rk45', 'exact', target, steps, abs(distance - exactDistance), seconds))
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,205 @@
+# rocketSim 로켓들을 움직이는 시뮬레이션 스케줄러입니다.
+# 원래 rocketSim 은 moveRocket 안에서 sleep(dt) 를 하고, 단계마다 print 를 하고,
+# 시작 전에 input() 으로 발사 각도를 물어봐서 화면 없이 빠르게 돌릴 수가 없었습니다. 여기서는
+#   - 'realtime'   : 단계 k 가 시작 시각 + k * dt 에 끝나도록 기다립니다. 기다리는 시각을 매번
+#                    처음 시작 시각에서 계산하므로 print 등으로 늦어져도 오차가 쌓이지 않습니다.
+#   - 'fast'       : 기다리지 않고 CPU 가 허락하는 만큼 빨리 계산합니다 (화면 없이 돌릴 때).
+#   - 'fixed-rate' : 시뮬레이션은 실제 시간에 맞추지만, 화면은 renderHz 로 정해진 횟수만 그립니다.
+#                    dt 가 작아도 단계마다 기다리거나 그리지 않고 한 프레임에 여러 단계를 계산합니다.
+# 단계마다의 위치(telemetry)는 TelemetryBuffer 에 모았다가 한번에 CSV 파일로 씁니다.
+# 발사 각도와 속도는 loadLaunchConfig 로 설정 파일(JSON 또는 CSV)에서 읽습니다.
+#
+#   python rocketScheduler.py rocketLaunch.json fast telemetry.csv
+
+import os
+import sys
+import csv
+import json
+from time import perf_counter, sleep
+
+from rocketSim import rocketSim
+
+MODES = ('realtime', 'fast', 'fixed-rate')
+TELEMETRY_FIELDS = ('t', 'name', 'x', 'y', 'vx', 'vy')
+
+
+# 설정 파일에서 로켓 목록을 만든다.
+#   JSON: [{"name": "대한민국", "angle": 45, "speed": 10}, ...]  (g, dt 는 생략하면 기본값)
+#   CSV : name,angle,speed[,g,dt] 머리줄이 있는 표
+def loadLaunchConfig(filename, g=-9.8, dt=0.1):
+    if os.path.splitext(filename)[1].lower() == '.csv':
+        with open(filename, 'r', newline='', encoding='utf-8') as configFile:
+            entries = list(csv.DictReader(configFile))
+    else:
+        with open(filename, 'r', encoding='utf-8') as configFile:
+            entries = json.load(configFile)
+    rockets = []
+    for entry in entries:
+        # CSV 에서 빈 칸은 '' 이므로 생략한 것으로 본다 (g = 0 은 그대로 0)
+        entryG = entry.get('g')
+        entryDt = entry.get('dt')
+        rocket = rocketSim(g if entryG is None or entryG == '' else float(entryG),
+                           dt if entryDt is None or entryDt == '' else float(entryDt),
+                           float(entry['speed']), entry['name'])
+        rocket.setAngle(float(entry['angle']))
+        rockets.append(rocket)
+    return rockets
+
+
+# telemetry 를 bufferRows 줄씩 모았다가 한번에 파일로 쓴다. filename 이 None 이면 메모리에만 모은다.
+class TelemetryBuffer(object):
+
+    def __init__(self, filename=None, bufferRows=8192):
+        self.filename = filename
+        self.bufferRows = bufferRows
+        self.rows = []
+        self.written = 0
+        self.outFile = None
+        self.writer = None
+        if filename is not None:
+            self.outFile = open(filename, 'w', newline='', encoding='utf-8')
+            self.writer = csv.writer(self.outFile)
+            self.writer.writerow(TELEMETRY_FIELDS)
+
+    def record(self, t, rocket):
+        self.rows.append((t, rocket.name, rocket.x, rocket.y, rocket.vx, rocket.vy))
+        if self.writer is not None and len(self.rows) >= self.bufferRows:
+            self.flush()
+
+    def flush(self):
+        if self.writer is not None and self.rows:
+            self.writer.writerows(self.rows)
+            self.written += len(self.rows)
+            self.rows = []
+
+    def close(self):
+        self.flush()
+        if self.outFile is not None:
+            self.outFile.close()
+            self.outFile = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# 원래 rocketSim 처럼 날고 있는 로켓의 위치를 출력한다 (한 프레임을 한번에 print).
+def printRenderer(t, rockets):
+    lines = [str(rocket) for rocket in rockets if rocket.status != 'simulation end']
+    if lines:
+        print('\n'.join(lines))
+
+
+class SimulationScheduler(object):
+
+    # rockets 는 모두 같은 dt 를 써야 한다 (다르면 ValueError).
+    # renderer(t, rockets) 는 화면을 그리는 함수(None 이면 그리지 않음).
+    # timeScale 은 realtime / fixed-rate 에서 실제 시간 대비 빠르기 (2.0 이면 두 배 빠르게)
+    def __init__(self, rockets, mode='fast', renderer=None, telemetry=None, renderHz=30.0,
+                 timeScale=1.0, clock=perf_counter, sleeper=sleep):
+        if mode not in MODES:
+            raise ValueError("unknown mode: " + str(mode))
+        self.rockets = rockets
+        self.mode = mode
+        self.renderer = renderer
+        self.telemetry = telemetry
+        self.renderHz = renderHz
+        self.timeScale = timeScale
+        self.clock = clock
+        self.sleeper = sleeper
+        # 모든 로켓이 같은 단계를 함께 진행하므로 dt 가 모두 같아야 시간이 맞는다
+        dts = set(rocket.dt for rocket in rockets)
+        if len(dts) > 1:
+            raise ValueError("all rockets must share one dt, got " + str(sorted(dts)))
+        self.dt = dts.pop() if dts else 0.1
+        self.steps = 0
+        self.frames = 0
+        self.maxLate = 0.0  # realtime 에서 예정 시각보다 가장 많이 늦은 시간 [s]
+
+    # 원래 rocketSim 메인 반복문과 같은 순서로 모든 로켓을 한 단계 진행한다.
+    # 반환값: 아직 날고 있는 로켓이 있는지
+    def step(self):
+        self.steps += 1
+        t = self.steps * self.dt
+        running = False
+        for rocket in self.rockets:
+            if rocket.status == 'simulation end':
+                continue
+            if rocket.y < 0:
+                rocket.set_finalDistance()
+            else:
+                rocket.moveRocket()
+                running = True
+                if self.telemetry is not None:
+                    self.telemetry.record(t, rocket)
+        return running
+
+    def _render(self):
+        if self.renderer is not None:
+            self.renderer(self.steps * self.dt, self.rockets)
+            self.frames += 1
+
+    # 시각 deadline 까지 기다린다. 이미 지났으면 늦은 시간을 기록한다.
+    def _waitUntil(self, deadline):
+        now = self.clock()
+        if deadline > now:
+            self.sleeper(deadline - now)
+        else:
+            self.maxLate = max(self.maxLate, now - deadline)
+
+    # 모든 로켓이 끝날 때까지 돌린다. 반환값: (시뮬레이션 시간, 단계 수, 실제 걸린 시간)
+    def run(self, maxSteps=10 ** 8):
+        start = self.clock()
+        stepSeconds = self.dt / self.timeScale
+        running = True
+        if self.mode == 'fast':
+            while running and self.steps < maxSteps:
+                running = self.step()
+        elif self.mode == 'realtime':
+            while running and self.steps < maxSteps:
+                running = self.step()
+                self._waitUntil(start + self.steps * stepSeconds)
+                self._render()
+        else:
+            frameSeconds = 1.0 / self.renderHz
+            frame = 0
+            while running and self.steps < maxSteps:
+                frame += 1
+                # 이 프레임의 시각까지 계산해야 하는 단계를 모두 계산하고 한번 그린다
+                target = int(frame * frameSeconds / stepSeconds)
+                while running and self.steps < min(target, maxSteps):
+                    running = self.step()
+                self._waitUntil(start + frame * frameSeconds)
+                self._render()
+        if self.mode == 'fast':
+            self._render()
+        if self.telemetry is not None:
+            self.telemetry.flush()
+        return self.steps * self.dt, self.steps, self.clock() - start
+
+
+def printResults(rockets):
+    print('---시뮬레이션 결과----------------------------')
+    print('---비행시간---')
+    for rocket in rockets:
+        print(rocket.name, '로켓의 비행시간=', rocket.x / rocket.vx)
+    print('---이동거리---')
+    for rocket in rockets:
+        print(rocket.name, '로켓의 이동거리=', round(rocket.final_Distance, 2))
+
+
+if __name__ == "__main__":
+    configFile = sys.argv[1] if len(sys.argv) > 1 else 'rocketLaunch.json'
+    mode = sys.argv[2] if len(sys.argv) > 2 else 'fast'
+    telemetryFile = sys.argv[3] if len(sys.argv) > 3 else None
+
+    rockets = loadLaunchConfig(configFile)
+    renderer = None if mode == 'fast' else printRenderer
+    with TelemetryBuffer(telemetryFile) as telemetry:
+        scheduler = SimulationScheduler(rockets, mode, renderer, telemetry)
+        simSeconds, steps, wallSeconds = scheduler.run()
+    print('mode={} simulated={:.2f}s steps={:d} wall={:.4f}s max late={:.4f}s'.format(
+        mode, simSeconds, steps, wallSeconds, scheduler.maxLate))
+    printResults(rockets)
@@ -2,8 +2,8 @@
 by : chasujin, dsbaek
 '''
 
+import sys
 import math
-from time import sleep
 
 
 class rocketSim(object):
@@ -30,7 +30,11 @@ class rocketSim(object):
     return self.name+"="+"("+str(round(self.x,2))+","+str(round(self.y,2))+")"
 
   def inputAngle(self):
-    self.angle= float(input(self.name+'로켓의 발사 각도[deg]를 입력하세요:')) 
+    self.setAngle(float(input(self.name+'로켓의 발사 각도[deg]를 입력하세요:')))
+
+  # 설정 파일 등에서 발사 각도를 바로 정할 때
+  def setAngle(self, angle):
+    self.angle = angle
     self.calcVxVy_TimeZero()
     
 
@@ -43,7 +47,7 @@ class rocketSim(object):
     self.vy = self.vy +  self.g*self.dt
     self.x  = self.x  + self.vx*self.dt  
     self.y  = self.y  + self.vy*self.dt   
-    sleep(self.dt)
+    # 실제 시간에 맞춰 기다리는 것은 rocketScheduler 가 한다 (sleep 없음)
 
   def set_finalDistance(self):
     self.final_Distance = self.x
@@ -51,40 +55,24 @@ class rocketSim(object):
 
     
 
-rocketA = rocketSim(-9.8,0.1, 10, '대한민국')
-rocketB = rocketSim(-9.8,0.1, 10, '미국')
-
-
-rocketA.inputAngle()
-rocketB.inputAngle()
+if __name__ == "__main__":
+  from rocketScheduler import SimulationScheduler, loadLaunchConfig, printRenderer, printResults
 
-print('Start simulation')
-while rocketA.status != 'simulation end'  or rocketB.status != 'simulation end':
-
-  if rocketA.y <0:
-    rocketA.set_finalDistance()
+  # python rocketSim.py [발사 설정 파일(JSON/CSV)] : 설정 파일이 없으면 발사 각도를 입력받는다
+  if len(sys.argv) > 1:
+    rockets = loadLaunchConfig(sys.argv[1])
   else:
-    rocketA.moveRocket()
-    print(rocketA)
-
-  if rocketB.y <0:
-    rocketB.set_finalDistance()
-  else:
-    rocketB.moveRocket()
-    print(rocketB)
-
-
-print('End simulation')
-
+    rocketA = rocketSim(-9.8,0.1, 10, '대한민국')
+    rocketB = rocketSim(-9.8,0.1, 10, '미국')
+    rocketA.inputAngle()
+    rocketB.inputAngle()
+    rockets = [rocketA, rocketB]
 
-print('---시뮬레이션 결과----------------------------')
-print('---비행시간---')
-print(rocketA.name,'로켓의 비행시간=', rocketA.x/rocketA.vx)
-print(rocketB.name,'로켓의 비행시간=', rocketB.x/rocketB.vx)
+  print('Start simulation')
+  SimulationScheduler(rockets, 'realtime', printRenderer).run()
+  print('End simulation')
 
-print('---이동거리---')
-print(rocketA.name,'로켓의 이동거리=', round(rocketA.final_Distance,1))
-print(rocketB.name,'로켓의 이동거리=', round(rocketB.final_Distance,2))
+  printResults(rockets)
 
 
 
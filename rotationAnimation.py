@@ -0,0 +1,203 @@
+# SenseHat 8x8 LED 에 도는 무늬를 보여주는 애니메이션 파이프라인입니다.
+# LinearAlgebraRotationMatrix.py 는 각도 th 마다 cos/sin 과 M 을 새로 계산합니다. 여기서는
+#   - 모든 각도(기본: 0 ~ 359 도, 1 도 간격)의 "출력 픽셀 <- 원본 픽셀 번호" 표(RotationTable)를
+#     rotationEngine 으로 한번만 만들고
+#   - 재생할 때는 표의 한 줄로 픽셀을 모으기(gather)만 하므로 프레임마다 계산량이 같고 (수 마이크로초)
+#   - 프레임은 generator 로 만들어 sink(화면 역할) 로 보냅니다. sink 는 show(frame), close() 만 있으면
+#     되므로 SenseHat 이 없어도 파일이나 메모리 버퍼에 쓰는 BufferSink / FileSink 로 대신할 수 있습니다.
+#   - 표는 원시 바이너리 + json 파일로 저장해 두어 다음 실행에서는 읽기만 합니다.
+#
+#   table = loadTable(8, 8)
+#   play(table, toImage(figIn), FileSink('frames.rgb'), fps=30)
+
+import io
+import os
+import sys
+import json
+from time import perf_counter, sleep
+
+import numpy as np
+
+from rotationEngine import RotationMap, toImage
+
+TABLE_VERSION = 1
+
+
+class RotationTable(object):
+
+    # angles 의 각도마다 (H*W,) 원본 픽셀 번호. 원본 밖은 번호 H*W (배경 픽셀)
+    def __init__(self, height, width, angles, index):
+        self.height = height
+        self.width = width
+        self.angles = list(angles)
+        self.index = index
+
+    @classmethod
+    def build(cls, height, width, angles=range(360)):
+        angles = list(angles)
+        dtype = np.uint8 if height * width < 256 else np.uint16 if height * width < 65536 else np.uint32
+        index = np.empty((len(angles), height * width), dtype=dtype)
+        for k, th in enumerate(angles):
+            rotation = RotationMap(th, height, width, 'nearest')
+            row = rotation.index.copy()
+            row[rotation.outside] = height * width
+            index[k] = row
+        return cls(height, width, angles, index)
+
+    # 이미지 뒤에 배경 픽셀 하나를 붙인 (H*W + 1, 3) 배열. 재생 전에 한번만 만든다.
+    def prepare(self, image, background=(0, 0, 0)):
+        pixels = np.empty((self.height * self.width + 1, 3), dtype=np.uint8)
+        pixels[:-1] = np.asarray(image, dtype=np.uint8).reshape(-1, 3)
+        pixels[-1] = background
+        return pixels
+
+    # k 번째 각도로 돌린 (H, W, 3) 프레임
+    def frame(self, pixels, k, out=None):
+        if out is None:
+            out = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        np.take(pixels, self.index[k], axis=0, out=out.reshape(-1, 3))
+        return out
+
+
+# 표 파일 이름: 크기와 각도 수가 들어간다. 원시 바이너리 + .json (모양, dtype, 각도)
+def tablePath(height, width, numAngles, directory='.'):
+    return os.path.join(directory, 'rotation_{}x{}_{}.table'.format(height, width, numAngles))
+
+
+# 두 파일 모두 임시 이름에 다 쓴 다음 os.replace 로 바꾼다 (.json 을 마지막에).
+# 도중에 죽어도 덜 쓴 표를 맞는 표로 읽는 일이 없다 (K_mean_loader.loadScoresCached 와 같은 방법).
+def saveTable(table, filename):
+    tableTemp = filename + '.tmp'
+    infoTemp = filename + '.json.tmp'
+    try:
+        table.index.tofile(tableTemp)
+        with open(infoTemp, 'w') as infoFile:
+            json.dump({'version': TABLE_VERSION, 'height': table.height, 'width': table.width,
+                       'angles': table.angles, 'dtype': table.index.dtype.str,
+                       'shape': list(table.index.shape)}, infoFile)
+        os.replace(tableTemp, filename)
+        os.replace(infoTemp, filename + '.json')
+    finally:
+        for temp in (tableTemp, infoTemp):
+            if os.path.exists(temp):
+                os.remove(temp)
+
+
+# 저장된 표가 있고 내용이 맞으면 읽고, 없으면 만들어서 저장한다.
+def loadTable(height, width, angles=range(360), directory='.'):
+    angles = list(angles)
+    filename = tablePath(height, width, len(angles), directory)
+    try:
+        with open(filename + '.json', 'r') as infoFile:
+            info = json.load(infoFile)
+        if (info.get('version') == TABLE_VERSION and info['height'] == height
+                and info['width'] == width and info['angles'] == angles):
+            index = np.fromfile(filename, dtype=np.dtype(info['dtype'])).reshape(info['shape'])
+            return RotationTable(height, width, angles, index)
+    except (OSError, ValueError, KeyError):
+        pass
+    table = RotationTable.build(height, width, angles)
+    saveTable(table, filename)
+    return table
+
+
+# k = start, start + step, ... 각도의 프레임을 loops 바퀴 만든다. 같은 out 배열을 다시 쓰므로
+# 프레임을 보관하려면 sink 에서 복사해야 한다.
+def frames(table, image, step=1, loops=1, background=(0, 0, 0)):
+    pixels = table.prepare(image, background)
+    out = np.empty((table.height, table.width, 3), dtype=np.uint8)
+    for loop in range(loops):
+        for k in range(0, len(table.angles), step):
+            yield table.frame(pixels, k, out)
+
+
+# 프레임을 메모리 버퍼(BytesIO)에 RGB 바이트로 이어 쓴다.
+class BufferSink(object):
+
+    def __init__(self, buffer=None):
+        self.buffer = io.BytesIO() if buffer is None else buffer
+        self.count = 0
+
+    def show(self, frame):
+        self.buffer.write(frame.tobytes())
+        self.count += 1
+
+    def close(self):
+        pass
+
+
+# 프레임을 파일에 RGB 바이트로 이어 쓴다 (프레임 하나 = H * W * 3 바이트). 쓰기는 파일 버퍼가 모아서 한다.
+class FileSink(BufferSink):
+
+    def __init__(self, filename):
+        BufferSink.__init__(self, open(filename, 'wb'))
+
+    def close(self):
+        self.buffer.close()
+
+
+# 진짜 SenseHat LED (라즈베리파이에서만)
+class SenseHatSink(object):
+
+    def __init__(self):
+        from sense_hat import SenseHat
+
+        self.sense = SenseHat()
+        self.count = 0
+
+    def show(self, frame):
+        self.sense.set_pixels([tuple(pixel) for pixel in frame.reshape(-1, 3).tolist()])
+        self.count += 1
+
+    def close(self):
+        self.sense.clear()
+
+
+# 프레임을 sink 로 보낸다. fps 를 주면 시작 시각 기준으로 프레임 k 를 k / fps 초에 보낸다.
+# 반환값: (프레임 수, 프레임당 평균 계산 시간 [s], 최대 계산 시간 [s]) - 기다린 시간은 빼고
+def play(table, image, sink, fps=None, step=1, loops=1):
+    count = 0
+    busy = 0.0
+    worst = 0.0
+    start = perf_counter()
+    began = start
+    try:
+        for frame in frames(table, image, step, loops):
+            sink.show(frame)
+            now = perf_counter()
+            busy += now - began
+            worst = max(worst, now - began)
+            count += 1
+            if fps is not None:
+                deadline = start + count / fps
+                if deadline > now:
+                    sleep(deadline - now)
+            began = perf_counter()
+    finally:
+        sink.close()
+    return count, busy / max(count, 1), worst
+
+
+# 표를 만드는 시간, 파일에서 읽는 시간, 프레임당 시간을 출력한다.
+def benchmark(directory='.'):
+    b = (0, 0, 0)
+    r = (100, 0, 0)
+    figIn = [[r if 2 <= i <= 4 and 2 <= j <= 5 else b for j in range(8)] for i in range(8)]
+    image = toImage(figIn)
+
+    start = perf_counter()
+    table = RotationTable.build(8, 8)
+    print('build table   {:.4f}s  ({} bytes)'.format(perf_counter() - start, table.index.nbytes))
+    filename = tablePath(8, 8, 360, directory)
+    saveTable(table, filename)
+    start = perf_counter()
+    loaded = loadTable(8, 8, directory=directory)
+    print('load table    {:.6f}s  same={}'.format(perf_counter() - start,
+                                                  np.array_equal(loaded.index, table.index)))
+
+    count, average, worst = play(loaded, image, BufferSink(), loops=100)
+    print('frames={:d}  {:.2f}us/frame  worst {:.2f}us'.format(count, average * 1e6, worst * 1e6))
+
+
+if __name__ == "__main__":
+    benchmark(sys.argv[1] if len(sys.argv) > 1 else '.')
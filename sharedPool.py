@@ -0,0 +1,39 @@
+# 여러 작업 프로세스가 큰 numpy 배열을 복사하지 않고 같이 보도록 하는 도우미입니다.
+# 부모 프로세스가 multiprocessing.RawArray 를 만들어 Pool 의 initializer 로 한번만 넘기면,
+# 작업 프로세스마다 attach 가 그 메모리를 가리키는 numpy view 를 shared[이름] 에 넣어 둡니다.
+#
+#   raw, data = sharedArray('d', np.float64, (n, d))      # 부모: 공유 배열과 그 view
+#   pool = sharedPool(workers, {'data': (raw, data)})
+#   shared['data']                                          # 작업 프로세스 안에서
+
+from multiprocessing import Pool, RawArray
+
+import numpy as np
+
+# 작업 프로세스 안에서 이름 -> 공유 배열을 가리키는 numpy view
+shared = {}
+
+
+# typecode 는 RawArray 의 형식('d', 'q', 'b' ...), dtype 은 numpy 에서 볼 형식.
+# 크기가 0 이어도 RawArray 는 1 칸 이상 만든다. 반환값: (RawArray, shape 모양의 view)
+def sharedArray(typecode, dtype, shape):
+    size = int(np.prod(shape))
+    raw = RawArray(typecode, max(1, size))
+    return raw, _view(raw, dtype, shape)
+
+
+def _view(raw, dtype, shape):
+    return np.frombuffer(raw, dtype=dtype)[:int(np.prod(shape))].reshape(shape)
+
+
+# Pool 의 initializer. arrays 는 {이름: (RawArray, dtype, shape)}
+def attach(arrays):
+    for name, (raw, dtype, shape) in arrays.items():
+        shared[name] = _view(raw, dtype, shape)
+
+
+# arrays({이름: (RawArray, 그 view)})를 shared 로 붙인 작업 프로세스 workers 개의 Pool.
+# 작업 프로세스에는 RawArray 와 dtype, shape 만 넘어간다 (배열 내용은 복사하지 않음).
+def sharedPool(workers, arrays):
+    specs = dict((name, (raw, view.dtype, view.shape)) for name, (raw, view) in arrays.items())
+    return Pool(workers, initializer=attach, initargs=(specs,))
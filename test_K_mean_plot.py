@@ -0,0 +1,22 @@
+# K_mean_plot 의 그리기 프로세스를 실제로 띄워서 그림 한 장을 저장하는지 확인합니다.
+# (저장소 폴더에서 실행하므로 같은 폴더의 파일이 표준 라이브러리를 가리면 여기서 깨집니다)
+
+import os
+
+import numpy as np
+
+from K_mean_plot import FrameRenderer
+
+
+def test_frameRendererSavesFrame(tmp_path):
+    rng = np.random.default_rng(0)
+    data = rng.random((50, 2))
+    centroids = data[:3]
+    labels = rng.integers(0, 3, size=50)
+
+    renderer = FrameRenderer(data, str(tmp_path), maxPending=4)
+    renderer.submit(1, labels, centroids)
+    renderer.close(timeout=60.0)
+
+    assert renderer.dropped == 0
+    assert os.listdir(str(tmp_path)) == ['pass_001.png']
@@ -0,0 +1,27 @@
+# myPlanet 의 Planet 계산 값과, 중력 계산을 준비한 뒤에 고친 값이 다음 단계에 쓰이는지 확인합니다.
+
+import math
+
+from myPlanet import Planet, SolarSystem, Sun
+
+
+def test_planetGeometry():
+    p = Planet("Earth", 2.0, 100.0, 0.3, "blue")
+    assert p.getSurfaceArea() == 4 * math.pi * 4.0
+    assert p.getVolume() == 4 / 3 * math.pi * 8.0
+    assert p.getDensity() == 100.0 / p.getVolume()
+
+
+def test_setterAfterSetupEngine():
+    ss = SolarSystem(2, 2)
+    ss.addSun(Sun("Sun", 5000, 10, 5800))
+    p = Planet("Mercury", 19.5, 1000, 0.25, "sky blue", 0, 2.0)
+    ss.addPlanet(p)
+    ss.setupEngine(G=0.1, dt=0.001, planetsAttract=False)
+    ss.movePlanets(10)
+    p.moveTo(0.5, 0.0)
+    p.setXVel(0.0)
+    p.setYVel(1.414)
+    ss.movePlanets(1)
+    assert abs(p.getXPos() - 0.5) < 1e-3
+    assert abs(p.getYPos() - 0.001414) < 1e-5
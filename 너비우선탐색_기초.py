@@ -11,23 +11,19 @@ friends['클레오'] = ['닉스','조니']
 friends['닉스'] = [ ]
 friends['조니'] = [ ]
 
-checkperson = [ ]
-
-def addperson(key) : 
-    for data in friends[key] :
-        checkperson.append(data)
-
-person = 'me'
-addperson(person)
-
-while True :
-    person = checkperson.pop(0)
-    if person[-1] == '톰' :
-       print('찾았음')
-       break
-    else :
-       addperson(person)
-       
+from graphStore import GraphStore
+from friendSearch import shortestPath
+
+# 이름의 마지막 글자가 '톰' 인 사람을 너비우선으로 찾고, 거기까지의 경로도 구한다.
+def isSoldier(name) :
+    return name[-1] == '톰'
+
+store = GraphStore.fromFriendDict(friends)
+path, visited = shortestPath(store, 'me', store.nameMatches(isSoldier))
+person = path[-1]
+print('찾았음')
+print(' -> '.join(path), '(거리', len(path) - 1, ')')
+
 print(f'{person}가 군인입니다')
 
    